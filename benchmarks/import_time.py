@@ -0,0 +1,59 @@
+import statistics
+import subprocess
+import sys
+
+# Cumulative import time budgets in milliseconds, the startup an interactive `pympeg` or `pyprobe` call pays before
+# ffmpeg or ffprobe is even started. These sit well above the measured times to absorb noise, not regressions.
+BUDGETS = {
+    'ffmpeg_wrappers.cli.pympeg': 60,
+    'ffmpeg_wrappers.cli.pyprobe': 300,
+}
+
+
+def measure(module: str) -> tuple[float, list[tuple[float, str]]]:
+    result = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', f'import {module}'),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, text=True
+    )
+
+    # Imports are reported after their children, so the direct children of `module` are the second level entries
+    # since the previous top level one. Deeper entries are already part of their parent's cumulative time.
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0 and name.strip() == module:
+            return int(cumulative) / 1000, sorted(children, reverse=True)
+        elif depth == 0:
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative) / 1000, name.strip()))
+
+    raise RuntimeError(f'{module} was not imported')
+
+
+def main(runs: int):
+    failed = False
+
+    for module, budget in BUDGETS.items():
+        # The first run also writes bytecode caches, it is not representative of an installed package.
+        measure(module)
+        results = [measure(module) for _ in range(runs)]
+        total = statistics.median(total for total, _ in results)
+        _, imports = min(results)
+
+        status = 'ok' if total <= budget else 'OVER BUDGET'
+        print(f'{module:32} {total:7.1f}ms  budget {budget}ms  {status}')
+        for cumulative, name in imports[:5]:
+            print(f'    {name:28} {cumulative:7.1f}ms')
+
+        failed |= total > budget
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 9)
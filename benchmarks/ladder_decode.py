@@ -0,0 +1,51 @@
+import resource
+import tempfile
+import time
+
+from pathlib import Path
+
+from ffmpeg_wrappers.core.avfile import AvFile
+from ffmpeg_wrappers.core.ffmpeg import run
+from ffmpeg_wrappers.tools.ladder import Rendition, encode_ladder, ladder
+
+heights = (1080, 720, 480)
+
+
+def measure(name, function):
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    print(f'{name:24} {elapsed:7.2f}s wall {cpu:7.2f}s cpu')
+
+
+def main(source: Path):
+    input = AvFile.from_path(source)
+
+    with tempfile.TemporaryDirectory() as directory:
+        renditions = [
+            Rendition(Path(directory, f'{height}.mkv'), ('libx264', {'preset': 'veryfast'}), height=height)
+            for height in heights
+        ]
+
+        # What the ladder replaces: one ffmpeg per rendition, each decoding the whole source again.
+        def separate():
+            for rendition in renditions:
+                for _ in run(['-y', *ladder(input, [rendition])], loglevel='error', interval=1):
+                    pass
+
+        def shared():
+            for _ in encode_ladder(input, renditions, loglevel='error', interval=1):
+                pass
+
+        print(f'{source.name}, {len(renditions)} renditions')
+        measure('one ffmpeg per output', separate)
+        measure('single decode ladder', shared)
+
+
+if __name__ == '__main__':
+    import sys
+
+    main(Path(sys.argv[1]))
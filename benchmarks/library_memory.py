@@ -0,0 +1,124 @@
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from pathlib import Path
+
+from ffmpeg_wrappers.core.avfile import AvFile, VideoStream
+from ffmpeg_wrappers.core.library import AvLibrary
+
+disposition = {
+    'default': 1, 'dub': 0, 'original': 0, 'comment': 0, 'lyrics': 0, 'karaoke': 0, 'forced': 0,
+    'hearing_impaired': 0, 'visual_impaired': 0, 'clean_effects': 0, 'attached_pic': 0, 'timed_thumbnail': 0,
+    'captions': 0, 'descriptions': 0, 'metadata': 0, 'dependent': 0, 'still_image': 0,
+}
+
+
+def probe(random: random.Random, i: int) -> dict:
+    codec, pix_fmt = random.choice((('h264', 'yuv420p'), ('hevc', 'yuv420p10le'), ('hevc', 'yuv420p'), ('av1', 'yuv420p10le')))
+    width, height = random.choice(((1280, 720), (1920, 1080), (3840, 2160)))
+    common = {
+        'codec_tag': '0x0000', 'codec_tag_string': '[0][0][0][0]', 'time_base': '1/1000', 'start_pts': 0,
+        'start_time': '0.000000', 'extradata_size': 42, 'disposition': disposition,
+    }
+
+    streams = [{
+        **common, 'index': 0, 'codec_type': 'video', 'codec_name': codec, 'codec_long_name': f'{codec} long name',
+        'r_frame_rate': '24000/1001', 'avg_frame_rate': '24000/1001', 'width': width, 'height': height,
+        'pix_fmt': pix_fmt, 'profile': 'Main', 'level': 150, 'refs': 1, 'has_b_frames': 2, 'field_order': 'progressive',
+        'tags': {'BPS': str(random.randrange(10 ** 6, 10 ** 7)), 'DURATION': '00:23:40.045000000', 'ENCODER': 'Lavc'},
+    }]
+    for index, language in enumerate(random.sample(('jpn', 'eng', 'fre', 'ger'), random.randint(1, 3)), 1):
+        streams.append({
+            **common, 'index': index, 'codec_type': 'audio', 'codec_name': 'aac', 'codec_long_name': 'AAC',
+            'r_frame_rate': '0/0', 'avg_frame_rate': '0/0', 'sample_fmt': 'fltp', 'sample_rate': '48000', 'channels': 2,
+            'channel_layout': 'stereo', 'bits_per_sample': 0, 'profile': 'LC',
+            'tags': {'language': language, 'BPS': str(random.randrange(10 ** 5, 10 ** 6)), 'DURATION': '00:23:40.045000000'},
+        })
+    for index in range(len(streams), len(streams) + random.randint(0, 2)):
+        streams.append({
+            **common, 'index': index, 'codec_type': 'subtitle', 'codec_name': 'ass', 'codec_long_name': 'ASS',
+            'r_frame_rate': '0/0', 'avg_frame_rate': '0/0', 'tags': {'language': 'eng', 'title': 'Full Subtitles'},
+        })
+
+    return {
+        'format': {
+            'format_name': 'matroska,webm', 'format_long_name': 'Matroska / WebM', 'start_time': '0.000000',
+            'duration': f'{random.uniform(60, 3600):.6f}', 'size': str(random.randrange(10 ** 8, 10 ** 10)),
+            'bit_rate': str(random.randrange(10 ** 6, 10 ** 7)), 'tags': {'title': f'Episode {i}', 'ENCODER': 'Lavf'},
+        },
+        'chapters': [],
+        'streams': streams,
+    }
+
+
+def measure(build):
+    # Everything `build` leaves behind once collected: objects it only used along the way are freed first, so strings
+    # shared with them are counted against what is kept.
+    gc.collect()
+    objects = len(gc.get_objects())
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, len(gc.get_objects()) - objects
+
+
+def main(files):
+    # Kept as ffprobe output, every build decodes its own strings the way a real probe would.
+    outputs = [json.dumps(probe(random.Random(i), i)) for i in range(files)]
+    elapsed = {}
+
+    def objects():
+        start = time.perf_counter()
+        avfiles = [AvFile.from_dict(Path(f'/library/{i:06}.mkv'), json.loads(output))
+                   for i, output in enumerate(outputs)]
+        elapsed['objects'] = time.perf_counter() - start
+        return avfiles
+
+    def library():
+        avfiles = objects()
+        start = time.perf_counter()
+        library = AvLibrary(avfiles)
+        elapsed['library'] = time.perf_counter() - start
+        return library
+
+    avfiles, objects_size, objects_count = measure(objects)
+    objects_time = elapsed['objects']
+    del avfiles
+    library, library_size, library_count = measure(library)
+
+    print(f'{"AvFile objects":16} {objects_size / files:10,.0f} bytes/file {objects_count:12,} objects  '
+          f'decoded in {objects_time:.2f}s')
+    print(f'{"AvLibrary":16} {library_size / files:10,.0f} bytes/file {library_count:12,} objects  '
+          f'built in {elapsed["library"]:.2f}s')
+
+    conditions = dict(codec_name='hevc', pix_fmt=lambda fmt: '10' in fmt, width=(1921, None))
+    start = time.perf_counter()
+    rows = library.where(VideoStream, **conditions)
+    elapsed = time.perf_counter() - start
+    print(f'HEVC 10-bit wider than 1920: {len(rows):,} streams in {elapsed * 1000:.1f}ms')
+
+    expected = [row for row in range(library.stream_count) if isinstance(stream := library.stream(row), VideoStream)
+                and stream.codec_name[0] == 'hevc' and '10' in stream.pix_fmt and stream.width >= 1921]
+    assert list(rows) == expected
+
+    # Without a kind, audio and subtitle rows have no height: they match neither a range nor a callable, only `None`.
+    heights = [getattr(library.stream(row), 'height', None) for row in range(library.stream_count)]
+    def rows(test):
+        return [row for row, height in enumerate(heights) if test(height)]
+
+    assert list(library.where(height=(None, 720))) == rows(lambda height: height is not None and height <= 720)
+    assert list(library.where(height=lambda height: height < 1000)) == \
+           rows(lambda height: height is not None and height < 1000)
+    assert list(library.where(height=None)) == rows(lambda height: height is None)
+    assert library[0] == AvFile.from_dict(Path('/library/000000.mkv'), json.loads(outputs[0]))
+
+
+if __name__ == '__main__':
+    import sys
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
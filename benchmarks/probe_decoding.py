@@ -0,0 +1,62 @@
+import json
+import random
+import subprocess
+import time
+
+from pathlib import Path
+
+from ffmpeg_wrappers.core.avfile import AvFile, json_loads
+
+
+def record(media: list[Path], corpus: Path):
+    corpus.mkdir(parents=True, exist_ok=True)
+    for i, path in enumerate(media):
+        ffprobe = subprocess.run(
+            ('ffprobe', '-print_format', 'json', '-show_format', '-show_chapters', '-show_streams', str(path)),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True
+        )
+        if ffprobe.returncode == 0:
+            (corpus / f'{i:06}.json').write_bytes(ffprobe.stdout)
+
+
+def load(corpus: Path | None, files: int) -> list[bytes]:
+    if corpus is not None:
+        return [path.read_bytes() for path in sorted(corpus.glob('*.json'))]
+
+    # Without a recorded corpus, fall back to the synthetic library from the memory benchmark.
+    from library_memory import probe
+    return [json.dumps(probe(random.Random(i), i)).encode('UTF-8') for i in range(files)]
+
+
+def measure(name, outputs, decode):
+    start = time.perf_counter()
+    for output in outputs:
+        decode(output)
+    elapsed = time.perf_counter() - start
+    print(f'{name:28} {len(outputs) / elapsed:10,.0f} files/s')
+
+
+def main(corpus: Path | None, files: int):
+    outputs = load(corpus, files)
+    documents = [json_loads(output) for output in outputs]
+    path = Path('/library/file.mkv')
+
+    print(f'{len(outputs):,} ffprobe outputs, JSON backend: {json_loads.__module__}')
+    measure('json.loads', outputs, json.loads)
+    measure('json_loads', outputs, json_loads)
+    measure('AvFile.from_dict', documents, lambda document: AvFile.from_dict(path, document))
+    measure('decode and construct', outputs, lambda output: AvFile.from_dict(path, json_loads(output)))
+
+
+if __name__ == '__main__':
+    import sys
+
+    match sys.argv[1:]:
+        case ['record', corpus, *media]:
+            record([Path(path) for path in media], Path(corpus))
+        case [corpus] if not corpus.isdigit():
+            main(Path(corpus), 0)
+        case [files]:
+            main(None, int(files))
+        case _:
+            main(None, 5_000)
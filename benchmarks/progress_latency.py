@@ -0,0 +1,43 @@
+import asyncio
+import statistics
+import time
+
+from ffmpeg_wrappers.core.ffmpeg import run, arun
+
+args = ['-y', '-f', 'lavfi', '-i', 'testsrc=duration=1:size=320x240:rate=30', '-f', 'null', '-']
+
+
+def first_progress(transport):
+    start = time.perf_counter()
+    latency = None
+    for packet in run(args, loglevel='error', interval=0.05, transport=transport):
+        if latency is None and 'frame' in packet:
+            latency = time.perf_counter() - start
+    return latency
+
+
+async def first_progress_async(transport):
+    start = time.perf_counter()
+    latency = None
+    async for packet in arun(args, loglevel='error', interval=0.05, transport=transport):
+        if latency is None and 'frame' in packet:
+            latency = time.perf_counter() - start
+    return latency
+
+
+def main(repeat):
+    for transport in ('tcp', 'unix', 'pipe'):
+        for name, measure in (('run', first_progress), ('arun', lambda t: asyncio.run(first_progress_async(t)))):
+            samples = [latency for latency in (measure(transport) for _ in range(repeat)) if latency is not None]
+            if samples:
+                print(f'{name:4} {transport:4} spawn to first progress: '
+                      f'median {statistics.median(samples) * 1000:7.2f}ms, '
+                      f'min {min(samples) * 1000:7.2f}ms ({len(samples)}/{repeat} runs)')
+            else:
+                print(f'{name:4} {transport:4} no progress received')
+
+
+if __name__ == '__main__':
+    import sys
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
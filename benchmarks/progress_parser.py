@@ -0,0 +1,78 @@
+import re
+import time
+
+from ffmpeg_wrappers.core.ffmpeg.events import ProgressParser
+
+block = (
+    'frame=1234\nfps=48.00\nstream_0_0_q=28.0\nbitrate=1234.5kbits/s\ntotal_size=10485760\n'
+    'out_time_us=51200000\nout_time_ms=51200000\nout_time=00:00:51.200000\ndup_frames=0\ndrop_frames=0\n'
+    'speed=2.01x\nprogress=continue\n'
+).encode('UTF-8')
+
+legacy_progress = re.compile(r'(.+)=(.+)', re.MULTILINE)
+
+
+# The dict based implementation run() used before ProgressParser, kept as the baseline.
+def legacy(chunk: bytes):
+    line = chunk.decode('UTF-8')
+    if line:
+        packet = {k: v for k, v in legacy_progress.findall(line)}
+        match packet:
+            case {
+                'frame': frame, 'fps': fps, 'bitrate': bitrate, 'total_size': size, 'out_time_us': us,
+                'out_time_ms': ms, 'out_time': _, 'dup_frames': duplicated, 'drop_frames': dropped, 'speed': speed,
+                'progress': progress, **streams_qualities
+            }:
+                return {
+                    'frame': int(frame),
+                    'fps': float(fps),
+                    'bitrate': int(float(bitrate[:-7]) * 1000) if bitrate != 'N/A' else None,
+                    'total_size': int(size) if size != 'N/A' else None,
+                    'out_time_us': int(us),
+                    'out_time_ms': int(ms) // 1000,
+                    'dup_frames': int(duplicated),
+                    'drop_frames': int(dropped),
+                    'speed': float(speed[:-1]) if speed != 'N/A' else None,
+                    'progress': progress,
+                    **{stream: float(quality) for stream, quality in streams_qualities.items()}
+                }
+
+            case _:
+                return {'error': f'Unknown progress info.', 'packet': packet}
+
+
+def measure(name, blocks, chunks, consume):
+    start = time.perf_counter()
+    events = consume(chunks)
+    elapsed = time.perf_counter() - start
+    print(f'{name:32} {blocks / elapsed:12,.0f} blocks/s, {events:7} events ({blocks - events} lost or broken)')
+
+
+def main(blocks):
+    whole = [block] * blocks
+    stream = block * blocks
+    split = [stream[i:i + 1024] for i in range(0, len(stream), 1024)]
+
+    def legacy_consume(chunks):
+        events = 0
+        for chunk in chunks:
+            try:
+                events += 'frame' in legacy(chunk)
+            except ValueError:
+                pass
+        return events
+
+    def parser_consume(chunks):
+        parser = ProgressParser()
+        return sum(len(parser.feed(chunk)) for chunk in chunks)
+
+    measure('legacy, one block per read', blocks, whole, legacy_consume)
+    measure('parser, one block per read', blocks, whole, parser_consume)
+    measure('legacy, 1024 byte reads', blocks, split, legacy_consume)
+    measure('parser, 1024 byte reads', blocks, split, parser_consume)
+
+
+if __name__ == '__main__':
+    import sys
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
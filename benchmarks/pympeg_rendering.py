@@ -0,0 +1,82 @@
+import io
+import os
+import random
+import time
+
+from rich.console import Console
+
+from ffmpeg_wrappers.cli.pympeg import PlainRenderer, RichRenderer, render
+from ffmpeg_wrappers.core.ffmpeg.events import LogEvent, ProgressEvent
+
+styles = {'unknown': '', 'info': '', 'verbose': '', 'warning': '[yellow1]', 'error': '[bright_red]'}
+
+
+# Roughly what `-loglevel verbose` prints while decoding a damaged stream: mostly per-frame chatter from a few senders.
+def events(lines: int, seed: int = 0) -> list:
+    generator = random.Random(seed)
+    senders = (None, 'h264 @ 0x55d0c0a1b2c0', 'libx264 @ 0x55d0c0a1f840', 'vist#0:0/h264 @ 0x55d0c09e7a00')
+    messages = (
+        'Invalid NAL unit size (1234 > 567).', 'error while decoding MB 12 34, bytestream -5',
+        'concealing 1620 DC, 1620 AC, 1620 MV errors in P frame', 'frame I:12    Avg QP:20.15  size: 42017',
+        'mb P  I16..4: 11.5%  52.1% 10.4%  P16..4: 14.2%  6.1%  2.3%  0.0%  0.0%    skip: 3.4%',
+        'Stream #0:0 -> #0:0 (h264 (native) -> h264 (libx264))', '[vist#0:0/h264] Decoder thread received EOF',
+    )
+    result = []
+    for i in range(lines):
+        level = generator.choices(('verbose', 'info', 'warning', 'error'), (70, 20, 8, 2))[0]
+        result.append(LogEvent(level, generator.choice(messages), generator.choice(senders)))
+        if i % 1000 == 0:
+            result.append(ProgressEvent(
+                frame=i, fps=48.0, bitrate=1234500, total_size=i * 1024, out_time_us=i * 40000,
+                out_time_ms=i * 40, dup_frames=0, drop_frames=0, speed=2.01, progress='continue', qualities={}
+            ))
+    return result
+
+
+# The per packet markup printing pympeg did before the renderers, kept as the baseline.
+def legacy(stream: list, console: Console):
+    for packet in stream:
+        match packet:
+            case {'level': level, 'message': message, 'sender': sender}:
+                console.print(f'\\[{sender}] {styles[level]}{message}')
+            case {'level': level, 'message': message}:
+                console.print(f'{styles[level]}{message}')
+            case ProgressEvent():
+                console.print(f'frame={packet.frame:5} speed={packet.speed:4.2f}x', end='\r')
+
+
+def measure(name: str, stream: list, function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f'{name:28} {len(stream) / elapsed:12,.0f} lines/s')
+
+
+def main(lines: int):
+    stream = events(lines)
+    terminal = dict(force_terminal=True, width=120, highlight=False)
+
+    def pending():
+        # The whole stream is already buffered, as it is when ffmpeg outpaces the terminal.
+        remaining = iter(range(len(stream) - 1, -1, -1))
+        return lambda: next(remaining, 0)
+
+    def batched():
+        with RichRenderer(10, Console(file=io.StringIO(), **terminal)) as renderer:
+            render(stream, renderer, pending(), 0.1)
+
+    with open(os.devnull, 'w') as null:
+        def plain():
+            with PlainRenderer(null, null) as renderer:
+                render(stream, renderer, pending(), 0.1)
+
+        print(f'{lines:,} synthetic log lines')
+        measure('console.print per packet', stream, lambda: legacy(stream, Console(file=io.StringIO(), **terminal)))
+        measure('RichRenderer, 10 fps', stream, batched)
+        measure('PlainRenderer', stream, plain)
+
+
+if __name__ == '__main__':
+    import sys
+
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
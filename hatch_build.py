@@ -0,0 +1,16 @@
+import sys
+
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class LanguagesBuildHook(BuildHookInterface):
+    def initialize(self, version, build_data):
+        sys.path.insert(0, str(Path(self.root, 'src')))
+        try:
+            from ffmpeg_wrappers.utils.ISO_639_2_UTF8 import generate
+        finally:
+            sys.path.pop(0)
+
+        generate(Path(self.root, 'src', 'ffmpeg_wrappers', 'utils', 'languages.py'))
@@ -1,74 +1,210 @@
 import sys
+import time
 
-from rich.console import Console
+from collections.abc import Callable, Iterable
+from typing import TextIO
 
-from ffmpeg_wrappers.core.ffmpeg import run
+from ffmpeg_wrappers.core.ffmpeg.buffer import EventBuffer
+from ffmpeg_wrappers.core.ffmpeg.events import Event, LogEvent, ProgressEvent, ExitEvent
+from ffmpeg_wrappers.core.ffmpeg.run import run
 
 
-# TODO: filter and highlight
-def pympeg():
-    ffmpeg_stream = run(sys.argv[1:], loglevel='info', interval=0.5)
-    console = Console(highlight=False)
+def display_time(seconds):
+    minutes, seconds = divmod(int(seconds), 60)  # intentionally discard sub seconds length
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours:02}:{minutes:02}:{seconds:02}'
 
-    def display_time(seconds):
-        minutes, seconds = divmod(int(seconds), 60)  # intentionally discard sub seconds length
-        hours, minutes = divmod(minutes, 60)
-        return f'{hours:02}:{minutes:02}:{seconds:02}'
 
-    def display_size(byte: int) -> str:
-        if byte == 0:
-            return ''
-        digits = len(str(byte))
-        unit = ['B ', 'kB', 'MB', 'GB', 'TB']
-        scale = digits // 3 if digits % 3 > 1 else digits // 3 - 1
-        return f'{str(byte)[0:(digits - scale * 3)].rjust(4)}{unit[scale]}'
+def display_size(byte: int) -> str:
+    if not byte:
+        return ''
+    digits = len(str(byte))
+    unit = ['B ', 'kB', 'MB', 'GB', 'TB']
+    scale = digits // 3 if digits % 3 > 1 else digits // 3 - 1
+    return f'{str(byte)[0:(digits - scale * 3)].rjust(4)}{unit[scale]}'
 
-    def display_rate(rate: int) -> str:
-        if rate == 0:
-            return ''
-        digits = len(str(rate))
-        unit = ['bps ', 'kbps', 'Mbps', 'Gbps', 'Tbps']
-        scale = digits // 3 if digits % 3 > 1 else digits // 3 - 1
-        return f'{str(rate)[0:(digits - scale * 3)].rjust(4)}{unit[scale]}'
 
+def display_rate(rate: int) -> str:
+    if not rate:
+        return ''
+    digits = len(str(rate))
+    unit = ['bps ', 'kbps', 'Mbps', 'Gbps', 'Tbps']
+    scale = digits // 3 if digits % 3 > 1 else digits // 3 - 1
+    return f'{str(rate)[0:(digits - scale * 3)].rjust(4)}{unit[scale]}'
+
+
+def progress_line(event: ProgressEvent) -> str:
+    return (
+        f'frame={event.frame:5} '
+        f'fps={event.fps:6.2f} '
+        f'size={display_size(event.total_size)} '
+        f'time={display_time(event.out_time_ms // 1000)} '
+        f'bitrate={display_rate(event.bitrate)} '
+        f'speed={event.speed or 0:4.2f}x'
+    )
+
+
+def log_line(event: LogEvent) -> str:
+    # Same layout as ffmpeg's own `-loglevel level` output, so log files can be read by the same tools.
+    return f'[{event.sender}] [{event.level}] {event.message}' if event.sender else f'[{event.level}] {event.message}'
+
+
+class RichRenderer:
     styles = {
-        'unknown': '',
-        'info': '',
-        'warning': '[yellow1]',
-        'error': '[bright_red]',
-        'fatal': '[bold white on red]',
+        'warning': 'yellow1',
+        'error': 'bright_red',
+        'fatal': 'bold white on red',
+        'panic': 'bold white on red',
+        'verbose': 'dim',
+        'debug': 'dim',
+        'trace': 'dim',
     }
 
-    for packet in ffmpeg_stream:
-        match packet:
-            case {'level': level, 'message': message}:
-                console.print(f'{styles[level]}{message}')
-
-            case {'level': level, 'message': message, 'sender': sender}:
-                console.print(f'\\[{sender}] {styles[level]}{message}')
-
-            case {
-                'frame': frame,
-                'fps': fps,
-                'bitrate': bitrate,
-                'total_size': size,
-                'out_time_ms': ms,
-                'speed': speed
-            }:
-                console.print(
-                    f'frame={frame:5} '
-                    f'fps={fps:6.2f} '
-                    f'size={display_size(size)} '
-                    f'time={display_time(ms // 1000)} '
-                    f'bitrate={display_rate(bitrate)} '
-                    f'speed={speed:4.2f}x'
-                    '        ',
-                    end='\r'
-                )
+    def __init__(self, rate: float, console=None):
+        # rich is the bulk of pympeg's startup time, so it is only loaded by the renderer that uses it.
+        from rich.console import Console
+        from rich.live import Live
+        from rich.segment import Segment, Segments
+        from rich.style import Style
+        from rich.text import Text
+
+        self.__text = Text
+        self.__segment = Segment
+        self.__segments = Segments
+        self.__newline = Segment.line()
+        self.__sender = Style.parse('dim')
+        self.__styles = {level: Style.parse(style) for level, style in self.styles.items()}
+
+        self.__console = console if console is not None else Console(stderr=True, highlight=False)
+        # Progress is only stored on update, the live display redraws it from its own thread at a fixed rate.
+        self.__live = Live(
+            Text(), console=self.__console, refresh_per_second=rate, redirect_stdout=False, redirect_stderr=False
+        )
+        self.__progressed = False
+
+    def __enter__(self):
+        self.__live.start()
+        return self
+
+    def __exit__(self, *_):
+        self.__live.stop()
+        # Outside a terminal rich writes the last progress line without ending it.
+        if self.__progressed and not self.__console.is_terminal:
+            self.__console.line()
+
+    def logs(self, events: list[LogEvent]):
+        # Pre-styled segments skip markup parsing, measuring and wrapping, and the live display redraws once per batch.
+        segment, styles = self.__segment, self.__styles
+        segments = []
+        for event in events:
+            if event.sender:
+                segments.append(segment(f'[{event.sender}] ', self.__sender))
+            segments.append(segment(event.message, styles.get(event.level)))
+            segments.append(self.__newline)
+        self.__live.console.print(self.__segments(segments))
+
+    def progress(self, event: ProgressEvent):
+        self.__live.update(self.__text(progress_line(event)), refresh=False)
+        self.__progressed = True
+
+
+class PlainRenderer:
+    def __init__(self, logs: TextIO, progress: TextIO | None):
+        self.__logs = logs
+        self.__progress = progress
+        self.__line = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        if self.__line:
+            self.__progress.write('\n')
+            self.__progress.flush()
+
+    def logs(self, events: list[LogEvent]):
+        self.__logs.write(''.join(f'{log_line(event)}\n' for event in events))
+        self.__logs.flush()
+
+    def progress(self, event: ProgressEvent):
+        if self.__progress is not None:
+            self.__progress.write(f'{progress_line(event)}        \r')
+            self.__progress.flush()
+            self.__line = True
+
+
+def render(events: Iterable[Event], renderer: RichRenderer | PlainRenderer, pending: Callable[[], int],
+           period: float) -> int | None:
+    code = None
+    batch = []
+    deadline = time.monotonic() + period
+
+    for event in events:
+        match event:
+            case LogEvent():
+                batch.append(event)
+            case ProgressEvent():
+                renderer.progress(event)
+            case ExitEvent():
+                code = event.code
+
+        # A quiet stream is written as it comes, a flood of lines is written once per frame.
+        if batch and (not pending() or time.monotonic() >= deadline):
+            renderer.logs(batch)
+            batch = []
+            deadline = time.monotonic() + period
+
+    if batch:
+        renderer.logs(batch)
+
+    return code
+
+
+def __options(args: list[str]) -> tuple[list[str], dict]:
+    # pympeg's own options use two dashes, ffmpeg's never do.
+    options = {'quiet_progress': False, 'log_file': None, 'refresh_rate': 10.0}
+    remaining = []
+
+    args = iter(args)
+    for arg in args:
+        name, separator, value = arg.partition('=')
+        match name:
+            case '--quiet-progress':
+                options['quiet_progress'] = True
+            case '--log-file':
+                options['log_file'] = value if separator else next(args)
+            case '--refresh-rate':
+                options['refresh_rate'] = float(value if separator else next(args))
+            case _:
+                remaining.append(arg)
+
+    return remaining, options
+
+
+def pympeg(args: list[str]) -> int | None:
+    args, options = __options(args)
+
+    # Reading ffmpeg's pipes happens in the background, a slow terminal can no longer stall ffmpeg itself.
+    buffer = EventBuffer(capacity=None)
+    events = run(args, loglevel='info', interval=0.5, buffer=buffer)
+    period = 1 / options['refresh_rate']
+
+    if options['log_file'] is not None:
+        with open(options['log_file'], 'a', encoding='UTF-8') as logs:
+            progress = None if options['quiet_progress'] else sys.stderr
+            with PlainRenderer(logs, progress) as renderer:
+                return render(events, renderer, lambda: buffer.pending, period)
+
+    if options['quiet_progress']:
+        with PlainRenderer(sys.stderr, None) as renderer:
+            return render(events, renderer, lambda: buffer.pending, period)
+
+    with RichRenderer(options['refresh_rate']) as renderer:
+        return render(events, renderer, lambda: buffer.pending, period)
 
 
 def main():
-    pympeg()
+    sys.exit(pympeg(sys.argv[1:]))
 
 
 if __name__ == '__main__':
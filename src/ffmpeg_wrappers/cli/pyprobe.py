@@ -1,13 +1,18 @@
+import json
+import os
+import sys
+
+from collections import Counter
+from enum import Enum
+from fractions import Fraction
 from operator import itemgetter
 from pathlib import Path
+from typing import Iterator
 
-from rich import print
-from rich.console import Console
-from rich.tree import Tree
-from typer import run
-
-from ffmpeg_wrappers.core.avfile import AvFile, VideoStream, AudioStream, SubtitleStream, AttachmentStream
-from ffmpeg_wrappers.utils.ISO_639_2_UTF8 import langs
+from ffmpeg_wrappers.core.avfile import (
+    ADAPTIVE_LIMITS, AvFile, ProbeError, StreamDisposition, VideoStream, AudioStream, SubtitleStream, AttachmentStream
+)
+from ffmpeg_wrappers.utils.languages import ENGLISH
 
 
 def display_time(seconds):
@@ -29,6 +34,9 @@ def display_size(byte: int) -> str:
 
 
 def chapter_timeline(self):
+    from rich import print
+    from rich.console import Console
+
     width = Console().width
 
     lengths = []
@@ -80,6 +88,9 @@ def chapter_timeline(self):
 
 
 def streams_tree(avfile):
+    from rich import print
+    from rich.tree import Tree
+
     streams = Tree('Streams', style='bold')
     video = streams.add('Video', style='orange1')
     audio = streams.add('Audio', style='cyan1')
@@ -110,15 +121,16 @@ def streams_tree(avfile):
                 )
 
             case SubtitleStream():
+                language = s.tags.get('language', 'und')
                 subtitle.add(
-                    f'{langs()[s.tags["language"]]["english"]} "{s.tags["title"]}" ({s.index:02})',
+                    f'{ENGLISH.get(language, language)} "{s.tags.get("title", "")}" ({s.index:02})',
                     style='green3'
                 )
 
             case AttachmentStream():
                 if codec == 'NONE':
                     attachment.add(
-                        f'{s.tags["filename"]} ',
+                        f'{s.tags.get("filename", "")} ',
                         style='magenta3'
                     )
 
@@ -136,18 +148,210 @@ def streams_tree(avfile):
     print(streams)
 
 
-def pyprobe(avfile: Path):
-    avfile = AvFile.from_path(avfile)
+class Output(str, Enum):
+    tree = 'tree'
+    table = 'table'
+    ndjson = 'ndjson'
+
+
+MEDIA_EXTENSIONS = (
+    '.mkv', '.mka', '.mks', '.mp4', '.m4v', '.m4a', '.mov', '.avi', '.webm', '.ts', '.m2ts', '.mts', '.mpg', '.mpeg',
+    '.wmv', '.flv', '.ogv', '.ogg', '.opus', '.mp3', '.flac', '.aac', '.wav',
+)
+
+
+class Summary:
+    def __init__(self):
+        self.files = 0
+        self.failed = 0
+        self.duration = 0.0
+        self.size = 0
+        self.containers = Counter()
+        self.codecs = Counter()
+
+    def add(self, result: AvFile | ProbeError):
+        if isinstance(result, ProbeError):
+            self.failed += 1
+            return
+
+        self.files += 1
+        self.duration += result.duration or 0.0
+        self.size += result.size or 0
+        self.containers[result.format_name[0]] += 1
+        for stream in result.streams:
+            self.codecs[(stream_kind(stream), stream.codec_name[0])] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            'files': self.files,
+            'failed': self.failed,
+            'duration': self.duration,
+            'size': self.size,
+            'containers': dict(self.containers),
+            'codecs': {f'{kind}:{codec}': count for (kind, codec), count in self.codecs.most_common()},
+        }
+
+    def render(self):
+        from rich import print
+        from rich.table import Table
+
+        table = Table('Streams', 'Codec', 'Count', title=(
+            f'{self.files} files, {display_time(self.duration)} long, {display_size(self.size)}'
+            + (f', [bright_red]{self.failed} failed[/bright_red]' if self.failed else '')
+        ))
+        for (kind, codec), count in sorted(self.codecs.items()):
+            table.add_row(kind, codec, str(count))
+        print(table)
+
+
+def stream_kind(stream) -> str:
+    match stream:
+        case VideoStream():
+            return 'video'
+        case AudioStream():
+            return 'audio'
+        case SubtitleStream():
+            return 'subtitle'
+        case AttachmentStream():
+            return 'attachment'
+        case _:
+            return 'other'
+
+
+def __expand(paths: list[Path], extensions: frozenset[str]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            for root, directories, files in os.walk(path):
+                directories.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in extensions:
+                        yield Path(root, name)
+
+        elif not path.exists() and any(character in str(path) for character in '*?['):
+            # Quoted globs are expanded here, so a library can be audited without hitting the shell's argument limit.
+            import glob
+
+            yield from __expand([Path(match) for match in sorted(glob.iglob(str(path), recursive=True))], extensions)
+
+        else:
+            yield path
+
+
+def __json(value):
+    match value:
+        case Path() | Fraction():
+            return str(value)
+        case StreamDisposition():
+            return [flag.name.lower() for flag in StreamDisposition if flag in value]
+        case _:
+            raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+
+def ndjson(result: AvFile | ProbeError) -> str:
+    if isinstance(result, ProbeError):
+        return json.dumps({'path': str(result.path), 'error': repr(result.error)})
+
+    import attrs
+
+    data = attrs.asdict(result, recurse=False)
+    data['chapters'] = [attrs.asdict(chapter) for chapter in result.chapters]
+    data['streams'] = [
+        {'type': stream_kind(stream), **attrs.asdict(stream, recurse=False)} for stream in result.streams
+    ]
+    return json.dumps(data, default=__json, ensure_ascii=False)
+
+
+def table_row(result: AvFile | ProbeError) -> str:
+    from rich.markup import escape
+
+    if isinstance(result, ProbeError):
+        return f'[bright_red]{"error":>8}[/bright_red] {escape(str(result.path))}: {escape(str(result.error))}'
+
+    video = ' '.join(
+        f'{s.codec_name[0]} {s.width}x{s.height}' for s in result.streams if isinstance(s, VideoStream)
+    )
+    audio = ','.join(
+        f'{s.codec_name[0]}:{s.tags.get("language", "und")}' for s in result.streams if isinstance(s, AudioStream)
+    )
+    subtitles = sum(isinstance(s, SubtitleStream) for s in result.streams)
+
+    return (
+        f'[bright_red]{display_time(result.duration or 0):>8}[/bright_red] '
+        f'[bright_cyan]{display_size(result.size or 0):>5}[/bright_cyan] '
+        f'[orange1]{video:20}[/orange1] [cyan1]{audio:20}[/cyan1] [green1]{subtitles:2} subs[/green1] '
+        f'{escape(str(result.path))}'
+    )
+
+
+def tree(result: AvFile | ProbeError):
+    from rich import print
+    from rich.markup import escape
+
+    if isinstance(result, ProbeError):
+        print(f'[bold]{escape(result.path.name)}[/bold]: [bright_red]{escape(str(result.error))}[/bright_red]')
+        return
+
+    # Pipes and partial probes may not know either.
+    duration = display_time(result.duration) if result.duration is not None else 'unknown'
+    size = display_size(result.size) if result.size is not None else 'unknown size'
     print(
-        f'[bold]{avfile.path.name}[/bold], [bright_red]{display_time(avfile.duration)}[/bright_red] long, [bright_cyan]{display_size(avfile.size)}[/bright_cyan]')
+        f'[bold]{escape(result.path.name)}[/bold], [bright_red]{duration}[/bright_red] long, '
+        f'[bright_cyan]{size}[/bright_cyan]'
+    )
     print()
-    if len(avfile.chapters) > 0:
-        chapter_timeline(avfile)
+    # The timeline is laid out relative to the duration.
+    if len(result.chapters) > 0 and result.duration:
+        chapter_timeline(result)
         print()
-    streams_tree(avfile)
+    streams_tree(result)
+
+
+def pyprobe(paths: list[Path], output: Output = Output.tree, jobs: int = None, summary: bool = None,
+            extensions: str = ','.join(MEDIA_EXTENSIONS), adaptive: bool = False):
+    extensions = frozenset(extension.strip().lower() for extension in extensions.split(','))
+    files = __expand(paths, extensions)
+
+    # A single file keeps the plain tree output without a summary.
+    if summary is None:
+        summary = len(paths) > 1 or any(path.is_dir() or not path.exists() for path in paths)
+    totals = Summary()
+    # rich and the tree and table rendering are only loaded by the outputs that use them, ndjson never needs them.
+    if output is Output.table:
+        from rich.console import Console
+
+        console = Console(highlight=False, soft_wrap=True)
+
+    limits = ADAPTIVE_LIMITS if adaptive else None
+    for result in AvFile.from_paths(files, max_workers=jobs, ordered=False, limits=limits):
+        match output:
+            case Output.tree:
+                if totals.files + totals.failed > 0:
+                    sys.stdout.write('\n')
+                tree(result)
+            case Output.table:
+                console.print(table_row(result))
+            case Output.ndjson:
+                sys.stdout.write(ndjson(result) + '\n')
+                sys.stdout.flush()
+
+        totals.add(result)
+
+    if summary:
+        if output is Output.ndjson:
+            sys.stderr.write(json.dumps(totals.as_dict()) + '\n')
+        else:
+            sys.stdout.write('\n')
+            totals.render()
+
+    if totals.failed:
+        from typer import Exit
+
+        raise Exit(1)
 
 
 def main():
+    from typer import run
+
     run(pyprobe)
 
 
@@ -0,0 +1,79 @@
+import itertools
+import subprocess
+
+from typing import Generator, NamedTuple
+
+from ffmpeg_wrappers.core.avfile import AvFile, AudioStream
+from ffmpeg_wrappers.core.frames import readinto, require_numpy, select_stream
+
+SAMPLE_FORMATS = {
+    'int16': 's16le', 'int32': 's32le', 'float32': 'f32le', 'float64': 'f64le',
+}
+
+
+class AudioChunk(NamedTuple):
+    time: float
+    samples: 'numpy.ndarray'
+
+
+def audio_stream(avfile: AvFile, stream: AudioStream | int | None) -> AudioStream:
+    return select_stream(avfile, stream, AudioStream)
+
+
+def iter_audio(avfile: AvFile, stream: AudioStream | int = None, sample_rate: int = None, channels: int = None,
+               dtype: 'numpy.typing.DTypeLike' = 'float32', chunk_seconds: float = 1.0, *,
+               pool: int = 4) -> Generator[AudioChunk, None, None]:
+    # Yields (samples, channels) chunks of `chunk_seconds`, the last one shorter, out of a ring of `pool` buffers:
+    # memory stays constant whatever the input length, and a chunk stays valid until `pool - 1` more were yielded.
+    numpy = require_numpy()
+    # Names, scalar types such as numpy.float32 and dtype objects all come down to the same name.
+    try:
+        name = numpy.dtype(dtype).name
+    except TypeError:
+        name = None
+    if name not in SAMPLE_FORMATS:
+        raise ValueError(f'Unsupported sample type {dtype}, use one of {", ".join(SAMPLE_FORMATS)}.')
+
+    stream = audio_stream(avfile, stream)
+    sample_rate = sample_rate or stream.sample_rate
+    channels = channels or stream.channels
+    dtype = numpy.dtype(name).newbyteorder('<')
+
+    frames = max(1, round(chunk_seconds * sample_rate))
+    frame = channels * dtype.itemsize
+    buffers = [bytearray(frames * frame) for _ in range(max(pool, 1))]
+    start = stream.start_time or 0.0
+
+    ffmpeg = subprocess.Popen(
+        ('ffmpeg', '-v', 'error', '-nostdin', '-i', str(avfile.path), '-map', f'0:{stream.index}',
+         # Resampling and remixing happen inside ffmpeg, the samples only ever cross the pipe once.
+         '-ar', str(sample_rate), '-ac', str(channels),
+         '-f', SAMPLE_FORMATS[name], 'pipe:1'),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=0,
+        close_fds=True
+    )
+
+    try:
+        position = 0
+        for buffer in itertools.cycle(buffers):
+            read = readinto(ffmpeg.stdout, memoryview(buffer)) // frame
+            if read == 0:
+                break
+
+            samples = numpy.frombuffer(buffer, dtype=dtype, count=read * channels).reshape((read, channels))
+            yield AudioChunk(time=start + position / sample_rate, samples=samples)
+            position += read
+
+            if read < frames:
+                break
+
+        if ffmpeg.wait() != 0:
+            raise subprocess.CalledProcessError(ffmpeg.returncode, ffmpeg.args)
+
+    finally:
+        ffmpeg.stdout.close()
+        if ffmpeg.poll() is None:
+            ffmpeg.kill()
+            ffmpeg.wait()
@@ -1,12 +1,27 @@
-import json
+import io
+import os
+import contextlib
 import subprocess
+import threading
 
 from pathlib import Path
+from functools import cache
+from itertools import islice
 from fractions import Fraction
 
 from enum import Flag, auto
 from attrs import frozen, field
 from attrs.converters import optional
+from typing import BinaryIO, Iterable, get_origin
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from ffmpeg_wrappers.core.cache import ProbeCache
+from ffmpeg_wrappers.core.keyframes import KeyframeIndex
+from ffmpeg_wrappers.core.packets import packets, packet_batches, frames
 
 
 def none_on_exception(f, *exceptions):
@@ -31,6 +46,20 @@ def keyword_only(cls, fields):
     return results
 
 
+@cache
+def fraction(value) -> Fraction:
+    # Time bases and frame rates repeat across streams and files, and parsing them is the slow part of a Fraction.
+    return Fraction(value)
+
+
+def converter(target):
+    if target is Fraction:
+        return fraction
+
+    # Calling a generic alias such as `dict[str, str]` goes through typing machinery on every call.
+    return get_origin(target) or target
+
+
 def auto_converter(cls, fields):
     results = []
 
@@ -38,11 +67,14 @@ def auto_converter(cls, fields):
         if field.converter is None:
             if isinstance(field.type, tuple):
                 def make_converter(types):
+                    if len(types) == 2:
+                        first, second = types
+                        return lambda values: (first(values[0]), second(values[1]))
                     return lambda values: tuple(target(value) for value, target in zip(values, types))
 
-                results.append(field.evolve(converter=make_converter(field.type)))
+                results.append(field.evolve(converter=make_converter(tuple(map(converter, field.type)))))
             else:
-                results.append(field.evolve(converter=field.type))
+                results.append(field.evolve(converter=converter(field.type)))
         else:
             results.append(field)
 
@@ -78,16 +110,22 @@ class StreamDisposition(Flag):
     DEPENDENT = auto()
     STILL_IMAGE = auto()
 
+    @staticmethod
+    @cache
+    def names() -> dict[str, int]:
+        # ffprobe spells one flag differently, and newer versions report flags this enum does not know about yet.
+        return {**{flag.name.lower(): flag.value for flag in StreamDisposition}, 'timed_thumbnails': StreamDisposition.TIMED_THUMBNAIL.value}
+
     @staticmethod
     def from_dict(data):
-        from_name = {flag.name: flag for flag in StreamDisposition}
+        names = StreamDisposition.names()
 
-        out = StreamDisposition.NONE
-        for key in data.keys():
-            if data[key]:
-                out |= from_name[key.upper()]
+        value = 0
+        for key, enabled in data.items():
+            if enabled:
+                value |= names.get(key, 0)
 
-        return out
+        return StreamDisposition(value)
 
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
@@ -100,180 +138,91 @@ class Stream:
     start_pts: int
     start_time: float
 
-    r_frame_rate: Fraction = field(converter=optional(none_on_exception(Fraction, ZeroDivisionError)))
-    avg_frame_rate: Fraction = field(converter=optional(none_on_exception(Fraction, ZeroDivisionError)))
+    r_frame_rate: Fraction = field(converter=optional(cache(none_on_exception(Fraction, ZeroDivisionError))))
+    avg_frame_rate: Fraction = field(converter=optional(cache(none_on_exception(Fraction, ZeroDivisionError))))
 
     extra_data_size: int
 
     disposition: StreamDisposition
     tags: dict[str, str]
 
+    __required = ('index', 'codec_tag', 'codec_tag_string', 'time_base', 'start_pts', 'start_time', 'r_frame_rate',
+                  'avg_frame_rate', 'extradata_size', 'disposition')
+
+    __specific = {
+        'video': ('codec_name', 'codec_long_name', 'width', 'height', 'pix_fmt'),
+        'audio': ('codec_name', 'codec_long_name', 'sample_fmt', 'sample_rate', 'channels', 'channel_layout'),
+        'subtitle': ('codec_name', 'codec_long_name'),
+        'attachment': ('duration', 'duration_ts'),
+    }
+
+    # Everything ffprobe reports beyond these and the type specific keys ends up in `codec_specific`.
+    __common = frozenset((*__required, 'codec_type', 'codec_name', 'codec_long_name', 'tags'))
+
     @staticmethod
     def from_dict(data):
-        match data:
-            case {
-                'index': index,
-                'codec_type': 'video',
-                'codec_tag': codec_tag,
-                'codec_tag_string': codec_tag_string,
-                'codec_name': codec_name,
-                'codec_long_name': codec_long_name,
-                'time_base': time_base,
-                'start_pts': start_pts,
-                'start_time': start_time,
-                'r_frame_rate': r_frame_rate,
-                'avg_frame_rate': avg_frame_rate,
-                'extradata_size': extra_data_size,
-                'disposition': disposition,
-                'tags': tags,
-                'width': width,
-                'height': height,
-                'pix_fmt': pix_fmt,
-                **other
-            }:
+        kind = data.get('codec_type')
+        specific = Stream.__specific.get(kind)
+
+        if specific is None or not all(key in data for key in Stream.__required) or \
+                not all(key in data for key in specific):
+            return Stream(
+                index=data['index'],
+                codec_name=(data['codec_name'], data['codec_long_name']),
+                codec_tag=(int(data['codec_tag'], 16), data['codec_tag_string']),
+                time_base=data['time_base'],
+                start_pts=data['start_pts'],
+                start_time=data['start_time'],
+                r_frame_rate=data['r_frame_rate'],
+                avg_frame_rate=data['avg_frame_rate'],
+                extra_data_size=data['extradata_size'],
+                disposition=StreamDisposition.from_dict(data['disposition']),
+                tags=data.get('tags', {}),
+            )
+
+        common = dict(
+            index=data['index'],
+            codec_name=(data.get('codec_name'), data.get('codec_long_name')),
+            codec_tag=(int(data['codec_tag'], 16), data['codec_tag_string']),
+            time_base=data['time_base'],
+            start_pts=data['start_pts'],
+            start_time=data['start_time'],
+            r_frame_rate=data['r_frame_rate'],
+            avg_frame_rate=data['avg_frame_rate'],
+            extra_data_size=data['extradata_size'],
+            disposition=StreamDisposition.from_dict(data['disposition']),
+            tags=data.get('tags', {}),
+        )
+
+        common_keys = Stream.__common
+        other = {key: value for key, value in data.items() if key not in common_keys and key not in specific}
+
+        match kind:
+            case 'video':
                 return VideoStream(
-                    index=index,
-                    codec_name=(codec_name, codec_long_name),
-                    codec_tag=(int(codec_tag, 16), codec_tag_string),
-                    time_base=time_base,
-                    start_pts=start_pts,
-                    start_time=start_time,
-                    r_frame_rate=r_frame_rate,
-                    avg_frame_rate=avg_frame_rate,
-                    extra_data_size=extra_data_size,
-                    disposition=StreamDisposition.from_dict(disposition),
-                    tags=tags,
-                    width=width,
-                    height=height,
-                    pix_fmt=pix_fmt,
+                    **common,
+                    width=data['width'],
+                    height=data['height'],
+                    pix_fmt=data['pix_fmt'],
                     codec_specific=other
                 )
 
-            case {
-                'index': index,
-                'codec_type': 'audio',
-                'codec_tag': codec_tag,
-                'codec_tag_string': codec_tag_string,
-                'codec_name': codec_name,
-                'codec_long_name': codec_long_name,
-                'time_base': time_base,
-                'start_pts': start_pts,
-                'start_time': start_time,
-                'r_frame_rate': r_frame_rate,
-                'avg_frame_rate': avg_frame_rate,
-                'extradata_size': extra_data_size,
-                'disposition': disposition,
-                'tags': tags,
-                'sample_fmt': sample_fmt,
-                'sample_rate': sample_rate,
-                'channels': channels,
-                'channel_layout': channel_layout,
-                **other
-            }:
+            case 'audio':
                 return AudioStream(
-                    index=index,
-                    codec_name=(codec_name, codec_long_name),
-                    codec_tag=(int(codec_tag, 16), codec_tag_string),
-                    time_base=time_base,
-                    start_pts=start_pts,
-                    start_time=start_time,
-                    r_frame_rate=r_frame_rate,
-                    avg_frame_rate=avg_frame_rate,
-                    extra_data_size=extra_data_size,
-                    disposition=StreamDisposition.from_dict(disposition),
-                    tags=tags,
-                    sample_fmt=sample_fmt,
-                    sample_rate=sample_rate,
-                    channels=channels,
-                    channel_layout=channel_layout,
+                    **common,
+                    sample_fmt=data['sample_fmt'],
+                    sample_rate=data['sample_rate'],
+                    channels=data['channels'],
+                    channel_layout=data['channel_layout'],
                     codec_specific=other
                 )
 
-            case {
-                'index': index,
-                'codec_type': 'subtitle',
-                'codec_tag': codec_tag,
-                'codec_tag_string': codec_tag_string,
-                'codec_name': codec_name,
-                'codec_long_name': codec_long_name,
-                'time_base': time_base,
-                'start_pts': start_pts,
-                'start_time': start_time,
-                'r_frame_rate': r_frame_rate,
-                'avg_frame_rate': avg_frame_rate,
-                'extradata_size': extra_data_size,
-                'disposition': disposition,
-                'tags': tags,
-                **other
-            }:
-                if len(other) > 0:
-                    print(other)  # TODO: proper handling.
-
-                return SubtitleStream(
-                    index=index,
-                    codec_name=(codec_name, codec_long_name),
-                    codec_tag=(int(codec_tag, 16), codec_tag_string),
-                    time_base=time_base,
-                    start_pts=start_pts,
-                    start_time=start_time,
-                    r_frame_rate=r_frame_rate,
-                    avg_frame_rate=avg_frame_rate,
-                    extra_data_size=extra_data_size,
-                    disposition=StreamDisposition.from_dict(disposition),
-                    tags=tags
-                )
+            case 'subtitle':
+                return SubtitleStream(**common, codec_specific=other)
 
-            case {
-                'index': index,
-                'codec_type': 'attachment',
-                'codec_tag': codec_tag,
-                'codec_tag_string': codec_tag_string,
-                'time_base': time_base,
-                'start_pts': start_pts,
-                'start_time': start_time,
-                'r_frame_rate': r_frame_rate,
-                'avg_frame_rate': avg_frame_rate,
-                'extradata_size': extra_data_size,
-                'disposition': disposition,
-                'tags': tags,
-                'duration': duration,
-                'duration_ts': duration_ts,
-                **other
-            }:
-                if len([k for k in other.keys() if k not in ('codec_name', 'codec_long_name')]) > 0:
-                    print(other)  # TODO: proper handling.
-
-                return AttachmentStream(
-                    index=index,
-                    codec_name=(data.get('codec_name', None), data.get('codec_long_name', None)),
-                    codec_tag=(int(codec_tag, 16), codec_tag_string),
-                    time_base=time_base,
-                    start_pts=start_pts,
-                    start_time=start_time,
-                    r_frame_rate=r_frame_rate,
-                    avg_frame_rate=avg_frame_rate,
-                    extra_data_size=extra_data_size,
-                    disposition=StreamDisposition.from_dict(disposition),
-                    tags=tags,
-                    duration=duration,
-                    duration_ts=duration_ts
-                )
-
-            case _:
-                print(data)
-                return Stream(
-                    index=data['index'],
-                    codec_name=(data['codec_name'], data['codec_long_name']),
-                    codec_tag=(int(data['codec_tag'], 16), data['codec_tag_string']),
-                    time_base=data['time_base'],
-                    start_pts=data['start_pts'],
-                    start_time=data['start_time'],
-                    r_frame_rate=data['r_frame_rate'],
-                    avg_frame_rate=data['avg_frame_rate'],
-                    extra_data_size=data['extradata_size'],
-                    disposition=StreamDisposition.from_dict(data['disposition']),
-                    tags=data['tags'],
-                )
+            case 'attachment':
+                return AttachmentStream(**common, duration=data['duration'], duration_ts=data['duration_ts'],
+                                        codec_specific=other)
 
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
@@ -297,7 +246,7 @@ class AudioStream(Stream):
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
 class SubtitleStream(Stream):
-    pass
+    codec_specific: dict[str, str] = field(factory=dict)
 
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
@@ -305,6 +254,8 @@ class AttachmentStream(Stream):
     duration: float
     duration_ts: int
 
+    codec_specific: dict[str, str] = field(factory=dict)
+
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
 class Chapter:
@@ -318,7 +269,30 @@ class Chapter:
 
     @staticmethod
     def from_dict(data):
-        return Chapter(**data)
+        return Chapter(**{'tags': {}, **data})
+
+
+@frozen
+class ProbeLimits:
+    probesize: int = None
+    analyzeduration: float = None
+
+    @property
+    def options(self) -> tuple[str, ...]:
+        options = ()
+        if self.probesize is not None:
+            options += ('-probesize', str(self.probesize))
+        if self.analyzeduration is not None:
+            options += ('-analyzeduration', str(int(self.analyzeduration * 1_000_000)))
+        return options
+
+
+# Most containers describe their streams within the first few hundred kilobytes, ffprobe's own defaults come last.
+ADAPTIVE_LIMITS = (
+    ProbeLimits(probesize=256 * 1024, analyzeduration=0.5),
+    ProbeLimits(probesize=4 * 1024 * 1024, analyzeduration=5),
+    ProbeLimits(),
+)
 
 
 @frozen(field_transformer=compose_hooks(keyword_only, auto_converter))
@@ -327,10 +301,11 @@ class AvFile:
 
     format_name: (str, str)
 
-    start: float
-    duration: float
-    size: int
-    bit_rate: int
+    # Unknown when probing a pipe or a partially read input.
+    start: float = field(converter=optional(float))
+    duration: float = field(converter=optional(float))
+    size: int = field(converter=optional(int))
+    bit_rate: int = field(converter=optional(int))
 
     chapters: tuple[Chapter]
     streams: tuple[Stream]
@@ -338,33 +313,285 @@ class AvFile:
     tags: dict[str, str]
 
     @staticmethod
-    def from_path(path: Path):
+    def from_path(path: Path, *, cache: ProbeCache = None, timeout: float = 30, minimal: bool = False,
+                  limits: ProbeLimits | Iterable[ProbeLimits] = None):
         path = path.resolve(strict=True)
         assert path.exists()
         assert path.is_file()
 
-        ffprobe = subprocess.run(
-            ('ffprobe', '-print_format', 'json', '-show_format', '-show_chapters', '-show_streams', str(path)),
-            check=True,  # TODO: proper handling
-            timeout=30,  # TODO: proper handling
+        attempts = AvFile.__attempts(limits)
+        if cache is not None:
+            return cache.lookup(
+                path, lambda p: AvFile.__probe(p, timeout, minimal, attempts), kind=AvFile.__kind(minimal, attempts)
+            )
+
+        return AvFile.__probe(path, timeout, minimal, attempts)
+
+    @staticmethod
+    def from_stream(stream: BinaryIO, *, path: Path = Path('pipe:0'), timeout: float = 30, minimal: bool = False,
+                    limits: ProbeLimits | Iterable[ProbeLimits] = None):
+        # A stream cannot be rewound, so whatever an attempt consumed is kept and replayed to the next one.
+        consumed = bytearray()
+
+        for attempt in AvFile.__attempts(limits):
+            data = AvFile.__probe_stream(stream, consumed, timeout, minimal, attempt)
+            if AvFile.__complete(data):
+                break
+
+        return AvFile.from_dict(path, data)
+
+    @staticmethod
+    def from_bytes(data: bytes, *, path: Path = Path('pipe:0'), timeout: float = 30, minimal: bool = False,
+                   limits: ProbeLimits | Iterable[ProbeLimits] = None):
+        return AvFile.from_stream(io.BytesIO(data), path=path, timeout=timeout, minimal=minimal, limits=limits)
+
+    @staticmethod
+    async def from_path_async(path: Path, *, cache: ProbeCache = None, timeout: float = 30,
+                              semaphore: 'asyncio.Semaphore' = None, minimal: bool = False,
+                              limits: ProbeLimits | Iterable[ProbeLimits] = None):
+        # Imported here rather than at module scope, asyncio alone doubles the import time of this module.
+        import asyncio
+
+        path = path.resolve(strict=True)
+        assert path.exists()
+        assert path.is_file()
+
+        attempts = AvFile.__attempts(limits)
+        # SQLite may wait on a lock and the first key runs `ffprobe -version`, neither belongs on the event loop.
+        if cache is not None and \
+                (avfile := await asyncio.to_thread(cache.get, path, AvFile.__kind(minimal, attempts))) is not None:
+            return avfile
+
+        async with semaphore if semaphore is not None else contextlib.nullcontext():
+            for attempt in attempts:
+                command = AvFile.__command(path, minimal, attempt)
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    close_fds=True
+                )
+
+                try:
+                    stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+                except asyncio.TimeoutError:
+                    raise subprocess.TimeoutExpired(command, timeout) from None
+                finally:
+                    # Timed out or cancelled by the caller, ffprobe must not outlive the probe.
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(process.returncode, command)
+
+                if AvFile.__complete(data := json_loads(stdout)):
+                    break
+
+        avfile = AvFile.from_dict(path, data)
+
+        if cache is not None:
+            await asyncio.to_thread(cache.put, path, avfile, AvFile.__kind(minimal, attempts))
+
+        return avfile
+
+    @staticmethod
+    def from_paths(paths, *, max_workers: int = None, ordered: bool = True, processes: bool = False,
+                   cache: ProbeCache = None, minimal: bool = False, limits: ProbeLimits | Iterable[ProbeLimits] = None):
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+        max_workers = max_workers or os.cpu_count() or 1
+        # A tuple, so a one-shot iterable serves every path and the limits can be sent to worker processes.
+        limits = AvFile.__attempts(limits)
+        paths = iter(paths)
+        pending = {}
+
+        with (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=max_workers) as executor:
+            def submit(count):
+                for path in islice(paths, count):
+                    pending[executor.submit(probe_or_error, path, cache=cache, minimal=minimal, limits=limits)] = path
+
+            # Keep a bounded window of submitted paths so arbitrarily long iterables are consumed lazily.
+            submit(max_workers * 2)
+
+            while pending:
+                if ordered:
+                    done = (next(iter(pending)),)
+                    wait(done)
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    del pending[future]
+                    yield future.result()
+
+                submit(len(done))
+
+    def iter_packets(self, stream_index: int, *, batch: int = None):
+        if batch is not None:
+            return packet_batches(self.path, stream_index, batch)
+        return packets(self.path, stream_index)
+
+    def iter_frames(self, stream_index: int, *, keyframes: bool = False):
+        return frames(self.path, stream_index, keyframes=keyframes)
+
+    def keyframes(self, stream_index: int = None, *, cache: ProbeCache = None) -> KeyframeIndex:
+        if stream_index is None:
+            stream_index = next(stream.index for stream in self.streams if isinstance(stream, VideoStream))
+
+        def index(path: Path) -> KeyframeIndex:
+            return KeyframeIndex.from_packets(stream_index, packets(path, stream_index))
+
+        if cache is not None:
+            return cache.lookup(self.path, index, kind=f'keyframes:{stream_index}')
+
+        return index(self.path)
+
+    __format = 'format=format_name,format_long_name,start_time,duration,size,bit_rate:format_tags'
+    __chapter = 'chapter=id,time_base,start,start_time,end,end_time:chapter_tags'
+
+    # Only what the Stream classes model, so `codec_specific` is left (nearly) empty.
+    __minimal = (
+        'stream=index,codec_type,codec_name,codec_long_name,codec_tag,codec_tag_string,time_base,start_pts,'
+        'start_time,r_frame_rate,avg_frame_rate,extradata_size,width,height,pix_fmt,sample_fmt,sample_rate,channels,'
+        'channel_layout,duration,duration_ts:stream_tags:stream_disposition'
+    )
+
+    @staticmethod
+    def __attempts(limits: ProbeLimits | Iterable[ProbeLimits] | None) -> tuple[ProbeLimits | None, ...]:
+        if limits is None or isinstance(limits, ProbeLimits):
+            return limits,
+        return tuple(limits)
+
+    @staticmethod
+    def __kind(minimal: bool, attempts: tuple[ProbeLimits | None, ...] = (None,)) -> str:
+        kind = 'probe:minimal' if minimal else 'probe'
+        if attempts != (None,):
+            # Results of limited probes may differ from complete ones, so they are cached apart.
+            kind += ':' + ','.join(f'{limits.probesize}/{limits.analyzeduration}' for limits in attempts)
+        return kind
+
+    @staticmethod
+    def __command(path: Path | str, minimal: bool = False, limits: ProbeLimits = None) -> tuple[str, ...]:
+        streams = AvFile.__minimal if minimal else 'stream:stream_tags:stream_disposition'
+        return (
+            'ffprobe', '-print_format', 'json', *(limits.options if limits is not None else ()),
+            '-show_entries', f'{AvFile.__format}:{streams}:{AvFile.__chapter}', str(path)
+        )
+
+    @staticmethod
+    def __complete(data) -> bool:
+        # What ffprobe leaves unset when it stopped reading before it could decode enough of a stream.
+        for stream in data.get('streams', ()):
+            match stream.get('codec_type'):
+                case 'video':
+                    if not stream.get('width') or not stream.get('height') or \
+                            stream.get('pix_fmt') in (None, 'unknown'):
+                        return False
+                case 'audio':
+                    if stream.get('sample_rate') in (None, '0') or not stream.get('channels') or \
+                            stream.get('sample_fmt') in (None, 'unknown'):
+                        return False
+
+        return len(data.get('streams', ())) > 0
+
+    @staticmethod
+    def __probe(path: Path, timeout: float, minimal: bool = False, attempts: tuple[ProbeLimits | None, ...] = (None,)):
+        for attempt in attempts:
+            ffprobe = subprocess.run(
+                AvFile.__command(path, minimal, attempt),
+                check=True,  # TODO: proper handling
+                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
+
+            if AvFile.__complete(data := json_loads(ffprobe.stdout)):
+                break
+
+        return AvFile.from_dict(path, data)
+
+    @staticmethod
+    def __probe_stream(stream: BinaryIO, consumed: bytearray, timeout: float, minimal: bool, limits: ProbeLimits):
+        command = AvFile.__command('pipe:0', minimal, limits)
+        ffprobe = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-            encoding='UTF-8',
-            universal_newlines=True,
             close_fds=True
         )
 
-        data = json.loads(ffprobe.stdout)
-        format, chapters, streams = data['format'], data['chapters'], data['streams']
+        def feed():
+            try:
+                ffprobe.stdin.write(consumed)
+                while chunk := stream.read(1 << 16):
+                    consumed.extend(chunk)
+                    ffprobe.stdin.write(chunk)
+            except (BrokenPipeError, ValueError):
+                pass  # ffprobe has seen enough and closed its end.
+            finally:
+                with contextlib.suppress(BrokenPipeError):
+                    ffprobe.stdin.close()
+
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            ffprobe.kill()
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+
+        try:
+            stdout = ffprobe.stdout.read()
+            code = ffprobe.wait()
+        finally:
+            timer.cancel()
+            if ffprobe.poll() is None:
+                ffprobe.kill()
+                ffprobe.wait()
+            # The next attempt replays `consumed`, so this one must be done appending to it.
+            feeder.join()
+            ffprobe.stdout.close()
+
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        if code != 0:
+            raise subprocess.CalledProcessError(code, command)
+
+        return json_loads(stdout)
+
+    @staticmethod
+    def from_dict(path: Path, data):
+        # ffprobe leaves out sections and tags that turned out empty.
+        format, chapters, streams = data['format'], data.get('chapters', ()), data.get('streams', ())
 
         return AvFile(
             path=path,
             format_name=(format['format_name'], format['format_long_name']),
-            start=format['start_time'],
-            duration=format['duration'],
-            size=format['size'],
-            bit_rate=format['bit_rate'],
+            start=format.get('start_time'),
+            duration=format.get('duration'),
+            size=format.get('size'),
+            bit_rate=format.get('bit_rate'),
             chapters=(Chapter.from_dict(chapter) for chapter in chapters),
             streams=(Stream.from_dict(stream) for stream in streams),
-            tags=format['tags']
+            tags=format.get('tags', {})
         )
+
+
+@frozen
+class ProbeError:
+    path: Path
+    error: Exception
+
+
+def probe_or_error(path: Path, *, cache: ProbeCache = None, minimal: bool = False,
+                   limits: ProbeLimits | Iterable[ProbeLimits] = None) -> AvFile | ProbeError:
+    try:
+        return AvFile.from_path(Path(path), cache=cache, minimal=minimal, limits=limits)
+    except Exception as error:
+        return ProbeError(path=Path(path), error=error)
@@ -0,0 +1,233 @@
+import os
+import pickle
+import subprocess
+import threading
+import time
+
+from functools import cache
+from pathlib import Path
+from typing import Callable
+
+from attrs import frozen
+
+
+@cache
+def tool_version(tool: str) -> str:
+    result = subprocess.run(
+        (tool, '-version'),
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding='UTF-8',
+        universal_newlines=True,
+        close_fds=True
+    )
+    return result.stdout.partition('\n')[0].strip()
+
+
+def ffprobe_version() -> str:
+    return tool_version('ffprobe')
+
+
+def ffmpeg_version() -> str:
+    return tool_version('ffmpeg')
+
+
+def cache_directory() -> Path:
+    root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(root) / 'ffmpeg-wrappers'
+
+
+def default_cache_path() -> Path:
+    return cache_directory() / 'probe.sqlite'
+
+
+@frozen
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class SqliteCache:
+    # One table of entries with a `size` and an `accessed` column, shared by threads and processes. Every thread and
+    # process gets its own connection, and the least recently used entries go once `max_size` is exceeded.
+    table: str
+    columns: str
+    indexes: tuple[str, ...] = ()
+    schema: int
+    # Entries are only valid for the version of the tool that produced them.
+    tool: str
+
+    def __init__(self, path: Path, *, max_size: int, version: str = None):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.version = version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__setup(self.connection())
+
+    def connection(self) -> 'sqlite3.Connection':
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None or self.__local.pid != os.getpid():
+            # Only paid once a cache is actually opened, pyprobe runs without one.
+            import sqlite3
+
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def transaction(connection, body: Callable[[], object]):
+        # The write lock is taken up front, a deferred transaction could fail halfway when upgrading to it.
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            result = body()
+            connection.execute('COMMIT')
+            return result
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __setup(self, connection):
+        def setup():
+            if connection.execute('PRAGMA user_version').fetchone()[0] != self.schema:
+                connection.execute(f'DROP TABLE IF EXISTS {self.table}')
+                connection.execute(f'PRAGMA user_version = {self.schema}')
+
+            connection.execute(f'CREATE TABLE IF NOT EXISTS {self.table} ({self.columns})')
+            for column in (*self.indexes, 'accessed'):
+                connection.execute(f'CREATE INDEX IF NOT EXISTS {self.table}_{column} ON {self.table} ({column})')
+
+        self.transaction(connection, setup)
+
+    @property
+    def tool_version(self) -> str:
+        return self.version if self.version is not None else tool_version(self.tool)
+
+    def count(self, *, hits: int = 0, misses: int = 0, evictions: int = 0):
+        with self.__lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def forget(self, connection, rowid: int):
+        connection.execute(f'DELETE FROM {self.table} WHERE rowid = ?', (rowid,))
+
+    def evict(self, connection) -> int:
+        total = connection.execute(f'SELECT COALESCE(SUM(size), 0) FROM {self.table}').fetchone()[0]
+        if total <= self.max_size:
+            return 0
+
+        evicted = 0
+        for rowid, size in connection.execute(f'SELECT rowid, size FROM {self.table} ORDER BY accessed').fetchall():
+            if total <= self.max_size:
+                break
+            self.forget(connection, rowid)
+            total -= size
+            evicted += 1
+
+        return evicted
+
+    def clear(self):
+        connection = self.connection()
+        for rowid, in connection.execute(f'SELECT rowid FROM {self.table}').fetchall():
+            self.forget(connection, rowid)
+
+    @property
+    def stats(self) -> CacheStats:
+        entries, size = self.connection().execute(
+            f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}'
+        ).fetchone()
+        return CacheStats(hits=self.hits, misses=self.misses, evictions=self.evictions, entries=entries, size=size)
+
+
+class ProbeCache(SqliteCache):
+    table = 'probes'
+    columns = (
+        'key TEXT NOT NULL, kind TEXT NOT NULL, path TEXT NOT NULL, data BLOB NOT NULL, '
+        'size INTEGER NOT NULL, accessed INTEGER NOT NULL, PRIMARY KEY (key, kind)'
+    )
+    indexes = ('path',)
+    schema = 2
+    tool = 'ffprobe'
+
+    def __init__(self, path: Path = None, *, max_size: int = 256 * 1024 * 1024, version: str = None):
+        super().__init__(path if path is not None else default_cache_path(), max_size=max_size, version=version)
+
+    def __getstate__(self):
+        return {'path': self.path, 'max_size': self.max_size, 'version': self.version}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], max_size=state['max_size'], version=state['version'])
+
+    @staticmethod
+    def __path(path: Path) -> str:
+        # Entries are stored under the resolved path, whatever form the caller used to reach the file.
+        return str(Path(path).resolve())
+
+    def key(self, path: Path) -> str:
+        stat = path.stat()
+        return '\0'.join(
+            (self.__path(path), str(stat.st_ino), str(stat.st_size), str(stat.st_mtime_ns), self.tool_version)
+        )
+
+    def get(self, path: Path, kind: str = 'probe'):
+        connection = self.connection()
+        key = self.key(path)
+
+        row = connection.execute('SELECT data FROM probes WHERE key = ? AND kind = ?', (key, kind)).fetchone()
+        if row is None:
+            self.count(misses=1)
+            return None
+
+        connection.execute('UPDATE probes SET accessed = ? WHERE key = ? AND kind = ?', (time.time_ns(), key, kind))
+        self.count(hits=1)
+        return pickle.loads(row[0])
+
+    def put(self, path: Path, value, kind: str = 'probe'):
+        connection = self.connection()
+        key = self.key(path)
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def put():
+            # Any other entry for the same path was produced from an older version of the file.
+            connection.execute('DELETE FROM probes WHERE path = ? AND key != ?', (self.__path(path), key))
+            connection.execute(
+                'INSERT OR REPLACE INTO probes (key, kind, path, data, size, accessed) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, kind, self.__path(path), data, len(data), time.time_ns())
+            )
+            return self.evict(connection)
+
+        self.count(evictions=self.transaction(connection, put))
+
+    def lookup(self, path: Path, probe, kind: str = 'probe'):
+        if (value := self.get(path, kind)) is not None:
+            return value
+
+        value = probe(path)
+        self.put(path, value, kind)
+        return value
+
+    def invalidate(self, path: Path):
+        self.connection().execute('DELETE FROM probes WHERE path = ?', (self.__path(path),))
+
+    def clear(self):
+        self.connection().execute('DELETE FROM probes')
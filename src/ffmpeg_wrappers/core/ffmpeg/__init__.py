@@ -1,2 +1,37 @@
-from ffmpeg_wrappers.core.ffmpeg.run import run
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from ffmpeg_wrappers.core.ffmpeg.buffer import EventBuffer
+    from ffmpeg_wrappers.core.ffmpeg.events import Event, LogEvent, ProgressEvent, ProgressErrorEvent, ExitEvent
+    from ffmpeg_wrappers.core.ffmpeg.logs import LogFilter
+    from ffmpeg_wrappers.core.ffmpeg.scheduler import Job, JobScheduler
+
+# Functions named after their submodule are bound eagerly: importing `ffmpeg_wrappers.core.ffmpeg.run` sets the
+# package attribute `run` to the submodule, which a lazy export would never get to replace.
+from ffmpeg_wrappers.core.ffmpeg.run import run, arun
 from ffmpeg_wrappers.core.ffmpeg.progress import progress
+
+# Submodules are only imported on first access, so `pympeg` does not pay for rich, attrs or the scheduler.
+__exports = {
+    'EventBuffer': 'buffer',
+    'Event': 'events', 'LogEvent': 'events', 'ProgressEvent': 'events', 'ProgressErrorEvent': 'events',
+    'ExitEvent': 'events',
+    'LogFilter': 'logs',
+    'Job': 'scheduler', 'JobScheduler': 'scheduler',
+}
+
+__all__ = ['run', 'arun', 'progress', *__exports]
+
+
+def __getattr__(name: str):
+    if (module := __exports.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from importlib import import_module
+    value = getattr(import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__exports})
@@ -0,0 +1,117 @@
+import threading
+
+from collections import Counter, deque
+
+from ffmpeg_wrappers.core.ffmpeg.events import Event, LogEvent, ProgressEvent
+
+
+class EventBuffer:
+    def __init__(self, capacity: int | None = 1024, *, progress: str = 'latest', logs: str = 'drop_oldest',
+                 protected=('warning', 'error', 'fatal')):
+        if progress not in ('latest', 'queue'):
+            raise ValueError(f'Unknown progress policy: {progress}')
+        if logs not in ('drop_oldest', 'drop_newest', 'block'):
+            raise ValueError(f'Unknown logs policy: {logs}')
+
+        self.capacity = capacity
+        self.progress = progress
+        self.logs = logs
+        self.protected = frozenset(protected)
+        self.dropped = Counter()
+
+        self.__events = deque()
+        self.__latest = None
+        self.__writers = 0
+        self.__closed = False
+        self.__condition = threading.Condition()
+
+    @staticmethod
+    def __kind(event: Event) -> str:
+        match event:
+            case LogEvent():
+                return event.level
+            case ProgressEvent():
+                return 'progress'
+            case _:
+                return type(event).__name__
+
+    def __droppable(self, event: Event | None) -> bool:
+        # `None` marks the slot holding the latest progress, which is coalesced rather than dropped.
+        return event is not None and not (isinstance(event, LogEvent) and event.level in self.protected)
+
+    def open_writer(self):
+        with self.__condition:
+            self.__writers += 1
+
+    def close_writer(self):
+        with self.__condition:
+            self.__writers -= 1
+            self.__condition.notify_all()
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def put(self, event: Event):
+        with self.__condition:
+            if self.__closed:
+                return
+
+            if self.progress == 'latest' and isinstance(event, ProgressEvent):
+                if self.__latest is not None:
+                    self.dropped[self.__kind(self.__latest)] += 1
+                else:
+                    self.__events.append(None)
+                self.__latest = event
+                self.__condition.notify_all()
+                return
+
+            if self.capacity is not None and len(self.__events) >= self.capacity:
+                match self.logs:
+                    case 'block':
+                        self.__condition.wait_for(lambda: len(self.__events) < self.capacity or self.__closed)
+                        if self.__closed:
+                            return
+
+                    case 'drop_newest' if self.__droppable(event):
+                        self.dropped[self.__kind(event)] += 1
+                        return
+
+                    case 'drop_oldest':
+                        for index, queued in enumerate(self.__events):
+                            if self.__droppable(queued):
+                                del self.__events[index]
+                                self.dropped[self.__kind(queued)] += 1
+                                break
+
+            # Protected events are kept even when nothing else can be dropped to make room for them.
+            self.__events.append(event)
+            self.__condition.notify_all()
+
+    def __pop(self) -> Event:
+        event = self.__events.popleft()
+        if event is None:
+            event, self.__latest = self.__latest, None
+        self.__condition.notify_all()
+        return event
+
+    def get(self, timeout: float = None) -> Event | None:
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__events or self.__writers == 0, timeout):
+                return None
+            return self.__pop() if self.__events else None
+
+    def get_nowait(self) -> Event | None:
+        with self.__condition:
+            return self.__pop() if self.__events else None
+
+    @property
+    def pending(self) -> int:
+        with self.__condition:
+            return len(self.__events)
+
+    @property
+    def finished(self) -> bool:
+        with self.__condition:
+            return self.__writers == 0 and not self.__events
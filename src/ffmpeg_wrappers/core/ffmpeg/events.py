@@ -0,0 +1,157 @@
+import codecs
+
+from collections.abc import Mapping
+
+
+class Event(Mapping):
+    __slots__ = ()
+    fields: tuple[str, ...] = ()
+
+    # Events are also read-only mappings, so `match packet: case {'level': level, ...}` keeps working.
+    def __getitem__(self, key):
+        if key in self.fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({", ".join(f"{k}={v!r}" for k, v in self.items())})'
+
+
+class LogEvent(Event):
+    __slots__ = ('level', 'message', 'sender')
+    fields = ('level', 'message', 'sender')
+
+    def __init__(self, level: str, message: str, sender: str = None):
+        self.level = level
+        self.message = message
+        self.sender = sender
+
+    def __getitem__(self, key):
+        if key == 'sender' and self.sender is None:
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        return iter(self.fields if self.sender is not None else self.fields[:2])
+
+    def __len__(self):
+        return 3 if self.sender is not None else 2
+
+
+class ProgressEvent(Event):
+    __slots__ = ('frame', 'fps', 'bitrate', 'total_size', 'out_time_us', 'out_time_ms', 'dup_frames', 'drop_frames',
+                 'speed', 'progress', 'qualities')
+    fields = ('frame', 'fps', 'bitrate', 'total_size', 'out_time_us', 'out_time_ms', 'dup_frames', 'drop_frames',
+              'speed', 'progress')
+
+    def __init__(self, frame: int, fps: float, bitrate: int | None, total_size: int | None, out_time_us: int,
+                 out_time_ms: int, dup_frames: int, drop_frames: int, speed: float | None, progress: str,
+                 qualities: dict[str, float]):
+        self.frame = frame
+        self.fps = fps
+        self.bitrate = bitrate
+        self.total_size = total_size
+        self.out_time_us = out_time_us
+        self.out_time_ms = out_time_ms
+        self.dup_frames = dup_frames
+        self.drop_frames = drop_frames
+        self.speed = speed
+        self.progress = progress
+        self.qualities = qualities
+
+    def __getitem__(self, key):
+        if key in self.qualities:
+            return self.qualities[key]
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        yield from self.fields
+        yield from self.qualities
+
+    def __len__(self):
+        return len(self.fields) + len(self.qualities)
+
+
+class ProgressErrorEvent(Event):
+    __slots__ = ('error', 'packet')
+    fields = ('error', 'packet')
+
+    def __init__(self, error: str, packet: dict[str, str]):
+        self.error = error
+        self.packet = packet
+
+
+class ExitEvent(Event):
+    __slots__ = ('code',)
+    fields = ('code',)
+
+    def __init__(self, code: int):
+        self.code = code
+
+
+__required = frozenset((
+    'frame', 'fps', 'bitrate', 'total_size', 'out_time_us', 'out_time_ms', 'out_time', 'dup_frames', 'drop_frames',
+    'speed', 'progress'
+))
+
+
+def progress_event(block: dict[str, str]) -> ProgressEvent | ProgressErrorEvent:
+    # Plain lookups instead of a mapping pattern: this runs once per progress block of every job.
+    if not __required <= block.keys():
+        return ProgressErrorEvent(error='Unknown progress info.', packet=block)
+
+    bitrate, size, speed = block['bitrate'], block['total_size'], block['speed']
+    us, ms = block['out_time_us'], block['out_time_ms']
+
+    try:
+        return ProgressEvent(
+            frame=int(block['frame']),
+            fps=float(block['fps']),
+            bitrate=int(float(bitrate[:-7]) * 1000) if bitrate != 'N/A' else None,
+            total_size=int(size) if size != 'N/A' else None,
+            # Reported as N/A until the first packet is muxed.
+            out_time_us=int(us) if us != 'N/A' else 0,
+            out_time_ms=int(ms) // 1000 if ms != 'N/A' else 0,
+            dup_frames=int(block['dup_frames']),
+            drop_frames=int(block['drop_frames']),
+            speed=float(speed[:-1]) if speed != 'N/A' else None,
+            progress=block['progress'],  # TODO: enum
+            qualities={stream: float(quality) for stream, quality in block.items() if stream not in __required}
+        )
+    except ValueError:
+        return ProgressErrorEvent(error='Malformed progress info.', packet=block)
+
+
+class ProgressParser:
+    __slots__ = ('__decoder', '__partial', '__block')
+
+    def __init__(self):
+        self.__decoder = codecs.getincrementaldecoder('UTF-8')()
+        self.__partial = ''
+        self.__block = {}
+
+    # Only complete `key=value` lines are consumed; a block is emitted once its closing `progress=` line arrives.
+    def feed(self, data: bytes) -> list[ProgressEvent | ProgressErrorEvent]:
+        lines = (self.__partial + self.__decoder.decode(data)).split('\n')
+        self.__partial = lines.pop()
+
+        events = []
+        block = self.__block
+        for line in lines:
+            key, separator, value = line.partition('=')
+            if not separator:
+                continue
+
+            block[key] = value
+            if key == 'progress':
+                events.append(progress_event(block))
+                block = {}
+
+        self.__block = block
+        return events
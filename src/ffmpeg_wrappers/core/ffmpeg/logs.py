@@ -0,0 +1,72 @@
+import re
+
+from ffmpeg_wrappers.core.ffmpeg.events import LogEvent
+
+
+# ffmpeg may stack several contexts, e.g. `[vist#0:0/h264 @ 0x1] [dec:h264 @ 0x2] [info] ...`.
+__sender = rb'[^]]+ @ [^]]+(?:] \[[^]]+ @ [^]]+)*'
+
+
+def __alternatives(values) -> bytes:
+    return b'|'.join(re.escape(value.encode('UTF-8') if isinstance(value, str) else value) for value in values)
+
+
+def compile_filter(levels=None, senders=None, pattern: str | bytes = None) -> re.Pattern:
+    if isinstance(pattern, str):
+        pattern = pattern.encode('UTF-8')
+
+    return re.compile(
+        (rb'(?:\[(' + __sender + rb')] )?' if senders is None else
+         rb'\[((?:[^]]+ @ [^]]+] \[)*(?=[^]]*(?:' + __alternatives(senders) + rb'))' + __sender + rb')] ') +
+        (rb'\[([^]]+)] ' if levels is None else rb'\[(' + __alternatives(levels) + rb')] ') +
+        (rb'(.+)' if pattern is None else rb'((?=.*?(?:' + pattern + rb')).+)')
+    )
+
+
+class LogFilter:
+    __slots__ = ('__regex', '__unknown', '__pattern')
+    __log = re.compile(rb'(?:\[(.+ @ .+)] )?\[(.+)] (.+)')
+
+    # Every condition is folded into a single bytes regex, so rejected lines are never decoded nor allocated.
+    def __init__(self, levels=None, senders=None, pattern: str | bytes = None):
+        self.__regex = compile_filter(levels, senders, pattern)
+        self.__unknown = senders is None and (levels is None or 'unknown' in levels)
+        self.__pattern = None if pattern is None else re.compile(
+            pattern.encode('UTF-8') if isinstance(pattern, str) else pattern
+        )
+
+    def __call__(self, line: bytes) -> LogEvent | None:
+        line = line.strip()
+
+        # A plain search rejects most lines faster than the anchored combined regex.
+        if self.__pattern is not None and not self.__pattern.search(line):
+            return None
+
+        if match := self.__regex.match(line):
+            sender, level, message = match.groups()
+            return LogEvent(
+                level.decode('UTF-8', errors='replace'),
+                message.decode('UTF-8', errors='replace'),
+                sender.decode('UTF-8', errors='replace') if sender is not None else None
+            )
+
+        if not self.__unknown or self.__log.match(line):
+            return None
+
+        return LogEvent('unknown', line.decode('UTF-8', errors='replace'))
+
+
+class LineSplitter:
+    __slots__ = ('__partial',)
+
+    def __init__(self):
+        self.__partial = b''
+
+    def feed(self, data: bytes) -> list[bytes]:
+        lines = (self.__partial + data).split(b'\n')
+        self.__partial = lines.pop()
+        return lines
+
+    def flush(self) -> list[bytes]:
+        partial, self.__partial = self.__partial, b''
+        return [partial] if partial else []
@@ -1,9 +1,6 @@
 import re
 
-from rich import print
-from rich.progress import Progress
-
-from ffmpeg_wrappers.core.ffmpeg import run
+from ffmpeg_wrappers.core.ffmpeg.run import run
 
 __input = re.compile(r'^Input #\d+')
 __duration = re.compile(r'^\s\sDuration: (\d\d):(\d\d):(\d\d)\.(\d\d)')
@@ -20,6 +17,10 @@ def __format_size(byte: int) -> str:
 
 
 def progress(args: list[str], /, title: str = '', total: int = 100):
+    # Bound eagerly by the package, rich is only loaded once a progress bar is actually shown.
+    from rich import print
+    from rich.progress import Progress
+
     inputs = 0
     total_size = 0
     speed_sum = 0
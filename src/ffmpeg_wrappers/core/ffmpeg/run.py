@@ -1,118 +1,214 @@
 import subprocess
-import socket
 import select
-import re
+import signal
+import threading
 import os
-from typing import Generator, Any
-
-__progress = re.compile(r'(.+)=(.+)', re.MULTILINE)
-__log = re.compile(r'(?:\[(.+ @ .+)] )?\[(.+)] (.+)')
-
-
-def __recv_progress(stream):
-    return stream.recv(1024).decode('UTF-8')
-
-
-def __handle_progress(line: str):
-    if line:
-        packet = {k: v for k, v in __progress.findall(line)}
-        match packet:
-            case {
-                'frame': frame,
-                'fps': fps,
-                'bitrate': bitrate,
-                'total_size': size,
-                'out_time_us': us,
-                'out_time_ms': ms,
-                'out_time': _,
-                'dup_frames': duplicated,
-                'drop_frames': dropped,
-                'speed': speed,
-                'progress': progress,
-                **streams_qualities
-            }:
-                return {
-                    'frame': int(frame),
-                    'fps': float(fps),
-                    'bitrate': int(float(bitrate[:-7]) * 1000) if bitrate != 'N/A' else None,
-                    'total_size': int(size) if size != 'N/A' else None,
-                    'out_time_us': int(us),
-                    'out_time_ms': int(ms) // 1000,
-                    'dup_frames': int(duplicated),
-                    'drop_frames': int(dropped),
-                    'speed': float(speed[:-1]) if speed != 'N/A' else None,
-                    'progress': progress,  # TODO: enum
-                    **{stream: float(quality) for stream, quality in streams_qualities.items()}
-                }
-
-            case _:
-                return {'error': f'Unknown progress info.', 'packet': packet}
-
-
-def __recv_logs(stream):
-    return stream.readline().strip()
-
-
-def __handle_logs(line):
-    if match := __log.match(line):
-        sender, level, message = match.groups()
-        if sender is None:
-            return {'level': level, 'message': message}
-        else:
-            return {'level': level, 'message': message, 'sender': sender}
-    else:
-        return {'level': 'unknown', 'message': line}
-
-
-def run(args: list[str], /, *, loglevel: str, interval: float) -> Generator[dict[str, Any], None, None]:
-    with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as server:
-        server.bind(('', 0))
-        server.listen()
-        server.settimeout(2)
-        port = server.getsockname()[1]
-
-        process = subprocess.Popen(
-            tuple(filter(lambda i: i is not None, (
-                'ffmpeg', '-n' if '-y' not in args else None,
-                '-hide_banner', '-nostdin', '-nostats',
-                '-loglevel', f'repeat+level+{loglevel}',
-                '-stats_period', str(interval),
-                '-progress', f'tcp://localhost:{port}',
-                *args
-            ))),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding='UTF-8',
-            universal_newlines=True,
-            bufsize=1,
-            preexec_fn=os.setsid
-        )
+from collections.abc import AsyncGenerator, Callable, Generator
+
+from ffmpeg_wrappers.core.ffmpeg.buffer import EventBuffer
+from ffmpeg_wrappers.core.ffmpeg.events import Event, ExitEvent, ProgressParser
+from ffmpeg_wrappers.core.ffmpeg.logs import LogFilter, LineSplitter
+from ffmpeg_wrappers.core.ffmpeg.transport import open_transport
+
+
+def __command(args: list[str], loglevel: str, interval: float, progress: str) -> tuple[str, ...]:
+    return tuple(filter(lambda i: i is not None, (
+        'ffmpeg', '-n' if '-y' not in args else None,
+        '-hide_banner', '-nostdin', '-nostats',
+        '-loglevel', f'repeat+level+{loglevel}',
+        '-stats_period', str(interval),
+        '-progress', progress,
+        *args
+    )))
+
 
+def __handle_lines(splitter: LineSplitter, logs: LogFilter, data: bytes):
+    return [packet for packet in map(logs, splitter.feed(data) if data else splitter.flush()) if packet is not None]
+
+
+def __background(readers, buffer: EventBuffer) -> Generator[Event, None, None]:
+    def drain(stream, handle):
         try:
-            connection, _ = server.accept()
+            while True:
+                data = stream.read(65536)
+                for event in handle(data):
+                    buffer.put(event)
+                if not data:
+                    break
+        finally:
+            buffer.close_writer()
+
+    for stream, handle in readers.items():
+        buffer.open_writer()
+        threading.Thread(target=drain, args=(stream, handle), daemon=True).start()
+
+    try:
+        while (event := buffer.get()) is not None:
+            yield event
+    except GeneratorExit:
+        # Wake up readers blocked on a full buffer, nobody is going to consume their events anymore.
+        buffer.close()
+        raise
 
-            handlers = {
-                connection: lambda stream: __handle_progress(__recv_progress(stream)),
-                process.stdout: lambda stream: __handle_logs(__recv_logs(stream)),
-                process.stderr: lambda stream: __handle_logs(__recv_logs(stream)),
+
+def run(args: list[str], /, *, loglevel: str, interval: float, transport: str = 'pipe',
+        levels=None, senders=None, pattern: str | bytes = None,
+        buffer: EventBuffer = None, stdin: int = None,
+        started: Callable[[subprocess.Popen], None] = None) -> Generator[Event, None, None]:
+    logs = LogFilter(levels, senders, pattern)
+    stdout, stderr = LineSplitter(), LineSplitter()
+
+    with open_transport(transport) as channel:
+        try:
+            process = subprocess.Popen(
+                __command(args, loglevel, interval, channel.url),
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                pass_fds=channel.pass_fds,
+                preexec_fn=os.setsid
+            )
+        finally:
+            # The read end of a pipe fed as `pipe:0` belongs to ffmpeg from now on. Keeping it open here would hide
+            # ffmpeg's exit from the writer, which would block on a full pipe instead of failing.
+            if stdin is not None:
+                os.close(stdin)
+
+        try:
+            # ffmpeg leads its own process group, which `started` may kill from another thread, e.g. with `kill_group`.
+            if started is not None:
+                started(process)
+
+            connection = channel.accept(timeout=2)
+
+            readers = {
+                connection: ProgressParser().feed,
+                process.stdout: lambda data: __handle_lines(stdout, logs, data),
+                process.stderr: lambda data: __handle_lines(stderr, logs, data),
             }
 
-            while process.poll() is None:
-                readable, _, _ = select.select(handlers.keys(), [], [])
-                yield from filter(lambda i: i is not None, (handlers[stream](stream) for stream in readable))
+            if buffer is not None:
+                yield from __background(readers, buffer)
+
+            else:
+                while process.poll() is None:
+                    readable, _, _ = select.select(readers.keys(), [], [])
+                    for stream in readable:
+                        yield from readers[stream](stream.read(65536))
+
+                # The final blocks (including `progress=end`) may still be buffered after ffmpeg exits.
+                while chunk := connection.read(65536):
+                    yield from readers[connection](chunk)
 
         except TimeoutError:
             process.kill()
 
-        finally:
-            connection.close()
+        except GeneratorExit:
+            # The consumer stopped iterating, nobody is going to wait for what ffmpeg is still writing.
+            process.kill()
+            raise
 
+        finally:
             try:
                 code = process.wait(timeout=10)
             except subprocess.TimeoutExpired:
                 process.kill()
                 code = process.wait()
 
-        outs, errs = process.communicate()
-        yield from (__handle_logs(line) for line in outs.splitlines() + errs.splitlines())
-        yield {'code': code}
+    outs, errs = process.communicate()
+    for splitter, remaining in ((stdout, outs), (stderr, errs)):
+        if remaining:
+            yield from __handle_lines(splitter, logs, remaining)
+        yield from __handle_lines(splitter, logs, b'')
+    yield ExitEvent(code)
+
+
+def kill_group(process):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+async def arun(args: list[str], /, *, loglevel: str, interval: float, transport: str = 'pipe',
+               levels=None, senders=None, pattern: str | bytes = None,
+               buffer: EventBuffer = None) -> AsyncGenerator[Event, None]:
+    # Kept out of module scope, asyncio alone costs more to import than the rest of this package.
+    import asyncio
+
+    logs = LogFilter(levels, senders, pattern)
+
+    if buffer is None:
+        buffer = EventBuffer(capacity=None, progress='queue')
+    elif buffer.logs == 'block':
+        raise ValueError('A blocking buffer would stall the event loop, use a dropping policy with arun.')
+
+    with open_transport(transport) as channel:
+        process = await asyncio.create_subprocess_exec(
+            *__command(args, loglevel, interval, channel.url),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            pass_fds=channel.pass_fds,
+            start_new_session=True
+        )
+
+        wakeup = asyncio.Event()
+        tasks = []
+
+        async def forward(read, handle):
+            try:
+                while True:
+                    data = await read()
+                    for packet in handle(data):
+                        buffer.put(packet)
+                    wakeup.set()
+                    if not data:
+                        break
+            finally:
+                buffer.close_writer()
+                wakeup.set()
+
+        def start(read, handle):
+            buffer.open_writer()
+            tasks.append(asyncio.create_task(forward(read, handle)))
+
+        def lines(stream):
+            splitter = LineSplitter()
+            return lambda: stream.read(65536), lambda data: __handle_lines(splitter, logs, data)
+
+        try:
+            start(*lines(process.stdout))
+            start(*lines(process.stderr))
+
+            try:
+                reader = await channel.accept_async(timeout=2)
+                start(lambda: reader.read(65536), ProgressParser().feed)
+            except asyncio.TimeoutError:
+                kill_group(process)
+
+            while True:
+                if (packet := buffer.get_nowait()) is not None:
+                    yield packet
+                elif buffer.finished:
+                    break
+                else:
+                    await wakeup.wait()
+                    wakeup.clear()
+
+            try:
+                code = await asyncio.wait_for(process.wait(), 10)
+            except asyncio.TimeoutError:
+                kill_group(process)
+                code = await process.wait()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            # Reached on cancellation or when the consumer stops iterating early.
+            if process.returncode is None:
+                kill_group(process)
+                await process.wait()
+
+    yield ExitEvent(code)
@@ -0,0 +1,162 @@
+import contextlib
+import heapq
+import itertools
+import os
+import queue
+import signal
+import threading
+
+from typing import Generator
+
+from attrs import frozen, field
+
+from ffmpeg_wrappers.core.ffmpeg.buffer import EventBuffer
+from ffmpeg_wrappers.core.ffmpeg.events import Event, ProgressEvent, ExitEvent
+from ffmpeg_wrappers.core.ffmpeg.run import kill_group, run
+
+
+def available_memory() -> int | None:
+    try:
+        with open('/proc/meminfo', encoding='UTF-8') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def load_average() -> float | None:
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+@frozen(eq=False)
+class Job:
+    args: tuple[str, ...] = field(converter=tuple)
+    priority: int = 0
+    title: str = ''
+    threads: int = None
+
+
+class JobScheduler:
+    def __init__(self, *, threads_per_job: int = 2, max_jobs: int = None, max_load: float = None,
+                 min_free_memory: int = None, loglevel: str = 'info', interval: float = 0.5, poll: float = 1.0):
+        self.threads_per_job = threads_per_job
+        self.max_jobs = max_jobs or max(1, (os.cpu_count() or 1) // threads_per_job)
+        self.max_load = max_load
+        self.min_free_memory = min_free_memory
+        self.loglevel = loglevel
+        self.interval = interval
+        self.poll = poll
+
+        self.running: set[Job] = set()
+        self.progress: dict[Job, ProgressEvent] = {}
+        self.codes: dict[Job, int] = {}
+
+        self.__queue = []
+        self.__counter = itertools.count()
+        self.__events = queue.Queue()
+        self.__cancelled: set[Job] = set()
+        self.__processes: dict[Job, 'subprocess.Popen'] = {}
+        self.__lock = threading.Lock()
+
+    def submit(self, args: list[str], *, priority: int = 0, title: str = '', threads: int = None) -> Job:
+        job = Job(args, priority=priority, title=title, threads=threads)
+        heapq.heappush(self.__queue, (-priority, next(self.__counter), job))
+        return job
+
+    def cancel(self):
+        # Queued jobs are dropped and running ones killed right away, a job that is quiet until it ends would
+        # otherwise never notice. `run` still reports each running job's exit, and returns once they are all gone.
+        self.__queue.clear()
+        with self.__lock:
+            self.__cancelled.update(self.running)
+            for process in self.__processes.values():
+                if process.returncode is None:
+                    kill_group(process)
+
+    @property
+    def queued(self) -> int:
+        return len(self.__queue)
+
+    def arguments(self, job: Job) -> list[str]:
+        args = list(job.args)
+        if '-threads' not in args and len(args) > 0:
+            # Placed right before the output so it sets the encoder thread budget.
+            args[-1:-1] = ['-threads', str(job.threads or self.threads_per_job)]
+        return args
+
+    def admitted(self) -> bool:
+        # An idle scheduler always admits one job, otherwise a busy machine would starve the queue forever.
+        if not self.running:
+            return True
+
+        if self.max_load is not None and (load := load_average()) is not None and load > self.max_load:
+            return False
+
+        if self.min_free_memory is not None and (free := available_memory()) is not None:
+            if free < self.min_free_memory:
+                return False
+
+        return True
+
+    def __started(self, job: Job, process):
+        # A job cancelled before its ffmpeg existed is killed as soon as it does.
+        with self.__lock:
+            self.__processes[job] = process
+            if job in self.__cancelled:
+                kill_group(process)
+
+    def __work(self, job: Job):
+        try:
+            events = run(
+                self.arguments(job), loglevel=self.loglevel, interval=self.interval, buffer=EventBuffer(),
+                started=lambda process: self.__started(job, process)
+            )
+            with contextlib.closing(events):
+                for event in events:
+                    if job in self.__cancelled:
+                        break
+                    self.__events.put((job, event))
+                else:
+                    return
+
+            # Closing `run` early kills ffmpeg.
+            self.__events.put((job, ExitEvent(-signal.SIGKILL)))
+        except Exception as error:
+            self.__events.put((job, error))
+            self.__events.put((job, ExitEvent(-1)))
+        finally:
+            with self.__lock:
+                self.__processes.pop(job, None)
+
+    def __start(self):
+        while self.__queue and len(self.running) < self.max_jobs and self.admitted():
+            _, _, job = heapq.heappop(self.__queue)
+            self.running.add(job)
+            threading.Thread(target=self.__work, args=(job,), daemon=True).start()
+
+    def run(self) -> Generator[tuple[Job, Event | Exception], None, None]:
+        while self.__queue or self.running:
+            self.__start()
+
+            try:
+                job, event = self.__events.get(timeout=self.poll)
+            except queue.Empty:
+                continue
+
+            match event:
+                case ProgressEvent():
+                    self.progress[job] = event
+
+                case ExitEvent(code=code):
+                    self.running.discard(job)
+                    with self.__lock:
+                        self.__cancelled.discard(job)
+                    self.progress.pop(job, None)
+                    self.codes[job] = code
+
+            yield job, event
@@ -0,0 +1,133 @@
+import socket
+import os
+
+
+class PipeTransport:
+    def __init__(self):
+        self.__read, self.__write = os.pipe()
+        self.__stream = None
+        self.__pipe = None
+
+        self.url = f'pipe:{self.__write}'
+        self.pass_fds = (self.__write,)
+
+    def __release_write(self):
+        # Once ffmpeg holds its own copy, the parent must drop the write end to ever observe EOF.
+        if self.__write is not None:
+            os.close(self.__write)
+            self.__write = None
+
+    def accept(self, timeout: float):
+        self.__release_write()
+        self.__stream = os.fdopen(self.__read, 'rb', buffering=0)
+        return self.__stream
+
+    async def accept_async(self, timeout: float) -> 'asyncio.StreamReader':
+        import asyncio
+
+        self.__release_write()
+        self.__stream = os.fdopen(self.__read, 'rb', buffering=0)
+
+        reader = asyncio.StreamReader()
+        self.__pipe, _ = await asyncio.get_running_loop().connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), self.__stream
+        )
+        return reader
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.__release_write()
+
+        if self.__pipe is not None:
+            self.__pipe.close()
+        elif self.__stream is not None:
+            self.__stream.close()
+        else:
+            os.close(self.__read)
+
+
+class SocketTransport:
+    def __init__(self, family: int, address):
+        self.__server = socket.socket(family, socket.SOCK_STREAM)
+        self.__server.bind(address)
+        self.__server.listen(1)
+        self.__connection = None
+        self.__stream = None
+        self.__writer = None
+
+    @property
+    def address(self):
+        return self.__server.getsockname()
+
+    def accept(self, timeout: float):
+        self.__server.settimeout(timeout)
+        self.__connection, _ = self.__server.accept()
+        self.__stream = self.__connection.makefile('rb', buffering=0)
+        return self.__stream
+
+    async def accept_async(self, timeout: float) -> 'asyncio.StreamReader':
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        self.__server.setblocking(False)
+        self.__connection, _ = await asyncio.wait_for(loop.sock_accept(self.__server), timeout)
+        reader, self.__writer = await asyncio.open_connection(sock=self.__connection)
+        return reader
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        if self.__writer is not None:
+            self.__writer.close()
+        if self.__stream is not None:
+            self.__stream.close()
+        if self.__connection is not None:
+            self.__connection.close()
+        self.__server.close()
+
+
+class TcpTransport(SocketTransport):
+    pass_fds = ()
+
+    def __init__(self):
+        # An explicit IPv4 loopback avoids depending on IPv6 or on how ffmpeg resolves localhost.
+        super().__init__(socket.AF_INET, ('127.0.0.1', 0))
+        self.url = f'tcp://127.0.0.1:{self.address[1]}'
+
+
+class UnixTransport(SocketTransport):
+    pass_fds = ()
+
+    def __init__(self):
+        # Only this transport needs them, and the default pipe transport sits on pympeg's startup path.
+        import tempfile
+        from pathlib import Path
+
+        self.__directory = Path(tempfile.mkdtemp(prefix='ffmpeg-wrappers-'))
+        path = self.__directory / 'progress.sock'
+        super().__init__(socket.AF_UNIX, str(path))
+        self.url = f'unix://{path}'
+
+    def __exit__(self, *_):
+        import shutil
+
+        super().__exit__()
+        shutil.rmtree(self.__directory, ignore_errors=True)
+
+
+def open_transport(kind: str):
+    match kind:
+        case 'pipe' if os.name == 'posix':
+            return PipeTransport()
+
+        case 'unix' if hasattr(socket, 'AF_UNIX'):
+            return UnixTransport()
+
+        case 'pipe' | 'unix' | 'tcp':
+            return TcpTransport()
+
+        case _:
+            raise ValueError(f'Unknown progress transport: {kind}')
@@ -0,0 +1,257 @@
+import itertools
+import os
+import queue
+import subprocess
+import threading
+
+from fractions import Fraction
+from pathlib import Path
+from typing import Callable, Generator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ffmpeg_wrappers.core.avfile import AvFile, Stream, VideoStream
+from ffmpeg_wrappers.core.ffmpeg.events import Event, ExitEvent, ProgressEvent
+from ffmpeg_wrappers.core.ffmpeg.run import run
+from ffmpeg_wrappers.tools.generator import encoder
+
+
+# Packed pixel formats only, each maps to a (channels, dtype) pair so a frame is a plain (H, W, C) array.
+PIXEL_FORMATS = {
+    'gray': (1, 'u1'), 'gray16le': (1, '<u2'), 'grayf32le': (1, '<f4'),
+    'rgb24': (3, 'u1'), 'bgr24': (3, 'u1'), 'rgb48le': (3, '<u2'), 'bgr48le': (3, '<u2'),
+    'rgba': (4, 'u1'), 'bgra': (4, 'u1'), 'argb': (4, 'u1'), 'abgr': (4, 'u1'), 'rgb0': (4, 'u1'), 'bgr0': (4, 'u1'),
+    'rgba64le': (4, '<u2'), 'bgra64le': (4, '<u2'),
+}
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError('Raw frame access needs numpy, install ffmpeg-wrappers[numpy].')
+    return numpy
+
+
+def pixel_format(pix_fmt: str) -> tuple[int, 'numpy.dtype']:
+    if pix_fmt not in PIXEL_FORMATS:
+        raise ValueError(f'Unsupported pixel format {pix_fmt}, use one of {", ".join(PIXEL_FORMATS)}.')
+    channels, dtype = PIXEL_FORMATS[pix_fmt]
+    return channels, require_numpy().dtype(dtype)
+
+
+def select_stream(avfile: AvFile, stream: Stream | int | None, kind: type[Stream]) -> Stream:
+    match stream:
+        case None:
+            candidates = [s for s in avfile.streams if isinstance(s, kind)]
+        case int():
+            candidates = [s for s in avfile.streams if isinstance(s, kind) and s.index == stream]
+        case _:
+            candidates = [stream]
+
+    if not candidates:
+        name = kind.__name__.removesuffix('Stream').lower()
+        raise ValueError(f'{avfile.path.name} has no {name} stream{"" if stream is None else f" {stream}"}.')
+    return candidates[0]
+
+
+def video_stream(avfile: AvFile, stream: VideoStream | int | None) -> VideoStream:
+    return select_stream(avfile, stream, VideoStream)
+
+
+def readinto(pipe, view: memoryview) -> int:
+    # A pipe hands out whatever is available, filling a buffer usually takes several reads. Returns the bytes read,
+    # less than the view only at the end of the stream.
+    filled = 0
+    while filled < len(view):
+        count = pipe.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+def read_frames(avfile: AvFile, stream: VideoStream | int = None, pix_fmt: str = 'rgb24',
+                size: tuple[int, int] = None, *, step: int = 1, keyframes: bool = False, batch: int = None,
+                pool: int = 4) -> Generator['numpy.ndarray', None, None]:
+    # Yields (H, W, C) frames, or (N, H, W, C) batches with `batch`, as views on a pool of `pool` reused buffers:
+    # an array stays valid until `pool - 1` more have been yielded, copy it to keep it longer.
+    channels, dtype = pixel_format(pix_fmt)
+    stream = video_stream(avfile, stream)
+    width, height = size if size is not None else (stream.width, stream.height)
+
+    filters = []
+    if size is not None:
+        filters.append(f'scale={width}:{height}')
+    if step > 1:
+        filters.append(f'select=not(mod(n\\,{step}))')
+
+    count = batch or 1
+    items = height * width * channels
+    frame = items * dtype.itemsize
+    buffers = [bytearray(frame * count) for _ in range(max(pool, 1))]
+
+    ffmpeg = subprocess.Popen(
+        ('ffmpeg', '-v', 'error', '-nostdin',
+         # Rotation would swap width and height behind our back.
+         '-noautorotate', *(('-skip_frame', 'nokey') if keyframes else ()), '-i', str(avfile.path),
+         '-map', f'0:{stream.index}', *(('-vf', ','.join(filters)) if filters else ()),
+         # Selected frames are passed as they are, instead of being duplicated back to the source frame rate.
+         '-fps_mode', 'passthrough', '-pix_fmt', pix_fmt, '-f', 'rawvideo', 'pipe:1'),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=0,
+        close_fds=True
+    )
+
+    try:
+        for buffer in itertools.cycle(buffers):
+            view = memoryview(buffer)
+
+            read = 0
+            while read < count and readinto(ffmpeg.stdout, view[read * frame:(read + 1) * frame]) == frame:
+                read += 1
+
+            if read == 0:
+                break
+
+            array = numpy.frombuffer(buffer, dtype=dtype, count=read * items)
+            yield array.reshape((read, height, width, channels) if batch else (height, width, channels))
+
+            if read < count:
+                break
+
+        if ffmpeg.wait() != 0:
+            raise subprocess.CalledProcessError(ffmpeg.returncode, ffmpeg.args)
+
+    finally:
+        ffmpeg.stdout.close()
+        if ffmpeg.poll() is None:
+            ffmpeg.kill()
+            ffmpeg.wait()
+
+
+class FrameWriter:
+    # Encodes frames produced in Python. Frames are queued as views, not copies: a frame must not be modified until
+    # `backlog` more have been written, or the writer has been closed. `write` blocks while `backlog` frames wait
+    # for the encoder, so producers never run further ahead than that.
+    def __init__(self, output: Path, width: int, height: int, *, pix_fmt: str = 'rgb24',
+                 frame_rate: float | Fraction = 25, encoder: str | tuple[str, dict] = ('libx264', {}),
+                 extra: tuple[str, ...] = (), backlog: int = 8, batch: int = 64,
+                 events: Callable[[Event], None] = None, loglevel: str = 'info', interval: float = 0.5):
+        channels, dtype = pixel_format(pix_fmt)
+
+        self.output = Path(output)
+        self.width = width
+        self.height = height
+        self.pix_fmt = pix_fmt
+        self.frame_rate = frame_rate
+        self.encoder = encoder
+        self.extra = tuple(extra)
+        self.batch = max(batch, 1)
+        self.events = events
+        self.loglevel = loglevel
+        self.interval = interval
+
+        self.frame_size = width * height * channels * dtype.itemsize
+        self.frames = 0
+        self.progress: ProgressEvent | None = None
+        self.code: int | None = None
+
+        self.__queue = queue.Queue(maxsize=max(backlog, 1))
+        self.__error: OSError | None = None
+        self.__fd: int | None = None
+        self.__threads: list[threading.Thread] = []
+
+    def args(self) -> list[str]:
+        return [
+            '-y', '-f', 'rawvideo', '-pix_fmt', self.pix_fmt, '-s', f'{self.width}x{self.height}',
+            '-framerate', str(self.frame_rate), '-i', 'pipe:0', *encoder(self.encoder, 0), *self.extra, str(self.output)
+        ]
+
+    def __enter__(self) -> 'FrameWriter':
+        read, self.__fd = os.pipe()
+        events = run(self.args(), loglevel=self.loglevel, interval=self.interval, stdin=read)
+
+        self.__threads = [
+            threading.Thread(target=self.__consume, args=(events,), daemon=True),
+            threading.Thread(target=self.__write, daemon=True),
+        ]
+        for thread in self.__threads:
+            thread.start()
+        return self
+
+    def __consume(self, events: Generator[Event, None, None]):
+        for event in events:
+            match event:
+                case ProgressEvent():
+                    self.progress = event
+                case ExitEvent(code=code):
+                    self.code = code
+            if self.events is not None:
+                self.events(event)
+
+    @staticmethod
+    def __writev(fd: int, views: list[memoryview]):
+        # A pipe takes what fits, the rest of a partially written frame goes out with the next call.
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views:
+                views[0] = views[0][written:]
+
+    def __write(self):
+        try:
+            while True:
+                views = [self.__queue.get()]
+                while len(views) < self.batch and views[-1] is not None:
+                    try:
+                        views.append(self.__queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                done = views[-1] is None
+                if done:
+                    views.pop()
+
+                # Once ffmpeg is gone frames are still taken off the queue, a blocked producer gets to see the error.
+                if views and self.__error is None:
+                    try:
+                        self.__writev(self.__fd, views)
+                    except OSError as e:
+                        self.__error = e
+
+                if done:
+                    break
+        finally:
+            os.close(self.__fd)
+
+    def write(self, frame):
+        if self.__error is not None:
+            raise self.__error
+
+        view = memoryview(frame)
+        if not view.c_contiguous:
+            raise ValueError('Frames must be C contiguous, use numpy.ascontiguousarray first.')
+        view = view.cast('B')
+        if view.nbytes != self.frame_size:
+            raise ValueError(f'Expected {self.frame_size} bytes per {self.width}x{self.height} {self.pix_fmt} frame, '
+                             f'got {view.nbytes}.')
+
+        self.__queue.put(view)
+        self.frames += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.__queue.put(None)
+        for thread in self.__threads:
+            thread.join()
+
+        if exc_type is not None and exc_val is not self.__error:
+            return
+        if self.code != 0:
+            # A broken pipe is only how the producer learnt that ffmpeg failed, its exit code says more.
+            raise subprocess.CalledProcessError(self.code, ['ffmpeg', *self.args()]) from self.__error
+        if self.__error is not None:
+            raise self.__error
@@ -0,0 +1,362 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from attrs import frozen
+
+from ffmpeg_wrappers.core.avfile import (
+    AvFile, ProbeError, Stream, VideoStream, AudioStream, SubtitleStream, AttachmentStream, StreamDisposition, Chapter
+)
+
+
+@frozen
+class ScanStats:
+    seen: int
+    probed: int
+    unchanged: int
+    removed: int
+    failed: int
+    elapsed: float
+
+
+class MediaIndex:
+    __schema = 1
+
+    __kinds = {VideoStream: 'video', AudioStream: 'audio', SubtitleStream: 'subtitle', AttachmentStream: 'attachment'}
+
+    __columns = frozenset((
+        'kind', 'idx', 'codec_name', 'codec_long_name', 'codec_tag', 'codec_tag_string', 'time_base', 'start_pts',
+        'start_time', 'r_frame_rate', 'avg_frame_rate', 'extra_data_size', 'disposition', 'width', 'height', 'pix_fmt',
+        'sample_fmt', 'sample_rate', 'channels', 'channel_layout', 'duration', 'duration_ts', 'language',
+    ))
+
+    def __init__(self, path: Path, *, batch: int = 256):
+        self.path = Path(path)
+        self.batch = batch
+
+        self.__local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.__setup(self.__connection())
+
+    def __connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None or self.__local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA foreign_keys=ON')
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+        return connection
+
+    def __setup(self, connection):
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            if connection.execute('PRAGMA user_version').fetchone()[0] != self.__schema:
+                for table in ('tags', 'chapters', 'streams', 'files'):
+                    connection.execute(f'DROP TABLE IF EXISTS {table}')
+                connection.execute(f'PRAGMA user_version = {self.__schema}')
+
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS files ('
+                'id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE, size INTEGER NOT NULL, '
+                'mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL, scanned INTEGER NOT NULL, error TEXT, '
+                'format_name TEXT, format_long_name TEXT, start REAL, duration REAL, bit_rate INTEGER)'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS streams ('
+                'file INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE, idx INTEGER NOT NULL, '
+                'kind TEXT NOT NULL, codec_name TEXT, codec_long_name TEXT, codec_tag INTEGER, codec_tag_string TEXT, '
+                'time_base TEXT, start_pts INTEGER, start_time REAL, r_frame_rate TEXT, avg_frame_rate TEXT, '
+                'extra_data_size INTEGER, disposition INTEGER, width INTEGER, height INTEGER, pix_fmt TEXT, '
+                'sample_fmt TEXT, sample_rate INTEGER, channels INTEGER, channel_layout TEXT, duration REAL, '
+                'duration_ts INTEGER, language TEXT, codec_specific TEXT, PRIMARY KEY (file, idx))'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS chapters ('
+                'file INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE, id INTEGER NOT NULL, '
+                'time_base TEXT, start INTEGER, start_time REAL, "end" INTEGER, end_time REAL, PRIMARY KEY (file, id))'
+            )
+            # Tags of the file itself have a NULL stream and chapter.
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS tags ('
+                'file INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE, stream INTEGER, chapter INTEGER, '
+                'key TEXT NOT NULL, value TEXT)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS streams_codec ON streams (kind, codec_name)')
+            connection.execute('CREATE INDEX IF NOT EXISTS streams_resolution ON streams (width, height)')
+            connection.execute('CREATE INDEX IF NOT EXISTS streams_language ON streams (kind, language)')
+            connection.execute('CREATE INDEX IF NOT EXISTS tags_file ON tags (file)')
+            connection.execute('CREATE INDEX IF NOT EXISTS tags_key ON tags (key, value)')
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __len__(self):
+        return self.__connection().execute('SELECT COUNT(*) FROM files WHERE error IS NULL').fetchone()[0]
+
+    @staticmethod
+    def __walk(root: Path, extensions: frozenset[str] | None) -> Iterator[os.DirEntry]:
+        directories = [root]
+        while directories:
+            try:
+                entries = os.scandir(directories.pop())
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file() and (extensions is None or os.path.splitext(entry.name)[1].lower() in extensions):
+                        yield entry
+
+    def __known(self, connection, root: Path) -> dict[str, tuple[int, int, int]]:
+        # Every path below `root/` sorts between `root/` and `root0`, which lets SQLite use the unique path index.
+        prefix = os.path.join(str(root), '')
+        rows = connection.execute(
+            'SELECT path, size, mtime_ns, inode FROM files WHERE path >= ? AND path < ?',
+            (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        )
+        return {path: (size, mtime_ns, inode) for path, size, mtime_ns, inode in rows}
+
+    def scan(self, roots: Iterable[Path], *, extensions: Iterable[str] = None, max_workers: int = None,
+             processes: bool = False) -> ScanStats:
+        start = time.perf_counter()
+        extensions = frozenset(extension.lower() for extension in extensions) if extensions is not None else None
+        connection = self.__connection()
+
+        seen = unchanged = removed = 0
+        changed = []
+
+        for root in roots:
+            root = Path(root).resolve(strict=True)
+            known = self.__known(connection, root)
+
+            for entry in self.__walk(root, extensions):
+                seen += 1
+                stat = entry.stat()
+                identity = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+                if known.pop(entry.path, None) == identity:
+                    unchanged += 1
+                else:
+                    changed.append((entry.path, identity))
+
+            # Whatever was indexed below this root but not seen again is gone.
+            if known:
+                self.__transaction(connection, lambda: connection.executemany(
+                    'DELETE FROM files WHERE path = ?', ((path,) for path in known)
+                ))
+                removed += len(known)
+
+        probed = failed = 0
+        results = AvFile.from_paths(
+            (Path(path) for path, _ in changed), max_workers=max_workers, ordered=True, processes=processes
+        )
+
+        pending = []
+        for (path, identity), result in zip(changed, results):
+            pending.append((path, identity, result))
+            probed += 1
+            failed += isinstance(result, ProbeError)
+
+            if len(pending) >= self.batch:
+                self.__transaction(connection, lambda: self.__store(connection, pending))
+                pending.clear()
+
+        if pending:
+            self.__transaction(connection, lambda: self.__store(connection, pending))
+
+        return ScanStats(seen=seen, probed=probed, unchanged=unchanged, removed=removed, failed=failed,
+                         elapsed=time.perf_counter() - start)
+
+    @staticmethod
+    def __transaction(connection, work):
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            work()
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __store(self, connection, results):
+        scanned = time.time_ns()
+
+        for path, (size, mtime_ns, inode), result in results:
+            connection.execute('DELETE FROM files WHERE path = ?', (path,))
+
+            # Files ffprobe cannot read are remembered too, so that unchanged ones are not probed again.
+            if isinstance(result, ProbeError):
+                connection.execute(
+                    'INSERT INTO files (path, size, mtime_ns, inode, scanned, error) VALUES (?, ?, ?, ?, ?, ?)',
+                    (path, size, mtime_ns, inode, scanned, repr(result.error))
+                )
+                continue
+
+            file = connection.execute(
+                'INSERT INTO files (path, size, mtime_ns, inode, scanned, format_name, format_long_name, start, '
+                'duration, bit_rate) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (path, size, mtime_ns, inode, scanned, *result.format_name, result.start, result.duration,
+                 result.bit_rate)
+            ).lastrowid
+
+            connection.executemany(
+                'INSERT INTO streams VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (self.__stream_row(file, stream) for stream in result.streams)
+            )
+            connection.executemany(
+                'INSERT INTO chapters VALUES (?, ?, ?, ?, ?, ?, ?)',
+                ((file, chapter.id, str(chapter.time_base), chapter.start, chapter.start_time, chapter.end,
+                  chapter.end_time) for chapter in result.chapters)
+            )
+            connection.executemany(
+                'INSERT INTO tags VALUES (?, ?, ?, ?, ?)',
+                [
+                    *((file, None, None, key, value) for key, value in result.tags.items()),
+                    *((file, stream.index, None, key, value) for stream in result.streams
+                      for key, value in stream.tags.items()),
+                    *((file, None, chapter.id, key, value) for chapter in result.chapters
+                      for key, value in chapter.tags.items()),
+                ]
+            )
+
+    def __stream_row(self, file: int, stream: Stream) -> tuple:
+        def fraction(value):
+            return str(value) if value is not None else None
+
+        specific = getattr(stream, 'codec_specific', None)
+        return (
+            file, stream.index, self.__kinds.get(type(stream), 'other'), stream.codec_name[0], stream.codec_name[1],
+            stream.codec_tag[0], stream.codec_tag[1], fraction(stream.time_base), stream.start_pts, stream.start_time,
+            fraction(stream.r_frame_rate), fraction(stream.avg_frame_rate), stream.extra_data_size,
+            stream.disposition.value, getattr(stream, 'width', None), getattr(stream, 'height', None),
+            getattr(stream, 'pix_fmt', None), getattr(stream, 'sample_fmt', None), getattr(stream, 'sample_rate', None),
+            getattr(stream, 'channels', None), getattr(stream, 'channel_layout', None),
+            getattr(stream, 'duration', None), getattr(stream, 'duration_ts', None), stream.tags.get('language'),
+            json.dumps(specific) if specific is not None else None,
+        )
+
+    def __condition(self, conditions: dict) -> tuple[str, list]:
+        clauses, parameters = [], []
+
+        for name, condition in conditions.items():
+            if name not in self.__columns:
+                raise ValueError(f'Unknown stream column: {name}')
+
+            match condition:
+                case None:
+                    clauses.append(f'{name} IS NULL')
+                case tuple((low, high)):
+                    if low is not None:
+                        clauses.append(f'{name} >= ?')
+                        parameters.append(low)
+                    if high is not None:
+                        clauses.append(f'{name} <= ?')
+                        parameters.append(high)
+                case list() | set() | frozenset():
+                    clauses.append(f'{name} IN ({", ".join("?" * len(condition))})')
+                    parameters.extend(condition)
+                case _:
+                    clauses.append(f'{name} = ?')
+                    parameters.append(condition)
+
+        return ' AND '.join(clauses) or '1', parameters
+
+    def with_streams(self, **conditions) -> Iterator[AvFile]:
+        where, parameters = self.__condition(conditions)
+        return self.select(f'SELECT DISTINCT file FROM streams WHERE {where}', parameters)
+
+    def without_streams(self, **conditions) -> Iterator[AvFile]:
+        where, parameters = self.__condition(conditions)
+        return self.select(
+            f'SELECT id FROM files WHERE error IS NULL AND id NOT IN (SELECT file FROM streams WHERE {where})',
+            parameters
+        )
+
+    def select(self, query: str, parameters=()) -> Iterator[AvFile]:
+        connection = self.__connection()
+        for file, in connection.execute(query, parameters).fetchall():
+            if (avfile := self.__load(connection, file)) is not None:
+                yield avfile
+
+    def get(self, path: Path) -> AvFile | None:
+        connection = self.__connection()
+        row = connection.execute('SELECT id FROM files WHERE path = ?', (str(Path(path).resolve()),)).fetchone()
+        return self.__load(connection, row[0]) if row is not None else None
+
+    def errors(self) -> Iterator[tuple[Path, str]]:
+        for path, error in self.__connection().execute('SELECT path, error FROM files WHERE error IS NOT NULL'):
+            yield Path(path), error
+
+    def __load(self, connection, file: int) -> AvFile | None:
+        row = connection.execute(
+            'SELECT path, format_name, format_long_name, start, duration, size, bit_rate '
+            'FROM files WHERE id = ? AND error IS NULL', (file,)
+        ).fetchone()
+        if row is None:
+            return None
+        path, format_name, format_long_name, start, duration, size, bit_rate = row
+
+        tags = {}
+        for stream, chapter, key, value in connection.execute(
+                'SELECT stream, chapter, key, value FROM tags WHERE file = ? ORDER BY rowid', (file,)):
+            tags.setdefault((stream, chapter), {})[key] = value
+
+        chapters = (
+            Chapter(id=id, time_base=time_base, start=start, start_time=start_time, end=end, end_time=end_time,
+                    tags=tags.get((None, id), {}))
+            for id, time_base, start, start_time, end, end_time in connection.execute(
+                'SELECT id, time_base, start, start_time, "end", end_time FROM chapters WHERE file = ? ORDER BY id',
+                (file,)
+            )
+        )
+
+        cursor = connection.execute('SELECT * FROM streams WHERE file = ? ORDER BY idx', (file,))
+        names = [description[0] for description in cursor.description]
+        streams = (self.__stream(dict(zip(names, row)), tags.get((row[1], None), {})) for row in cursor)
+
+        return AvFile(path=Path(path), format_name=(format_name, format_long_name), start=start, duration=duration,
+                      size=size, bit_rate=bit_rate, chapters=tuple(chapters), streams=tuple(streams),
+                      tags=tags.get((None, None), {}))
+
+    @staticmethod
+    def __stream(row: dict, tags: dict) -> Stream:
+        common = dict(
+            index=row['idx'],
+            codec_name=(row['codec_name'], row['codec_long_name']),
+            codec_tag=(row['codec_tag'], row['codec_tag_string']),
+            time_base=row['time_base'],
+            start_pts=row['start_pts'],
+            start_time=row['start_time'],
+            r_frame_rate=row['r_frame_rate'],
+            avg_frame_rate=row['avg_frame_rate'],
+            extra_data_size=row['extra_data_size'],
+            disposition=StreamDisposition(row['disposition']),
+            tags=tags,
+        )
+        specific = json.loads(row['codec_specific']) if row['codec_specific'] is not None else None
+
+        match row['kind']:
+            case 'video':
+                return VideoStream(**common, width=row['width'], height=row['height'], pix_fmt=row['pix_fmt'],
+                                   codec_specific=specific)
+            case 'audio':
+                return AudioStream(**common, sample_fmt=row['sample_fmt'], sample_rate=row['sample_rate'],
+                                   channels=row['channels'], channel_layout=row['channel_layout'],
+                                   codec_specific=specific)
+            case 'subtitle':
+                return SubtitleStream(**common, codec_specific=specific or {})
+            case 'attachment':
+                return AttachmentStream(**common, duration=row['duration'], duration_ts=row['duration_ts'],
+                                        codec_specific=specific or {})
+            case _:
+                return Stream(**common)
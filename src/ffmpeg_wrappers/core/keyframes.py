@@ -0,0 +1,58 @@
+import bisect
+import math
+
+from array import array
+from collections.abc import Iterable
+
+from ffmpeg_wrappers.core.packets import Packet
+
+
+def seek_time(time: float) -> str:
+    # Rounding down keeps a seek point at or before the keyframe it aims for, so that keyframe is never discarded.
+    return f'{math.floor(time * 1_000_000) / 1_000_000:.6f}'
+
+
+class KeyframeIndex:
+    __slots__ = ('stream_index', 'times', 'offsets')
+
+    def __init__(self, stream_index: int, times: array, offsets: array):
+        self.stream_index = stream_index
+        self.times = times
+        self.offsets = offsets
+
+    @staticmethod
+    def from_packets(stream_index: int, packets: Iterable[Packet]) -> 'KeyframeIndex':
+        keyframes = sorted(
+            (packet.pts_time, packet.pos if packet.pos is not None else -1)
+            for packet in packets
+            if packet.key and packet.pts_time is not None
+        )
+        return KeyframeIndex(
+            stream_index,
+            array('d', (time for time, _ in keyframes)),
+            array('q', (offset for _, offset in keyframes))
+        )
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getstate__(self):
+        return self.stream_index, self.times.tobytes(), self.offsets.tobytes()
+
+    def __setstate__(self, state):
+        stream_index, times, offsets = state
+        self.stream_index = stream_index
+        self.times = array('d', times)
+        self.offsets = array('q', offsets)
+
+    def before(self, time: float) -> tuple[float, int] | None:
+        index = bisect.bisect_right(self.times, time) - 1
+        return (self.times[index], self.offsets[index]) if index >= 0 else None
+
+    def after(self, time: float) -> tuple[float, int] | None:
+        index = bisect.bisect_left(self.times, time)
+        return (self.times[index], self.offsets[index]) if index < len(self.times) else None
+
+    def contains(self, time: float, tolerance: float = 0.001) -> bool:
+        index = bisect.bisect_left(self.times, time - tolerance)
+        return index < len(self.times) and self.times[index] <= time + tolerance
@@ -0,0 +1,348 @@
+import math
+import operator
+
+from array import array
+from functools import reduce
+from itertools import compress
+from numbers import Number
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ffmpeg_wrappers.core.avfile import (
+    AvFile, Stream, VideoStream, AudioStream, SubtitleStream, AttachmentStream, StreamDisposition
+)
+
+
+class InternTable:
+    __slots__ = ('values', 'ids')
+
+    def __init__(self):
+        self.values = []
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def id(self, value) -> int:
+        if value is None:
+            return -1
+
+        if (id := self.ids.get(value)) is None:
+            id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return id
+
+    def get(self, id: int):
+        return self.values[id] if id >= 0 else None
+
+    def matching(self, predicate) -> frozenset[int]:
+        return frozenset(id for id, value in enumerate(self.values) if predicate(value))
+
+
+class AvLibrary:
+    __kinds = (Stream, VideoStream, AudioStream, SubtitleStream, AttachmentStream)
+
+    __strings = ('codec_name', 'codec_long_name', 'codec_tag_string', 'pix_fmt', 'sample_fmt', 'channel_layout',
+                 'language')
+
+    __numbers = (
+        ('index', 'i', -1), ('codec_tag', 'q', -1), ('start_pts', 'q', -1), ('start_time', 'd', math.nan),
+        ('extra_data_size', 'q', -1), ('disposition', 'i', 0), ('width', 'i', -1), ('height', 'i', -1),
+        ('sample_rate', 'i', -1), ('channels', 'i', -1), ('duration', 'd', math.nan), ('duration_ts', 'q', -1),
+    )
+
+    __fractions = ('time_base', 'r_frame_rate', 'avg_frame_rate')
+
+    # Every number but the disposition flags can be missing, and is then stored as its default.
+    __sentinels = {name: default for name, _, default in __numbers if name != 'disposition'}
+
+    def __init__(self, avfiles: Iterable[AvFile] = ()):
+        self.strings = InternTable()
+        self.keys = InternTable()
+        self.fractions = InternTable()
+        self.__values = {}
+
+        self.__paths = []
+        self.__format_names = array('i')
+        self.__format_long_names = array('i')
+        self.__starts = array('d')
+        self.__durations = array('d')
+        self.__sizes = array('q')
+        self.__bit_rates = array('q')
+        self.__first_streams = array('q', [0])
+        self.__file_tags = array('i')
+        self.__file_tag_values = []
+        self.__chapters = []
+
+        self.__file = array('i')
+        self.__kind = array('b')
+        self.__columns = {name: array('i') for name in self.__strings}
+        self.__columns.update({name: array(code) for name, code, _ in self.__numbers})
+        self.__columns.update({name: array('i') for name in self.__fractions})
+        self.__tags = array('i')
+        self.__tag_values = []
+        self.__specific = array('i')
+        self.__specific_values = []
+
+        for avfile in avfiles:
+            self.add(avfile)
+
+    def __len__(self):
+        return len(self.__paths)
+
+    def __iter__(self) -> Iterator[AvFile]:
+        return (self[file] for file in range(len(self)))
+
+    def __getitem__(self, file: int) -> AvFile:
+        chapters = self.__chapters[file]
+        return AvFile(
+            path=Path(self.__paths[file]),
+            format_name=(self.strings.get(self.__format_names[file]), self.strings.get(self.__format_long_names[file])),
+            start=self.__float(self.__starts[file]),
+            duration=self.__float(self.__durations[file]),
+            size=self.__integer(self.__sizes[file]),
+            bit_rate=self.__integer(self.__bit_rates[file]),
+            chapters=chapters if chapters is not None else (),
+            streams=(self.stream(row) for row in self.rows(file)),
+            tags=self.__dict(self.__file_tags[file], self.__file_tag_values[file])
+        )
+
+    @staticmethod
+    def __float(value: float) -> float | None:
+        return value if not math.isnan(value) else None
+
+    @staticmethod
+    def __integer(value: int) -> int | None:
+        return value if value >= 0 else None
+
+    @property
+    def stream_count(self) -> int:
+        return len(self.__kind)
+
+    def rows(self, file: int) -> range:
+        return range(self.__first_streams[file], self.__first_streams[file + 1])
+
+    def file_of(self, row: int) -> int:
+        return self.__file[row]
+
+    def path(self, file: int) -> Path:
+        return Path(self.__paths[file])
+
+    def __dedup(self, values) -> tuple:
+        # Tag values repeat a lot across a library (encoders, languages, titles of a series), so share them.
+        return tuple(self.__values.setdefault(value, value) if isinstance(value, str) else value for value in values)
+
+    def __dict(self, keys: int, values: tuple) -> dict:
+        return dict(zip(self.keys.get(keys), values)) if keys >= 0 else {}
+
+    def __mapping(self, mapping: dict | None) -> tuple[int, tuple]:
+        if not mapping:
+            return -1, ()
+        return self.keys.id(tuple(mapping.keys())), self.__dedup(mapping.values())
+
+    def add(self, avfile: AvFile) -> int:
+        file = len(self.__paths)
+
+        self.__paths.append(str(avfile.path))
+        self.__format_names.append(self.strings.id(avfile.format_name[0]))
+        self.__format_long_names.append(self.strings.id(avfile.format_name[1]))
+        # Pipes and partial probes leave these unknown.
+        self.__starts.append(avfile.start if avfile.start is not None else math.nan)
+        self.__durations.append(avfile.duration if avfile.duration is not None else math.nan)
+        self.__sizes.append(avfile.size if avfile.size is not None else -1)
+        self.__bit_rates.append(avfile.bit_rate if avfile.bit_rate is not None else -1)
+        keys, values = self.__mapping(avfile.tags)
+        self.__file_tags.append(keys)
+        self.__file_tag_values.append(values)
+        self.__chapters.append(avfile.chapters or None)
+
+        for stream in avfile.streams:
+            self.__add_stream(file, stream)
+        self.__first_streams.append(len(self.__kind))
+
+        return file
+
+    def __add_stream(self, file: int, stream: Stream):
+        columns = self.__columns
+        self.__file.append(file)
+        self.__kind.append(self.__kinds.index(type(stream)))
+
+        derived = {
+            'codec_name': stream.codec_name[0],
+            'codec_long_name': stream.codec_name[1],
+            'codec_tag_string': stream.codec_tag[1],
+            'language': stream.tags.get('language'),
+            'codec_tag': stream.codec_tag[0],
+            'disposition': stream.disposition.value,
+        }
+        for name in self.__strings:
+            columns[name].append(self.strings.id(derived.get(name, getattr(stream, name, None))))
+        for name, _, default in self.__numbers:
+            value = derived.get(name, getattr(stream, name, None))
+            columns[name].append(value if value is not None else default)
+        for name in self.__fractions:
+            columns[name].append(self.fractions.id(getattr(stream, name)))
+
+        keys, values = self.__mapping(stream.tags)
+        self.__tags.append(keys)
+        self.__tag_values.append(values)
+
+        keys, values = self.__mapping(getattr(stream, 'codec_specific', None))
+        self.__specific.append(keys)
+        self.__specific_values.append(values)
+
+    def stream(self, row: int) -> Stream:
+        columns = self.__columns
+        kind = self.__kinds[self.__kind[row]]
+
+        common = dict(
+            index=columns['index'][row],
+            codec_name=(self.strings.get(columns['codec_name'][row]), self.strings.get(columns['codec_long_name'][row])),
+            codec_tag=(columns['codec_tag'][row], self.strings.get(columns['codec_tag_string'][row])),
+            time_base=self.fractions.get(columns['time_base'][row]),
+            start_pts=columns['start_pts'][row],
+            start_time=columns['start_time'][row],
+            r_frame_rate=self.fractions.get(columns['r_frame_rate'][row]),
+            avg_frame_rate=self.fractions.get(columns['avg_frame_rate'][row]),
+            extra_data_size=columns['extra_data_size'][row],
+            disposition=StreamDisposition(columns['disposition'][row]),
+            tags=self.__dict(self.__tags[row], self.__tag_values[row]),
+        )
+
+        if kind is VideoStream:
+            return VideoStream(
+                **common,
+                width=columns['width'][row],
+                height=columns['height'][row],
+                pix_fmt=self.strings.get(columns['pix_fmt'][row]),
+                codec_specific=self.__dict(self.__specific[row], self.__specific_values[row])
+            )
+
+        if kind is AudioStream:
+            return AudioStream(
+                **common,
+                sample_fmt=self.strings.get(columns['sample_fmt'][row]),
+                sample_rate=columns['sample_rate'][row],
+                channels=columns['channels'][row],
+                channel_layout=self.strings.get(columns['channel_layout'][row]),
+                codec_specific=self.__dict(self.__specific[row], self.__specific_values[row])
+            )
+
+        if kind is SubtitleStream:
+            return SubtitleStream(
+                **common,
+                codec_specific=self.__dict(self.__specific[row], self.__specific_values[row])
+            )
+
+        if kind is AttachmentStream:
+            return AttachmentStream(
+                **common,
+                duration=columns['duration'][row],
+                duration_ts=columns['duration_ts'][row],
+                codec_specific=self.__dict(self.__specific[row], self.__specific_values[row])
+            )
+
+        return kind(**common)
+
+    def streams(self, rows: Iterable[int]) -> Iterator[Stream]:
+        return (self.stream(row) for row in rows)
+
+    @staticmethod
+    def __predicate(condition, ordered: bool):
+        match condition:
+            case _ if callable(condition):
+                return condition
+            case tuple((low, high)) if ordered:
+                return lambda value: (low is None or value >= low) and (high is None or value <= high)
+            case str() | Number():
+                return lambda value: value == condition
+            case _:
+                return frozenset(condition).__contains__
+
+    def __interned(self, name: str, condition) -> frozenset[int] | None:
+        # Interned columns are filtered by evaluating the condition once per distinct value, then matching ids.
+        if name in self.__strings:
+            return self.strings.matching(self.__predicate(condition, False))
+        if name in self.__fractions:
+            return self.fractions.matching(self.__predicate(condition, True))
+        return None
+
+    def __present(self, name: str):
+        # Missing values are stored as sentinels, -1 ids for interned columns and -1 or NaN for numbers, which no
+        # condition should ever see as real values. Works on a single value as well as on a whole NumPy column.
+        if name in self.__strings or name in self.__fractions:
+            return lambda values: values != -1
+        match self.__sentinels.get(name):
+            case None:
+                return None
+            case float():
+                # NaN is the only value not equal to itself.
+                return lambda values: values == values
+            case sentinel:
+                return lambda values: values != sentinel
+
+    def __mask(self, name: str, column: array, condition):
+        # One flag per row, computed over the whole column at once. A `None` condition matches missing values.
+        present = self.__present(name)
+        ids = self.__interned(name, condition) if condition is not None else None
+
+        if numpy is None:
+            if condition is None:
+                test = (lambda value: not present(value)) if present is not None else (lambda value: False)
+            elif ids is not None:
+                test = ids.__contains__
+            elif present is not None:
+                test = lambda value, test=self.__predicate(condition, True): present(value) and test(value)
+            else:
+                test = self.__predicate(condition, True)
+            return bytes(map(bool, map(test, column)))
+
+        values = numpy.frombuffer(column, dtype=column.typecode)
+        if condition is None:
+            return ~present(values) if present is not None else numpy.zeros(len(values), bool)
+        if ids is not None:
+            return numpy.isin(values, numpy.fromiter(ids, values.dtype, len(ids)))
+
+        match condition:
+            case _ if callable(condition):
+                distinct, inverse = numpy.unique(values, return_inverse=True)
+                keep = present(distinct) if present is not None else numpy.ones(len(distinct), bool)
+                matches = (bool(condition(value)) if kept else False
+                           for value, kept in zip(distinct.tolist(), keep.tolist()))
+                return numpy.fromiter(matches, bool, len(distinct))[inverse]
+            case tuple((low, high)):
+                mask = numpy.ones(len(values), bool)
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values <= high
+            case str() | Number():
+                mask = values == condition
+            case _:
+                mask = numpy.isin(values, list(condition))
+
+        return mask & present(values) if present is not None else mask
+
+    def where(self, kind: type[Stream] = None, **conditions) -> array:
+        for name in conditions:
+            if name not in self.__columns:
+                raise ValueError(f'Unknown stream column: {name}')
+
+        masks = [self.__mask(name, self.__columns[name], condition) for name, condition in conditions.items()]
+        if kind is not None and kind is not Stream:
+            masks.append(self.__mask('kind', self.__kind, self.__kinds.index(kind)))
+
+        if not masks:
+            return array('q', range(len(self.__kind)))
+        if numpy is None:
+            mask = reduce(lambda a, b: bytes(map(operator.and_, a, b)), masks)
+            return array('q', compress(range(len(self.__kind)), mask))
+        return array('q', numpy.flatnonzero(numpy.logical_and.reduce(masks)).astype('q').tobytes())
+
+    def files(self, rows: Iterable[int]) -> list[int]:
+        return sorted({self.__file[row] for row in rows})
@@ -0,0 +1,229 @@
+import hashlib
+import os
+import shutil
+import time
+
+from pathlib import Path
+from typing import Generator
+
+from ffmpeg_wrappers.core.avfile import AvFile
+from ffmpeg_wrappers.core.cache import SqliteCache, cache_directory, ffmpeg_version
+from ffmpeg_wrappers.core.ffmpeg.events import Event, ExitEvent
+from ffmpeg_wrappers.core.ffmpeg.run import run
+
+
+def default_output_cache_path() -> Path:
+    return cache_directory() / 'outputs'
+
+
+# Options that change how ffmpeg reports, never what it writes.
+__flags = frozenset(('-y', '-n', '-hide_banner', '-nostdin', '-nostats', '-stats'))
+__valued = frozenset(('-loglevel', '-v', '-progress', '-stats_period'))
+
+# Options without a value, any other option is taken to have one. An unknown switch would take the argument after it
+# for its value: when that is the output, no output is left and the command is not cached.
+__switches = frozenset((
+    '-an', '-vn', '-sn', '-dn', '-re', '-shortest', '-copyts', '-start_at_zero', '-accurate_seek', '-autorotate',
+    '-autoscale', '-bitexact', '-benchmark', '-benchmark_all', '-copy_unknown', '-ignore_unknown', '-debug_ts',
+    '-xerror', '-dump', '-hex', '-report', '-vstats', '-qphist', '-psnr', '-intra', '-stdin', '-find_stream_info',
+    '-fix_sub_duration', '-fix_sub_duration_heartbeat', '-recast_media', '-print_graphs',
+))
+
+# Options naming a file ffmpeg reads, which is as much part of the command as an input. `-/option` (ffmpeg 7) reads
+# the value of any option from a file.
+__files = frozenset(('-i', '-filter_script', '-filter_complex_script', '-attach'))
+
+
+def __piped(path: str) -> bool:
+    return path == '-' or path.startswith('pipe:')
+
+
+def __switch(arg: str) -> bool:
+    name = arg.partition(':')[0]
+    return name in __switches or (name.startswith('-no') and f'-{name[3:]}' in __switches)
+
+
+def __sample(path: Path, size: int, length: int = 1024 * 1024) -> str:
+    # Both ends of the file, so neither a rewritten header nor an appended tail goes unnoticed.
+    digest = hashlib.sha256(str(size).encode('UTF-8'))
+    with open(path, 'rb') as file:
+        digest.update(file.read(length))
+        if size > length:
+            file.seek(max(length, size - length))
+            digest.update(file.read(length))
+    return digest.hexdigest()
+
+
+def __identity(source: str, content: bool) -> str:
+    path = Path(source)
+    if not path.is_file():
+        # Not a file, e.g. a lavfi graph or an URL: the argument itself is all there is to identify it.
+        return source
+
+    stat = path.stat()
+    if content:
+        return f'sample:{__sample(path, stat.st_size)}'
+    return f'file:{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}'
+
+
+def normalize(args: list[str], *, content: bool = False) -> list[str] | None:
+    # Returns `None` for commands that cannot be cached: piped inputs or outputs, more than one output, and inputs
+    # that name further files the key would not cover (concat lists, two-pass logs). Files named inside filter graphs
+    # (`movie=`, `subtitles=`) are not seen either, use the content key or no cache for those.
+    args = list(args)
+    result, outputs = [], []
+    format = None
+
+    arguments = iter(args)
+    for arg in arguments:
+        if arg in __flags:
+            continue
+        if arg in __valued:
+            next(arguments, None)
+            continue
+
+        if not arg.startswith('-') or arg == '-':
+            outputs.append(arg)
+            format = None
+            continue
+
+        result.append(arg)
+        if __switch(arg):
+            continue
+
+        if (value := next(arguments, None)) is None:
+            return None
+
+        match arg:
+            case '-pass' | '-passlogfile':
+                return None
+            case '-f':
+                format = value
+            case '-i' if format == 'concat':
+                return None
+
+        if arg in __files or arg.startswith('-/'):
+            if __piped(value):
+                return None
+            result.append(__identity(value, content))
+        else:
+            result.append(value)
+
+        if arg == '-i':
+            format = None
+
+    # Only a single output, the last argument, is ever restored from the cache.
+    if len(outputs) != 1 or outputs[0] != args[-1] or __piped(args[-1]):
+        return None
+
+    # The muxer may be chosen from the extension, the output name itself does not matter.
+    result.append(f'output:{Path(args[-1]).suffix}')
+    return result
+
+
+class OutputCache(SqliteCache):
+    table = 'outputs'
+    columns = (
+        'key TEXT PRIMARY KEY, name TEXT NOT NULL, size INTEGER NOT NULL, mtime INTEGER NOT NULL, '
+        'accessed INTEGER NOT NULL'
+    )
+    schema = 1
+    tool = 'ffmpeg'
+
+    def __init__(self, directory: Path = None, *, max_size: int = 64 * 1024 ** 3, version: str = None,
+                 content: bool = False):
+        self.directory = Path(directory) if directory is not None else default_output_cache_path()
+        self.content = content
+
+        (self.directory / 'objects').mkdir(parents=True, exist_ok=True)
+        super().__init__(self.directory / 'outputs.sqlite', max_size=max_size, version=version)
+
+    def key(self, args: list[str]) -> str | None:
+        if (normalized := normalize(args, content=self.content)) is None:
+            return None
+        return hashlib.sha256('\0'.join((self.tool_version, *normalized)).encode('UTF-8')).hexdigest()
+
+    def __object(self, name: str) -> Path:
+        return self.directory / 'objects' / name[:2] / name
+
+    @staticmethod
+    def __place(source: Path, destination: Path):
+        # A hard link costs nothing, a copy is only needed across file systems.
+        destination.unlink(missing_ok=True)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+    def forget(self, connection, rowid: int):
+        row = connection.execute('SELECT name FROM outputs WHERE rowid = ?', (rowid,)).fetchone()
+        super().forget(connection, rowid)
+        if row is not None:
+            self.__object(row[0]).unlink(missing_ok=True)
+
+    def get(self, args: list[str]) -> bool:
+        if (key := self.key(args)) is None:
+            return False
+
+        output = Path(args[-1])
+        connection = self.connection()
+        row = connection.execute('SELECT rowid, name, size, mtime FROM outputs WHERE key = ?', (key,)).fetchone()
+
+        # An existing output is only replaced when ffmpeg itself would have overwritten it.
+        if row is None or (output.exists() and '-y' not in args):
+            self.count(misses=1)
+            return False
+
+        rowid, name, size, mtime = row
+        stored = self.__object(name)
+        try:
+            # Hard links share the file with earlier outputs, one of which may since have been rewritten in place.
+            stat = stored.stat()
+            valid = stat.st_size == size and stat.st_mtime_ns == mtime
+            if valid:
+                AvFile.from_path(stored)
+        except Exception:
+            valid = False
+
+        if not valid:
+            self.forget(connection, rowid)
+            self.count(misses=1)
+            return False
+
+        self.__place(stored, output)
+        connection.execute('UPDATE outputs SET accessed = ? WHERE key = ?', (time.time_ns(), key))
+        self.count(hits=1)
+        return True
+
+    def put(self, args: list[str]):
+        if (key := self.key(args)) is None:
+            return
+
+        output = Path(args[-1])
+        name = key + output.suffix
+        stored = self.__object(name)
+        stored.parent.mkdir(exist_ok=True)
+        self.__place(output, stored)
+        stat = stored.stat()
+
+        connection = self.connection()
+
+        def put():
+            connection.execute(
+                'INSERT OR REPLACE INTO outputs (key, name, size, mtime, accessed) VALUES (?, ?, ?, ?, ?)',
+                (key, name, stat.st_size, stat.st_mtime_ns, time.time_ns())
+            )
+            return self.evict(connection)
+
+        self.count(evictions=self.transaction(connection, put))
+
+    def run(self, args: list[str], /, **kwargs) -> Generator[Event, None, None]:
+        # Same events as `run`, a hit only yields a successful exit. Commands `normalize` refuses are always run.
+        if self.get(args):
+            yield ExitEvent(0)
+            return
+
+        for event in run(args, **kwargs):
+            if isinstance(event, ExitEvent) and event.code == 0:
+                self.put(args)
+            yield event
@@ -0,0 +1,128 @@
+import math
+import subprocess
+
+from array import array
+from pathlib import Path
+from typing import NamedTuple, Generator
+
+
+def __integer(value: str) -> int | None:
+    return int(value) if value != 'N/A' else None
+
+
+def __float(value: str) -> float | None:
+    return float(value) if value != 'N/A' else None
+
+
+def __string(value: str) -> str | None:
+    return value if value != 'N/A' else None
+
+
+class Packet(NamedTuple):
+    stream_index: int
+    pts: int | None
+    pts_time: float | None
+    dts: int | None
+    dts_time: float | None
+    duration_time: float | None
+    size: int | None
+    pos: int | None
+    flags: str | None
+
+    @property
+    def key(self) -> bool:
+        return self.flags is not None and 'K' in self.flags
+
+
+class Frame(NamedTuple):
+    stream_index: int
+    key_frame: bool
+    pts: int | None
+    pts_time: float | None
+    duration_time: float | None
+    pict_type: str | None
+
+
+__packet = (
+    ('stream_index', int), ('pts', __integer), ('pts_time', __float), ('dts', __integer), ('dts_time', __float),
+    ('duration_time', __float), ('size', __integer), ('pos', __integer), ('flags', __string),
+)
+
+__frame = (
+    ('stream_index', int), ('key_frame', lambda value: value == '1'), ('pts', __integer), ('pts_time', __float),
+    ('duration_time', __float), ('pict_type', __string),
+)
+
+
+def __records(path: Path, section: str, stream_index: int, fields, *options) -> Generator[list, None, None]:
+    names = tuple(name for name, _ in fields)
+    converters = tuple(converter for _, converter in fields)
+
+    ffprobe = subprocess.Popen(
+        ('ffprobe', '-v', 'error', '-select_streams', str(stream_index), *options,
+         '-show_entries', f'{section}={",".join(names)}', '-of', 'compact=p=0', str(path)),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding='UTF-8',
+        universal_newlines=True,
+        bufsize=1 << 16,
+        close_fds=True
+    )
+
+    layout, width = None, 0
+    try:
+        for line in ffprobe.stdout:
+            items = line.rstrip('\n').split('|')
+
+            # ffprobe prints entries in its own order, which is stable across lines: resolve it once, then slice.
+            if len(items) != width:
+                keys = [item.partition('=')[0] for item in items]
+                if not all(name in keys for name in names):
+                    continue
+                layout, width = tuple((keys.index(name), len(name) + 1) for name in names), len(items)
+
+            yield [convert(items[index][offset:]) for (index, offset), convert in zip(layout, converters)]
+
+        if ffprobe.wait() != 0:
+            raise subprocess.CalledProcessError(ffprobe.returncode, ffprobe.args)
+
+    finally:
+        ffprobe.stdout.close()
+        if ffprobe.poll() is None:
+            ffprobe.kill()
+            ffprobe.wait()
+
+
+def packets(path: Path, stream_index: int) -> Generator[Packet, None, None]:
+    for values in __records(path, 'packet', stream_index, __packet):
+        yield Packet(*values)
+
+
+def frames(path: Path, stream_index: int, *, keyframes: bool = False) -> Generator[Frame, None, None]:
+    options = ('-skip_frame', 'nokey') if keyframes else ()
+    for values in __records(path, 'frame', stream_index, __frame, *options):
+        yield Frame(*values)
+
+
+def packet_batches(path: Path, stream_index: int, size: int) -> Generator[dict[str, array], None, None]:
+    def empty():
+        return {
+            'pts_time': array('d'), 'dts_time': array('d'), 'duration_time': array('d'),
+            'size': array('q'), 'pos': array('q'), 'key': array('b'),
+        }
+
+    batch = empty()
+    for packet in packets(path, stream_index):
+        batch['pts_time'].append(packet.pts_time if packet.pts_time is not None else math.nan)
+        batch['dts_time'].append(packet.dts_time if packet.dts_time is not None else math.nan)
+        batch['duration_time'].append(packet.duration_time if packet.duration_time is not None else math.nan)
+        batch['size'].append(packet.size if packet.size is not None else -1)
+        batch['pos'].append(packet.pos if packet.pos is not None else -1)
+        batch['key'].append(packet.key)
+
+        if len(batch['key']) >= size:
+            yield batch
+            batch = empty()
+
+    if len(batch['key']) > 0:
+        yield batch
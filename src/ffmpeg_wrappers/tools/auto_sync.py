@@ -3,7 +3,7 @@ import re
 from rich import print
 from rich import progress
 
-from ffmpeg_wrappers.core.ffmpeg import run
+from ffmpeg_wrappers.core.ffmpeg.run import run
 
 frame = re.compile(r'frame:(\d+) pblack:(\d+).*')
 
@@ -24,7 +24,8 @@ def main(reference, other):
             for packet in run(
                     ['-hwaccel', 'auto', '-i', other, '-loop', '1', '-i', f'REF{offset}.png', '-filter_complex',
                      '[0]scale=iw*2:ih*2[t];[t][1]blend=difference,blackframe=95', '-vn', '-an', '-sn', '-t', '120s',
-                     '-f', 'null', '-'], loglevel='verbose', interval=0.125):
+                     '-f', 'null', '-'], loglevel='verbose', interval=0.125,
+                    levels=('info', 'error', 'fatal')):
                 # print(packet)
                 match packet:
                     case {'level': 'error', 'message': message} | {'level': 'fatal', 'message': message}:
@@ -41,7 +42,7 @@ def main(reference, other):
             for packet in run(
                     ['-hwaccel', 'auto', '-i', reference, '-loop', '1', '-i', f'REF{offset}.png', '-filter_complex',
                      '[0][1]blend=difference,blackframe=95', '-vn', '-an', '-sn', '-t', '120s', '-f', 'null', '-'],
-                    loglevel='verbose', interval=0.125):
+                    loglevel='verbose', interval=0.125, levels=('info', 'error', 'fatal')):
                 # print(packet)
                 match packet:
                     case {'level': 'error', 'message': message} | {'level': 'fatal', 'message': message}:
@@ -1,19 +1,24 @@
 from pathlib import Path
 
-from ffmpeg_wrappers.core.avfile import AvFile, VideoStream, AudioStream
+from attrs import frozen, field
+from attrs.converters import optional
 
+from ffmpeg_wrappers.core.avfile import AvFile, Stream, StreamDisposition, VideoStream, AudioStream
 
-def __convert(options: dict):
+
+def __convert(options: dict, counter: int):
+    # `{stream}` in a parameter is replaced by the output stream index, e.g. `pix_fmt:{stream}`.
     for parameter, value in options.items():
-        yield f'-{parameter}', f'{value}'
+        yield f'-{parameter.format(stream=counter)}', f'{value}'
 
 
-def generate(input: AvFile, mapper, output: Path, *, extra=None) -> [str]:
-    if extra is None:
-        extra = tuple()
+def encoder(mapping: str | tuple[str, dict], counter: int) -> list[str]:
+    codec, options = mapping if isinstance(mapping, tuple) else (mapping, {})
+    return [f'-c:{counter}', codec, *(item for option in __convert(options, counter) for item in option)]
 
-    mappings = []
-    counter = 0
+
+def mappings(input: AvFile, mapper, *, file: int = 0, counter: int = 0) -> list[str]:
+    result = []
 
     for stream in input.streams:
         mapping = mapper(stream)
@@ -21,17 +26,149 @@ def generate(input: AvFile, mapper, output: Path, *, extra=None) -> [str]:
         if mapping is None:
             continue
 
-        if isinstance(mapping, tuple):
-            codec, options = mapping
-            options = tuple(*__convert(options))
+        result += ['-map', f'{file}:{stream.index}', *encoder(mapping, counter)]
+        counter += 1
+
+    return result
 
-        else:
-            codec, options = mapping, tuple()
 
-        mappings += ['-map', f'0:{stream.index}', f'-c:{counter}', codec, *options]
-        counter += 1
+def generate(input: AvFile, mapper, output: Path, *, extra=None) -> [str]:
+    if extra is None:
+        extra = tuple()
+
+    return '-i', str(input.path), *mappings(input, mapper), *extra, str(output)
+
+
+def bit_rate(stream: Stream) -> int | None:
+    # Matroska only has the muxer's statistics tags, most other containers report it per stream.
+    value = getattr(stream, 'codec_specific', {}).get('bit_rate') or stream.tags.get('BPS') or \
+        stream.tags.get('BPS-eng')
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+@frozen
+class VideoProfile:
+    encoder: str | tuple[str, dict]
+    codecs: tuple[str, ...] = field(default=(), converter=tuple)
+    max_bit_rate: int = None
+    max_width: int = None
+    max_height: int = None
+    # The first one is what non conforming streams are converted to.
+    pix_fmts: tuple[str, ...] = field(default=None, converter=optional(tuple))
+
+
+@frozen
+class AudioProfile:
+    encoder: str | tuple[str, dict]
+    codecs: tuple[str, ...] = field(default=(), converter=tuple)
+    max_bit_rate: int = None
+    # The first one is what non conforming streams are resampled to.
+    sample_rates: tuple[int, ...] = field(default=None, converter=optional(tuple))
+    max_channels: int = None
+
+
+@frozen
+class Decision:
+    stream: Stream
+    mapping: str | tuple[str, dict] | None
+    reasons: tuple[str, ...]
+
+    @property
+    def copy(self) -> bool:
+        return self.mapping == 'copy'
+
+    def __str__(self):
+        codec = self.mapping[0] if isinstance(self.mapping, tuple) else self.mapping or 'drop'
+        return f'{self.stream.index}: {self.stream.codec_name[0]} -> {codec} ({"; ".join(self.reasons)})'
+
+
+@frozen
+class Profile:
+    video: VideoProfile = None
+    audio: AudioProfile = None
+    # Mapping for every other stream, or for video and audio without a profile.
+    other: str | tuple[str, dict] | None = 'copy'
+
+    def decide(self, stream: Stream) -> Decision:
+        match stream:
+            case VideoStream() if StreamDisposition.ATTACHED_PIC in stream.disposition:
+                return Decision(stream=stream, mapping='copy', reasons=('attached picture',))
+            case VideoStream() if self.video is not None:
+                return Profile.__video(stream, self.video)
+            case AudioStream() if self.audio is not None:
+                return Profile.__audio(stream, self.audio)
+            case _:
+                return Decision(stream=stream, mapping=self.other, reasons=('no profile for this stream',))
+
+    def __call__(self, stream: Stream):
+        # A profile is also a mapper, so it can be passed anywhere `generate` or `mappings` take one.
+        return self.decide(stream).mapping
+
+    @staticmethod
+    def __common(stream: Stream, codecs: tuple[str, ...], max_bit_rate: int | None) -> list[str]:
+        reasons = []
+
+        if codecs and stream.codec_name[0] not in codecs:
+            reasons.append(f'codec {stream.codec_name[0]} is not {"/".join(codecs)}')
 
-    return '-i', str(input.path), *mappings, *extra, str(output)
+        if max_bit_rate is not None:
+            if (rate := bit_rate(stream)) is None:
+                reasons.append('bit rate unknown')
+            elif rate > max_bit_rate:
+                reasons.append(f'bit rate {rate // 1000}kb/s above {max_bit_rate // 1000}kb/s')
+
+        return reasons
+
+    @staticmethod
+    def __decision(stream: Stream, encoder, reasons: list[str], options: dict) -> Decision:
+        if not reasons:
+            return Decision(stream=stream, mapping='copy', reasons=('conforms to profile',))
+
+        codec, encoder_options = encoder if isinstance(encoder, tuple) else (encoder, {})
+        return Decision(stream=stream, mapping=(codec, {**encoder_options, **options}), reasons=tuple(reasons))
+
+    @staticmethod
+    def __video(stream: VideoStream, profile: VideoProfile) -> Decision:
+        reasons = Profile.__common(stream, profile.codecs, profile.max_bit_rate)
+        options = {}
+
+        too_wide = profile.max_width is not None and stream.width > profile.max_width
+        too_high = profile.max_height is not None and stream.height > profile.max_height
+        if too_wide or too_high:
+            limit = f'{profile.max_width or "any"}x{profile.max_height or "any"}'
+            reasons.append(f'{stream.width}x{stream.height} above {limit}')
+            options['filter:{stream}'] = (
+                f'scale=w=min(iw\\,{profile.max_width or "iw"}):h=min(ih\\,{profile.max_height or "ih"})'
+                ':force_original_aspect_ratio=decrease:force_divisible_by=2'
+            )
+
+        if profile.pix_fmts is not None and stream.pix_fmt not in profile.pix_fmts:
+            reasons.append(f'pixel format {stream.pix_fmt} is not {"/".join(profile.pix_fmts)}')
+            options['pix_fmt:{stream}'] = profile.pix_fmts[0]
+
+        return Profile.__decision(stream, profile.encoder, reasons, options)
+
+    @staticmethod
+    def __audio(stream: AudioStream, profile: AudioProfile) -> Decision:
+        reasons = Profile.__common(stream, profile.codecs, profile.max_bit_rate)
+        options = {}
+
+        if profile.sample_rates is not None and stream.sample_rate not in profile.sample_rates:
+            reasons.append(f'sample rate {stream.sample_rate}Hz is not {"/".join(map(str, profile.sample_rates))}Hz')
+            options['ar:{stream}'] = profile.sample_rates[0]
+
+        if profile.max_channels is not None and stream.channels > profile.max_channels:
+            reasons.append(f'{stream.channels} channels above {profile.max_channels}')
+            options['ac:{stream}'] = profile.max_channels
+
+        return Profile.__decision(stream, profile.encoder, reasons, options)
+
+
+def plan(input: AvFile, profile: Profile) -> list[Decision]:
+    return [profile.decide(stream) for stream in input.streams]
 
 
 if __name__ == '__main__':
@@ -54,3 +191,14 @@ if __name__ == '__main__':
 
 
     print(generate(avfile, encode_crf28, Path('testing.mkv')))
+
+    # Same intent, but streams that are already HEVC or AAC within limits are copied instead of re-encoded.
+    hevc_aac = Profile(
+        video=VideoProfile(encoder=('libx265', {'crf': '28'}), codecs=('hevc',), max_bit_rate=8_000_000,
+                           max_width=1920, max_height=1080, pix_fmts=('yuv420p10le', 'yuv420p')),
+        audio=AudioProfile(encoder=('aac_at', {'aq': '0'}), codecs=('aac',), max_bit_rate=320_000,
+                           sample_rates=(48000, 44100), max_channels=6),
+    )
+    for decision in plan(avfile, hevc_aac):
+        print(str(decision))
+    print(generate(avfile, hevc_aac, Path('testing.mkv')))
@@ -0,0 +1,146 @@
+import re
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Callable, Generator
+
+from attrs import frozen, field
+
+from ffmpeg_wrappers.core.avfile import AvFile, Stream, VideoStream, AudioStream
+from ffmpeg_wrappers.core.cache import ffmpeg_version
+from ffmpeg_wrappers.core.ffmpeg import Event, ProgressEvent
+from ffmpeg_wrappers.core.ffmpeg.run import run
+from ffmpeg_wrappers.tools.generator import encoder, mappings
+
+
+def copy_audio(stream: Stream):
+    return 'copy' if isinstance(stream, AudioStream) else None
+
+
+@frozen
+class Rendition:
+    output: Path = field(converter=Path)
+    # Encoder for the scaled video, `None` leaves video out of this output.
+    video: str | tuple[str, dict] | None
+    width: int = None
+    height: int = None
+    # Mapper for every other stream of the source, as taken by `generate`.
+    streams: Callable[[Stream], str | tuple[str, dict] | None] = copy_audio
+    extra: tuple[str, ...] = field(default=(), converter=tuple)
+
+
+class MuxStats:
+    # Reads what `-stats_mux_pre` writes for one output, one `stream index, packet, time, size` line per packet.
+    format = '{sidx} {n} {t} {size}'
+
+    def __init__(self, path: Path, video: bool):
+        self.path = path
+        self.video = video
+        self.frames = 0
+        self.size = 0
+        self.time = 0.0
+
+        self.__offset = 0
+        self.__partial = b''
+
+    def update(self):
+        try:
+            with open(self.path, 'rb') as file:
+                file.seek(self.__offset)
+                data = file.read()
+        except FileNotFoundError:
+            return
+
+        self.__offset += len(data)
+        lines = (self.__partial + data).split(b'\n')
+        self.__partial = lines.pop()
+
+        for line in lines:
+            index, _, timestamp, size = line.split()
+            self.size += int(size)
+            if timestamp != b'N/A':
+                self.time = max(self.time, float(timestamp))
+            if self.video and index == b'0':
+                self.frames += 1
+
+    def progress(self, block: ProgressEvent, output: int, elapsed: float) -> ProgressEvent:
+        prefix = f'stream_{output}_'
+        return ProgressEvent(
+            frame=self.frames,
+            fps=self.frames / elapsed if elapsed > 0 else 0.0,
+            bitrate=int(self.size * 8 / self.time) if self.time > 0 else None,
+            total_size=self.size,
+            out_time_us=int(self.time * 1_000_000),
+            out_time_ms=int(self.time * 1000),
+            dup_frames=0,
+            drop_frames=0,
+            speed=self.time / elapsed if elapsed > 0 else None,
+            progress=block.progress,
+            qualities={key: value for key, value in block.qualities.items() if key.startswith(prefix)}
+        )
+
+
+def per_output_stats() -> bool:
+    # `-stats_mux_pre` came with ffmpeg 6.1. Builds from git carry no release number and are taken to be recent.
+    match = re.search(r'version n?(\d+)\.(\d+)', ffmpeg_version())
+    return match is None or (int(match[1]), int(match[2])) >= (6, 1)
+
+
+def ladder(input: AvFile, renditions: list[Rendition], stats: list[Path] = None) -> list[str]:
+    video = next((stream for stream in input.streams if isinstance(stream, VideoStream)), None)
+    scaled = [i for i, rendition in enumerate(renditions) if rendition.video is not None]
+    if scaled and video is None:
+        raise ValueError(f'{input.path.name} has no video stream to scale.')
+
+    args = ['-i', str(input.path)]
+
+    # The source is decoded once, `split` hands the same frames to every scaler.
+    if scaled:
+        graph = f'[0:{video.index}]split={len(scaled)}' + ''.join(f'[s{i}]' for i in scaled)
+        for i in scaled:
+            rendition = renditions[i]
+            if rendition.width is None and rendition.height is None:
+                graph += f';[s{i}]null[v{i}]'
+            else:
+                graph += f';[s{i}]scale=w={rendition.width or -2}:h={rendition.height or -2}[v{i}]'
+        args += ['-filter_complex', graph]
+
+    for i, rendition in enumerate(renditions):
+        counter = 0
+        if rendition.video is not None:
+            args += ['-map', f'[v{i}]', *encoder(rendition.video, 0)]
+            counter = 1
+
+        def streams(stream, mapper=rendition.streams):
+            return None if video is not None and stream.index == video.index else mapper(stream)
+
+        args += mappings(input, streams, counter=counter)
+        if stats is not None:
+            args += ['-stats_mux_pre', str(stats[i]), '-stats_mux_pre_fmt', MuxStats.format]
+        args += [*rendition.extra, str(rendition.output)]
+
+    return args
+
+
+def encode_ladder(input: AvFile, renditions: list[Rendition], *, loglevel: str = 'info', interval: float = 0.5,
+                 stats: bool = None) -> Generator[tuple[Rendition | None, Event], None, None]:
+    # ffmpeg's own progress only describes the first output, per output progress comes from `-stats_mux_pre`
+    # (ffmpeg 6.1 or later, `stats=None` checks the installed one). Everything else, and the combined progress, is
+    # yielded with `None`, which is all there is without per output stats.
+    if stats is None:
+        stats = per_output_stats()
+
+    with tempfile.TemporaryDirectory(prefix='ffmpeg-wrappers-ladder-') as directory:
+        paths = [Path(directory, f'{i}.stats') for i in range(len(renditions))] if stats else None
+        outputs = [MuxStats(path, rendition.video is not None) for path, rendition in zip(paths or (), renditions)]
+        start = time.monotonic()
+
+        for event in run(['-y', *ladder(input, renditions, paths)], loglevel=loglevel, interval=interval):
+            if isinstance(event, ProgressEvent):
+                elapsed = time.monotonic() - start
+                for output, (rendition, stat) in enumerate(zip(renditions, outputs)):
+                    stat.update()
+                    yield rendition, stat.progress(event, output, elapsed)
+
+            yield None, event
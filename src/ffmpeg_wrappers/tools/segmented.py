@@ -0,0 +1,109 @@
+import bisect
+import tempfile
+
+from pathlib import Path
+
+from ffmpeg_wrappers.core.avfile import AvFile, VideoStream
+from ffmpeg_wrappers.core.ffmpeg import ExitEvent, Job, JobScheduler
+from ffmpeg_wrappers.core.ffmpeg.run import run
+from ffmpeg_wrappers.core.keyframes import seek_time
+from ffmpeg_wrappers.tools.generator import mappings
+
+
+def __packets(input: AvFile, stream: VideoStream) -> tuple[list[float], list[float]]:
+    frames, keyframes = [], []
+    for packet in input.iter_packets(stream.index):
+        if packet.pts_time is None:
+            continue
+
+        frames.append(packet.pts_time)
+        if packet.key:
+            keyframes.append(packet.pts_time)
+
+    return sorted(frames), sorted(keyframes)
+
+
+def boundaries(frames: list[float], keyframes: list[float], segments: int) -> list[tuple[float, int]]:
+    # Each segment starts on the last keyframe before an even split point, and is given an exact frame count.
+    duration = frames[-1] - frames[0]
+    starts = sorted({
+        keyframes[max(0, bisect.bisect_right(keyframes, frames[0] + duration * i / segments) - 1)]
+        for i in range(segments)
+    })
+
+    result = []
+    for start, end in zip(starts, starts[1:] + [None]):
+        first = bisect.bisect_left(frames, start)
+        last = bisect.bisect_left(frames, end) if end is not None else len(frames)
+        result.append((start, last - first))
+
+    return result
+
+
+def encode_segmented(input: AvFile, mapper, output: Path, *, segments: int = None, scheduler: JobScheduler = None,
+                     extra=None, tolerance: float = 0.5):
+    if scheduler is None:
+        scheduler = JobScheduler()
+    if segments is None:
+        segments = scheduler.max_jobs
+    if extra is None:
+        extra = tuple()
+
+    video = next(stream for stream in input.streams if isinstance(stream, VideoStream))
+    frames, keyframes = __packets(input, video)
+    # `-ss` counts from the start of the file, which a partial probe may not know: it is then taken as 0.
+    origin = input.start if input.start is not None else 0.0
+
+    with tempfile.TemporaryDirectory(prefix='.segments-', dir=output.parent) as directory:
+        directory = Path(directory)
+        parts = []
+
+        for i, (start, count) in enumerate(boundaries(frames, keyframes, segments)):
+            part = directory / f'{i:05}.mkv'
+            parts.append(part)
+            scheduler.submit(
+                ['-y', '-ss', seek_time(start - origin), '-i', str(input.path), '-frames:v', str(count),
+                 *mappings(input, lambda s: mapper(s) if s.index == video.index else None), str(part)],
+                title=f'Segment {i + 1}'
+            )
+
+        failed = False
+        try:
+            for job, event in scheduler.run():
+                yield job, event
+
+                if isinstance(event, ExitEvent) and event.code != 0 and not failed:
+                    failed = True
+                    scheduler.cancel()
+        finally:
+            # Segments still being written must be gone before their directory is removed.
+            if scheduler.running:
+                scheduler.cancel()
+                for _ in scheduler.run():
+                    pass
+
+        if failed:
+            return
+
+        playlist = directory / 'concat.txt'
+        playlist.write_text(''.join(f"file '{part.name}'\n" for part in parts), encoding='UTF-8')
+
+        # Audio, subtitles and everything else go through ffmpeg exactly once, next to the joined video.
+        job = Job([
+            '-f', 'concat', '-safe', '0', '-i', str(playlist), '-i', str(input.path),
+            '-map', '0:0', '-c:0', 'copy',
+            *mappings(input, lambda s: None if s.index == video.index else mapper(s), file=1, counter=1),
+            *extra, str(output)
+        ], title='Concat')
+
+        for event in run(list(job.args), loglevel='info', interval=0.5):
+            if isinstance(event, ExitEvent) and event.code == 0:
+                result = AvFile.from_path(output)
+                # A partial probe of the source may not know its duration, there is nothing to compare with then.
+                if input.duration is not None and abs(result.duration - input.duration) > tolerance:
+                    raise RuntimeError(
+                        f'Segmented encode of {input.path.name} lasts {result.duration}s, '
+                        f'but the source lasts {input.duration}s.'
+                    )
+
+            yield job, event
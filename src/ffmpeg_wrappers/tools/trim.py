@@ -0,0 +1,48 @@
+import math
+
+from pathlib import Path
+
+from ffmpeg_wrappers.core.avfile import AvFile, VideoStream
+from ffmpeg_wrappers.core.cache import ProbeCache
+from ffmpeg_wrappers.core.keyframes import seek_time
+from ffmpeg_wrappers.tools.generator import mappings
+
+
+def trim(input: AvFile, start: float | None, end: float, output: Path, *, encoder=None,
+         accurate: bool = True, cache: ProbeCache = None, tolerance: float = 0.001, extra=None) -> [str]:
+    if encoder is None:
+        encoder = ('libx264', {'crf': '18'})
+    if extra is None:
+        extra = tuple()
+    if not 0 <= (start or 0) < end:
+        raise ValueError(f'Invalid trim range: {start} - {end}')
+
+    # An open start keeps the file from its first frame, which a decoder can always start from: nothing to seek.
+    if start is None:
+        return '-i', str(input.path), '-t', seek_time(end), *mappings(input, lambda s: 'copy'), *extra, str(output)
+
+    video = next(stream for stream in input.streams if isinstance(stream, VideoStream))
+    index = input.keyframes(video.index, cache=cache)
+
+    # Keyframe times are presentation timestamps, while `-ss` counts from the start of the file, which a partial probe
+    # may not know: it is then taken as 0.
+    origin = input.start if input.start is not None else 0.0
+    time = origin + start
+    keyframe, _ = index.before(time + tolerance) or (origin, -1)
+    seek = keyframe - origin
+
+    if not accurate or index.contains(time, tolerance):
+        # ffmpeg backs input seeks off by 3/23s when a stream has delayed frames, so aim past the keyframe to
+        # still land on it, and never halfway to the next one.
+        following, _ = index.after(keyframe + tolerance) or (math.inf, -1)
+        seek += min(3 / 23 + tolerance, (following - keyframe) / 2)
+        return (
+            '-ss', seek_time(seek), '-i', str(input.path), '-t', seek_time(end - seek),
+            *mappings(input, lambda s: 'copy'), *extra, str(output)
+        )
+
+    # Only the video has to be decoded from the keyframe to land on the exact frame, everything else is copied.
+    return (
+        '-ss', seek_time(seek), '-i', str(input.path), '-ss', seek_time(start - seek), '-t', seek_time(end - start),
+        *mappings(input, lambda s: encoder if s.index == video.index else 'copy'), *extra, str(output)
+    )
@@ -1,5 +1,6 @@
 ﻿import textwrap
 from functools import cache
+from pathlib import Path
 
 
 @cache
@@ -33,6 +34,26 @@ def langs():
     return D
 
 
+def render() -> str:
+    # Source of `languages.py`, a literal table that costs nothing to load compared to parsing `get()` at runtime.
+    def table(name, column):
+        rows = ''.join(f'    {code!r}: {language[column]!r},\n' for code, language in langs().items())
+        return f'{name} = {{\n{rows}}}\n'
+
+    return (
+        '# Generated from ISO_639_2_UTF8.py by `python -m ffmpeg_wrappers.utils.ISO_639_2_UTF8`, do not edit.\n'
+        + table('ENGLISH', 'english') + '\n' + table('FRENCH', 'french')
+    )
+
+
+def generate(path: Path = Path(__file__).with_name('languages.py')) -> bool:
+    source = render()
+    if path.exists() and path.read_text(encoding='UTF-8') == source:
+        return False
+    path.write_text(source, encoding='UTF-8')
+    return True
+
+
 def get() -> str:
     return textwrap.dedent("""
         aar||aa|Afar|afar
@@ -523,3 +544,7 @@ def get() -> str:
         zxx|||No linguistic content; Not applicable|pas de contenu linguistique; non applicable
         zza|||Zaza; Dimili; Dimli; Kirdki; Kirmanjki; Zazaki|zaza; dimili; dimli; kirdki; kirmanjki; zazaki
     """)
+
+
+if __name__ == '__main__':
+    generate()
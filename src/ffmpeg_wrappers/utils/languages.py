@@ -0,0 +1,1388 @@
+# Generated from ISO_639_2_UTF8.py by `python -m ffmpeg_wrappers.utils.ISO_639_2_UTF8`, do not edit.
+ENGLISH = {
+    'aar': 'Afar',
+    'aa': 'Afar',
+    'abk': 'Abkhazian',
+    'ab': 'Abkhazian',
+    'ace': 'Achinese',
+    'ach': 'Acoli',
+    'ada': 'Adangme',
+    'ady': 'Adyghe; Adygei',
+    'afa': 'Afro-Asiatic languages',
+    'afh': 'Afrihili',
+    'afr': 'Afrikaans',
+    'af': 'Afrikaans',
+    'ain': 'Ainu',
+    'aka': 'Akan',
+    'ak': 'Akan',
+    'akk': 'Akkadian',
+    'alb': 'Albanian',
+    'sqi': 'Albanian',
+    'sq': 'Albanian',
+    'ale': 'Aleut',
+    'alg': 'Algonquian languages',
+    'alt': 'Southern Altai',
+    'amh': 'Amharic',
+    'am': 'Amharic',
+    'ang': 'English, Old (ca.450-1100)',
+    'anp': 'Angika',
+    'apa': 'Apache languages',
+    'ara': 'Arabic',
+    'ar': 'Arabic',
+    'arc': 'Official Aramaic (700-300 BCE); Imperial Aramaic (700-300 BCE)',
+    'arg': 'Aragonese',
+    'an': 'Aragonese',
+    'arm': 'Armenian',
+    'hye': 'Armenian',
+    'hy': 'Armenian',
+    'arn': 'Mapudungun; Mapuche',
+    'arp': 'Arapaho',
+    'art': 'Artificial languages',
+    'arw': 'Arawak',
+    'asm': 'Assamese',
+    'as': 'Assamese',
+    'ast': 'Asturian; Bable; Leonese; Asturleonese',
+    'ath': 'Athapascan languages',
+    'aus': 'Australian languages',
+    'ava': 'Avaric',
+    'av': 'Avaric',
+    'ave': 'Avestan',
+    'ae': 'Avestan',
+    'awa': 'Awadhi',
+    'aym': 'Aymara',
+    'ay': 'Aymara',
+    'aze': 'Azerbaijani',
+    'az': 'Azerbaijani',
+    'bad': 'Banda languages',
+    'bai': 'Bamileke languages',
+    'bak': 'Bashkir',
+    'ba': 'Bashkir',
+    'bal': 'Baluchi',
+    'bam': 'Bambara',
+    'bm': 'Bambara',
+    'ban': 'Balinese',
+    'baq': 'Basque',
+    'eus': 'Basque',
+    'eu': 'Basque',
+    'bas': 'Basa',
+    'bat': 'Baltic languages',
+    'bej': 'Beja; Bedawiyet',
+    'bel': 'Belarusian',
+    'be': 'Belarusian',
+    'bem': 'Bemba',
+    'ben': 'Bengali',
+    'bn': 'Bengali',
+    'ber': 'Berber languages',
+    'bho': 'Bhojpuri',
+    'bih': 'Bihari languages',
+    'bh': 'Bihari languages',
+    'bik': 'Bikol',
+    'bin': 'Bini; Edo',
+    'bis': 'Bislama',
+    'bi': 'Bislama',
+    'bla': 'Siksika',
+    'bnt': 'Bantu languages',
+    'bos': 'Bosnian',
+    'bs': 'Bosnian',
+    'bra': 'Braj',
+    'bre': 'Breton',
+    'br': 'Breton',
+    'btk': 'Batak languages',
+    'bua': 'Buriat',
+    'bug': 'Buginese',
+    'bul': 'Bulgarian',
+    'bg': 'Bulgarian',
+    'bur': 'Burmese',
+    'mya': 'Burmese',
+    'my': 'Burmese',
+    'byn': 'Blin; Bilin',
+    'cad': 'Caddo',
+    'cai': 'Central American Indian languages',
+    'car': 'Galibi Carib',
+    'cat': 'Catalan; Valencian',
+    'ca': 'Catalan; Valencian',
+    'cau': 'Caucasian languages',
+    'ceb': 'Cebuano',
+    'cel': 'Celtic languages',
+    'cha': 'Chamorro',
+    'ch': 'Chamorro',
+    'chb': 'Chibcha',
+    'che': 'Chechen',
+    'ce': 'Chechen',
+    'chg': 'Chagatai',
+    'chi': 'Chinese',
+    'zho': 'Chinese',
+    'zh': 'Chinese',
+    'chk': 'Chuukese',
+    'chm': 'Mari',
+    'chn': 'Chinook jargon',
+    'cho': 'Choctaw',
+    'chp': 'Chipewyan; Dene Suline',
+    'chr': 'Cherokee',
+    'chu': 'Church Slavic; Old Slavonic; Church Slavonic; Old Bulgarian; Old Church Slavonic',
+    'cu': 'Church Slavic; Old Slavonic; Church Slavonic; Old Bulgarian; Old Church Slavonic',
+    'chv': 'Chuvash',
+    'cv': 'Chuvash',
+    'chy': 'Cheyenne',
+    'cmc': 'Chamic languages',
+    'cnr': 'Montenegrin',
+    'cop': 'Coptic',
+    'cor': 'Cornish',
+    'kw': 'Cornish',
+    'cos': 'Corsican',
+    'co': 'Corsican',
+    'cpe': 'Creoles and pidgins, English based',
+    'cpf': 'Creoles and pidgins, French-based',
+    'cpp': 'Creoles and pidgins, Portuguese-based',
+    'cre': 'Cree',
+    'cr': 'Cree',
+    'crh': 'Crimean Tatar; Crimean Turkish',
+    'crp': 'Creoles and pidgins',
+    'csb': 'Kashubian',
+    'cus': 'Cushitic languages',
+    'cze': 'Czech',
+    'ces': 'Czech',
+    'cs': 'Czech',
+    'dak': 'Dakota',
+    'dan': 'Danish',
+    'da': 'Danish',
+    'dar': 'Dargwa',
+    'day': 'Land Dayak languages',
+    'del': 'Delaware',
+    'den': 'Slave (Athapascan)',
+    'dgr': 'Dogrib',
+    'din': 'Dinka',
+    'div': 'Divehi; Dhivehi; Maldivian',
+    'dv': 'Divehi; Dhivehi; Maldivian',
+    'doi': 'Dogri',
+    'dra': 'Dravidian languages',
+    'dsb': 'Lower Sorbian',
+    'dua': 'Duala',
+    'dum': 'Dutch, Middle (ca.1050-1350)',
+    'dut': 'Dutch; Flemish',
+    'nld': 'Dutch; Flemish',
+    'nl': 'Dutch; Flemish',
+    'dyu': 'Dyula',
+    'dzo': 'Dzongkha',
+    'dz': 'Dzongkha',
+    'efi': 'Efik',
+    'egy': 'Egyptian (Ancient)',
+    'eka': 'Ekajuk',
+    'elx': 'Elamite',
+    'eng': 'English',
+    'en': 'English',
+    'enm': 'English, Middle (1100-1500)',
+    'epo': 'Esperanto',
+    'eo': 'Esperanto',
+    'est': 'Estonian',
+    'et': 'Estonian',
+    'ewe': 'Ewe',
+    'ee': 'Ewe',
+    'ewo': 'Ewondo',
+    'fan': 'Fang',
+    'fao': 'Faroese',
+    'fo': 'Faroese',
+    'fat': 'Fanti',
+    'fij': 'Fijian',
+    'fj': 'Fijian',
+    'fil': 'Filipino; Pilipino',
+    'fin': 'Finnish',
+    'fi': 'Finnish',
+    'fiu': 'Finno-Ugrian languages',
+    'fon': 'Fon',
+    'fre': 'French',
+    'fra': 'French',
+    'fr': 'French',
+    'frm': 'French, Middle (ca.1400-1600)',
+    'fro': 'French, Old (842-ca.1400)',
+    'frr': 'Northern Frisian',
+    'frs': 'Eastern Frisian',
+    'fry': 'Western Frisian',
+    'fy': 'Western Frisian',
+    'ful': 'Fulah',
+    'ff': 'Fulah',
+    'fur': 'Friulian',
+    'gaa': 'Ga',
+    'gay': 'Gayo',
+    'gba': 'Gbaya',
+    'gem': 'Germanic languages',
+    'geo': 'Georgian',
+    'kat': 'Georgian',
+    'ka': 'Georgian',
+    'ger': 'German',
+    'deu': 'German',
+    'de': 'German',
+    'gez': 'Geez',
+    'gil': 'Gilbertese',
+    'gla': 'Gaelic; Scottish Gaelic',
+    'gd': 'Gaelic; Scottish Gaelic',
+    'gle': 'Irish',
+    'ga': 'Irish',
+    'glg': 'Galician',
+    'gl': 'Galician',
+    'glv': 'Manx',
+    'gv': 'Manx',
+    'gmh': 'German, Middle High (ca.1050-1500)',
+    'goh': 'German, Old High (ca.750-1050)',
+    'gon': 'Gondi',
+    'gor': 'Gorontalo',
+    'got': 'Gothic',
+    'grb': 'Grebo',
+    'grc': 'Greek, Ancient (to 1453)',
+    'gre': 'Greek, Modern (1453-)',
+    'ell': 'Greek, Modern (1453-)',
+    'el': 'Greek, Modern (1453-)',
+    'grn': 'Guarani',
+    'gn': 'Guarani',
+    'gsw': 'Swiss German; Alemannic; Alsatian',
+    'guj': 'Gujarati',
+    'gu': 'Gujarati',
+    'gwi': "Gwich'in",
+    'hai': 'Haida',
+    'hat': 'Haitian; Haitian Creole',
+    'ht': 'Haitian; Haitian Creole',
+    'hau': 'Hausa',
+    'ha': 'Hausa',
+    'haw': 'Hawaiian',
+    'heb': 'Hebrew',
+    'he': 'Hebrew',
+    'her': 'Herero',
+    'hz': 'Herero',
+    'hil': 'Hiligaynon',
+    'him': 'Himachali languages; Western Pahari languages',
+    'hin': 'Hindi',
+    'hi': 'Hindi',
+    'hit': 'Hittite',
+    'hmn': 'Hmong; Mong',
+    'hmo': 'Hiri Motu',
+    'ho': 'Hiri Motu',
+    'hrv': 'Croatian',
+    'hr': 'Croatian',
+    'hsb': 'Upper Sorbian',
+    'hun': 'Hungarian',
+    'hu': 'Hungarian',
+    'hup': 'Hupa',
+    'iba': 'Iban',
+    'ibo': 'Igbo',
+    'ig': 'Igbo',
+    'ice': 'Icelandic',
+    'isl': 'Icelandic',
+    'is': 'Icelandic',
+    'ido': 'Ido',
+    'io': 'Ido',
+    'iii': 'Sichuan Yi; Nuosu',
+    'ii': 'Sichuan Yi; Nuosu',
+    'ijo': 'Ijo languages',
+    'iku': 'Inuktitut',
+    'iu': 'Inuktitut',
+    'ile': 'Interlingue; Occidental',
+    'ie': 'Interlingue; Occidental',
+    'ilo': 'Iloko',
+    'ina': 'Interlingua (International Auxiliary Language Association)',
+    'ia': 'Interlingua (International Auxiliary Language Association)',
+    'inc': 'Indic languages',
+    'ind': 'Indonesian',
+    'id': 'Indonesian',
+    'ine': 'Indo-European languages',
+    'inh': 'Ingush',
+    'ipk': 'Inupiaq',
+    'ik': 'Inupiaq',
+    'ira': 'Iranian languages',
+    'iro': 'Iroquoian languages',
+    'ita': 'Italian',
+    'it': 'Italian',
+    'jav': 'Javanese',
+    'jv': 'Javanese',
+    'jbo': 'Lojban',
+    'jpn': 'Japanese',
+    'ja': 'Japanese',
+    'jpr': 'Judeo-Persian',
+    'jrb': 'Judeo-Arabic',
+    'kaa': 'Kara-Kalpak',
+    'kab': 'Kabyle',
+    'kac': 'Kachin; Jingpho',
+    'kal': 'Kalaallisut; Greenlandic',
+    'kl': 'Kalaallisut; Greenlandic',
+    'kam': 'Kamba',
+    'kan': 'Kannada',
+    'kn': 'Kannada',
+    'kar': 'Karen languages',
+    'kas': 'Kashmiri',
+    'ks': 'Kashmiri',
+    'kau': 'Kanuri',
+    'kr': 'Kanuri',
+    'kaw': 'Kawi',
+    'kaz': 'Kazakh',
+    'kk': 'Kazakh',
+    'kbd': 'Kabardian',
+    'kha': 'Khasi',
+    'khi': 'Khoisan languages',
+    'khm': 'Central Khmer',
+    'km': 'Central Khmer',
+    'kho': 'Khotanese; Sakan',
+    'kik': 'Kikuyu; Gikuyu',
+    'ki': 'Kikuyu; Gikuyu',
+    'kin': 'Kinyarwanda',
+    'rw': 'Kinyarwanda',
+    'kir': 'Kirghiz; Kyrgyz',
+    'ky': 'Kirghiz; Kyrgyz',
+    'kmb': 'Kimbundu',
+    'kok': 'Konkani',
+    'kom': 'Komi',
+    'kv': 'Komi',
+    'kon': 'Kongo',
+    'kg': 'Kongo',
+    'kor': 'Korean',
+    'ko': 'Korean',
+    'kos': 'Kosraean',
+    'kpe': 'Kpelle',
+    'krc': 'Karachay-Balkar',
+    'krl': 'Karelian',
+    'kro': 'Kru languages',
+    'kru': 'Kurukh',
+    'kua': 'Kuanyama; Kwanyama',
+    'kj': 'Kuanyama; Kwanyama',
+    'kum': 'Kumyk',
+    'kur': 'Kurdish',
+    'ku': 'Kurdish',
+    'kut': 'Kutenai',
+    'lad': 'Ladino',
+    'lah': 'Lahnda',
+    'lam': 'Lamba',
+    'lao': 'Lao',
+    'lo': 'Lao',
+    'lat': 'Latin',
+    'la': 'Latin',
+    'lav': 'Latvian',
+    'lv': 'Latvian',
+    'lez': 'Lezghian',
+    'lim': 'Limburgan; Limburger; Limburgish',
+    'li': 'Limburgan; Limburger; Limburgish',
+    'lin': 'Lingala',
+    'ln': 'Lingala',
+    'lit': 'Lithuanian',
+    'lt': 'Lithuanian',
+    'lol': 'Mongo',
+    'loz': 'Lozi',
+    'ltz': 'Luxembourgish; Letzeburgesch',
+    'lb': 'Luxembourgish; Letzeburgesch',
+    'lua': 'Luba-Lulua',
+    'lub': 'Luba-Katanga',
+    'lu': 'Luba-Katanga',
+    'lug': 'Ganda',
+    'lg': 'Ganda',
+    'lui': 'Luiseno',
+    'lun': 'Lunda',
+    'luo': 'Luo (Kenya and Tanzania)',
+    'lus': 'Lushai',
+    'mac': 'Macedonian',
+    'mkd': 'Macedonian',
+    'mk': 'Macedonian',
+    'mad': 'Madurese',
+    'mag': 'Magahi',
+    'mah': 'Marshallese',
+    'mh': 'Marshallese',
+    'mai': 'Maithili',
+    'mak': 'Makasar',
+    'mal': 'Malayalam',
+    'ml': 'Malayalam',
+    'man': 'Mandingo',
+    'mao': 'Maori',
+    'mri': 'Maori',
+    'mi': 'Maori',
+    'map': 'Austronesian languages',
+    'mar': 'Marathi',
+    'mr': 'Marathi',
+    'mas': 'Masai',
+    'may': 'Malay',
+    'msa': 'Malay',
+    'ms': 'Malay',
+    'mdf': 'Moksha',
+    'mdr': 'Mandar',
+    'men': 'Mende',
+    'mga': 'Irish, Middle (900-1200)',
+    'mic': "Mi'kmaq; Micmac",
+    'min': 'Minangkabau',
+    'mis': 'Uncoded languages',
+    'mkh': 'Mon-Khmer languages',
+    'mlg': 'Malagasy',
+    'mg': 'Malagasy',
+    'mlt': 'Maltese',
+    'mt': 'Maltese',
+    'mnc': 'Manchu',
+    'mni': 'Manipuri',
+    'mno': 'Manobo languages',
+    'moh': 'Mohawk',
+    'mon': 'Mongolian',
+    'mn': 'Mongolian',
+    'mos': 'Mossi',
+    'mul': 'Multiple languages',
+    'mun': 'Munda languages',
+    'mus': 'Creek',
+    'mwl': 'Mirandese',
+    'mwr': 'Marwari',
+    'myn': 'Mayan languages',
+    'myv': 'Erzya',
+    'nah': 'Nahuatl languages',
+    'nai': 'North American Indian languages',
+    'nap': 'Neapolitan',
+    'nau': 'Nauru',
+    'na': 'Nauru',
+    'nav': 'Navajo; Navaho',
+    'nv': 'Navajo; Navaho',
+    'nbl': 'Ndebele, South; South Ndebele',
+    'nr': 'Ndebele, South; South Ndebele',
+    'nde': 'Ndebele, North; North Ndebele',
+    'nd': 'Ndebele, North; North Ndebele',
+    'ndo': 'Ndonga',
+    'ng': 'Ndonga',
+    'nds': 'Low German; Low Saxon; German, Low; Saxon, Low',
+    'nep': 'Nepali',
+    'ne': 'Nepali',
+    'new': 'Nepal Bhasa; Newari',
+    'nia': 'Nias',
+    'nic': 'Niger-Kordofanian languages',
+    'niu': 'Niuean',
+    'nno': 'Norwegian Nynorsk; Nynorsk, Norwegian',
+    'nn': 'Norwegian Nynorsk; Nynorsk, Norwegian',
+    'nob': 'Bokmål, Norwegian; Norwegian Bokmål',
+    'nb': 'Bokmål, Norwegian; Norwegian Bokmål',
+    'nog': 'Nogai',
+    'non': 'Norse, Old',
+    'nor': 'Norwegian',
+    'no': 'Norwegian',
+    'nqo': "N'Ko",
+    'nso': 'Pedi; Sepedi; Northern Sotho',
+    'nub': 'Nubian languages',
+    'nwc': 'Classical Newari; Old Newari; Classical Nepal Bhasa',
+    'nya': 'Chichewa; Chewa; Nyanja',
+    'ny': 'Chichewa; Chewa; Nyanja',
+    'nym': 'Nyamwezi',
+    'nyn': 'Nyankole',
+    'nyo': 'Nyoro',
+    'nzi': 'Nzima',
+    'oci': 'Occitan (post 1500)',
+    'oc': 'Occitan (post 1500)',
+    'oji': 'Ojibwa',
+    'oj': 'Ojibwa',
+    'ori': 'Oriya',
+    'or': 'Oriya',
+    'orm': 'Oromo',
+    'om': 'Oromo',
+    'osa': 'Osage',
+    'oss': 'Ossetian; Ossetic',
+    'os': 'Ossetian; Ossetic',
+    'ota': 'Turkish, Ottoman (1500-1928)',
+    'oto': 'Otomian languages',
+    'paa': 'Papuan languages',
+    'pag': 'Pangasinan',
+    'pal': 'Pahlavi',
+    'pam': 'Pampanga; Kapampangan',
+    'pan': 'Panjabi; Punjabi',
+    'pa': 'Panjabi; Punjabi',
+    'pap': 'Papiamento',
+    'pau': 'Palauan',
+    'peo': 'Persian, Old (ca.600-400 B.C.)',
+    'per': 'Persian',
+    'fas': 'Persian',
+    'fa': 'Persian',
+    'phi': 'Philippine languages',
+    'phn': 'Phoenician',
+    'pli': 'Pali',
+    'pi': 'Pali',
+    'pol': 'Polish',
+    'pl': 'Polish',
+    'pon': 'Pohnpeian',
+    'por': 'Portuguese',
+    'pt': 'Portuguese',
+    'pra': 'Prakrit languages',
+    'pro': 'Provençal, Old (to 1500); Occitan, Old (to 1500)',
+    'pus': 'Pushto; Pashto',
+    'ps': 'Pushto; Pashto',
+    'qaa-qtz': 'Reserved for local use',
+    'que': 'Quechua',
+    'qu': 'Quechua',
+    'raj': 'Rajasthani',
+    'rap': 'Rapanui',
+    'rar': 'Rarotongan; Cook Islands Maori',
+    'roa': 'Romance languages',
+    'roh': 'Romansh',
+    'rm': 'Romansh',
+    'rom': 'Romany',
+    'rum': 'Romanian; Moldavian; Moldovan',
+    'ron': 'Romanian; Moldavian; Moldovan',
+    'ro': 'Romanian; Moldavian; Moldovan',
+    'run': 'Rundi',
+    'rn': 'Rundi',
+    'rup': 'Aromanian; Arumanian; Macedo-Romanian',
+    'rus': 'Russian',
+    'ru': 'Russian',
+    'sad': 'Sandawe',
+    'sag': 'Sango',
+    'sg': 'Sango',
+    'sah': 'Yakut',
+    'sai': 'South American Indian languages',
+    'sal': 'Salishan languages',
+    'sam': 'Samaritan Aramaic',
+    'san': 'Sanskrit',
+    'sa': 'Sanskrit',
+    'sas': 'Sasak',
+    'sat': 'Santali',
+    'scn': 'Sicilian',
+    'sco': 'Scots',
+    'sel': 'Selkup',
+    'sem': 'Semitic languages',
+    'sga': 'Irish, Old (to 900)',
+    'sgn': 'Sign Languages',
+    'shn': 'Shan',
+    'sid': 'Sidamo',
+    'sin': 'Sinhala; Sinhalese',
+    'si': 'Sinhala; Sinhalese',
+    'sio': 'Siouan languages',
+    'sit': 'Sino-Tibetan languages',
+    'sla': 'Slavic languages',
+    'slo': 'Slovak',
+    'slk': 'Slovak',
+    'sk': 'Slovak',
+    'slv': 'Slovenian',
+    'sl': 'Slovenian',
+    'sma': 'Southern Sami',
+    'sme': 'Northern Sami',
+    'se': 'Northern Sami',
+    'smi': 'Sami languages',
+    'smj': 'Lule Sami',
+    'smn': 'Inari Sami',
+    'smo': 'Samoan',
+    'sm': 'Samoan',
+    'sms': 'Skolt Sami',
+    'sna': 'Shona',
+    'sn': 'Shona',
+    'snd': 'Sindhi',
+    'sd': 'Sindhi',
+    'snk': 'Soninke',
+    'sog': 'Sogdian',
+    'som': 'Somali',
+    'so': 'Somali',
+    'son': 'Songhai languages',
+    'sot': 'Sotho, Southern',
+    'st': 'Sotho, Southern',
+    'spa': 'Spanish; Castilian',
+    'es': 'Spanish; Castilian',
+    'srd': 'Sardinian',
+    'sc': 'Sardinian',
+    'srn': 'Sranan Tongo',
+    'srp': 'Serbian',
+    'sr': 'Serbian',
+    'srr': 'Serer',
+    'ssa': 'Nilo-Saharan languages',
+    'ssw': 'Swati',
+    'ss': 'Swati',
+    'suk': 'Sukuma',
+    'sun': 'Sundanese',
+    'su': 'Sundanese',
+    'sus': 'Susu',
+    'sux': 'Sumerian',
+    'swa': 'Swahili',
+    'sw': 'Swahili',
+    'swe': 'Swedish',
+    'sv': 'Swedish',
+    'syc': 'Classical Syriac',
+    'syr': 'Syriac',
+    'tah': 'Tahitian',
+    'ty': 'Tahitian',
+    'tai': 'Tai languages',
+    'tam': 'Tamil',
+    'ta': 'Tamil',
+    'tat': 'Tatar',
+    'tt': 'Tatar',
+    'tel': 'Telugu',
+    'te': 'Telugu',
+    'tem': 'Timne',
+    'ter': 'Tereno',
+    'tet': 'Tetum',
+    'tgk': 'Tajik',
+    'tg': 'Tajik',
+    'tgl': 'Tagalog',
+    'tl': 'Tagalog',
+    'tha': 'Thai',
+    'th': 'Thai',
+    'tib': 'Tibetan',
+    'bod': 'Tibetan',
+    'bo': 'Tibetan',
+    'tig': 'Tigre',
+    'tir': 'Tigrinya',
+    'ti': 'Tigrinya',
+    'tiv': 'Tiv',
+    'tkl': 'Tokelau',
+    'tlh': 'Klingon; tlhIngan-Hol',
+    'tli': 'Tlingit',
+    'tmh': 'Tamashek',
+    'tog': 'Tonga (Nyasa)',
+    'ton': 'Tonga (Tonga Islands)',
+    'to': 'Tonga (Tonga Islands)',
+    'tpi': 'Tok Pisin',
+    'tsi': 'Tsimshian',
+    'tsn': 'Tswana',
+    'tn': 'Tswana',
+    'tso': 'Tsonga',
+    'ts': 'Tsonga',
+    'tuk': 'Turkmen',
+    'tk': 'Turkmen',
+    'tum': 'Tumbuka',
+    'tup': 'Tupi languages',
+    'tur': 'Turkish',
+    'tr': 'Turkish',
+    'tut': 'Altaic languages',
+    'tvl': 'Tuvalu',
+    'twi': 'Twi',
+    'tw': 'Twi',
+    'tyv': 'Tuvinian',
+    'udm': 'Udmurt',
+    'uga': 'Ugaritic',
+    'uig': 'Uighur; Uyghur',
+    'ug': 'Uighur; Uyghur',
+    'ukr': 'Ukrainian',
+    'uk': 'Ukrainian',
+    'umb': 'Umbundu',
+    'und': 'Undetermined',
+    'urd': 'Urdu',
+    'ur': 'Urdu',
+    'uzb': 'Uzbek',
+    'uz': 'Uzbek',
+    'vai': 'Vai',
+    'ven': 'Venda',
+    've': 'Venda',
+    'vie': 'Vietnamese',
+    'vi': 'Vietnamese',
+    'vol': 'Volapük',
+    'vo': 'Volapük',
+    'vot': 'Votic',
+    'wak': 'Wakashan languages',
+    'wal': 'Wolaitta; Wolaytta',
+    'war': 'Waray',
+    'was': 'Washo',
+    'wel': 'Welsh',
+    'cym': 'Welsh',
+    'cy': 'Welsh',
+    'wen': 'Sorbian languages',
+    'wln': 'Walloon',
+    'wa': 'Walloon',
+    'wol': 'Wolof',
+    'wo': 'Wolof',
+    'xal': 'Kalmyk; Oirat',
+    'xho': 'Xhosa',
+    'xh': 'Xhosa',
+    'yao': 'Yao',
+    'yap': 'Yapese',
+    'yid': 'Yiddish',
+    'yi': 'Yiddish',
+    'yor': 'Yoruba',
+    'yo': 'Yoruba',
+    'ypk': 'Yupik languages',
+    'zap': 'Zapotec',
+    'zbl': 'Blissymbols; Blissymbolics; Bliss',
+    'zen': 'Zenaga',
+    'zgh': 'Standard Moroccan Tamazight',
+    'zha': 'Zhuang; Chuang',
+    'za': 'Zhuang; Chuang',
+    'znd': 'Zande languages',
+    'zul': 'Zulu',
+    'zu': 'Zulu',
+    'zun': 'Zuni',
+    'zxx': 'No linguistic content; Not applicable',
+    'zza': 'Zaza; Dimili; Dimli; Kirdki; Kirmanjki; Zazaki',
+}
+
+FRENCH = {
+    'aar': 'afar',
+    'aa': 'afar',
+    'abk': 'abkhaze',
+    'ab': 'abkhaze',
+    'ace': 'aceh',
+    'ach': 'acoli',
+    'ada': 'adangme',
+    'ady': 'adyghé',
+    'afa': 'afro-asiatiques, langues',
+    'afh': 'afrihili',
+    'afr': 'afrikaans',
+    'af': 'afrikaans',
+    'ain': 'aïnou',
+    'aka': 'akan',
+    'ak': 'akan',
+    'akk': 'akkadien',
+    'alb': 'albanais',
+    'sqi': 'albanais',
+    'sq': 'albanais',
+    'ale': 'aléoute',
+    'alg': 'algonquines, langues',
+    'alt': 'altai du Sud',
+    'amh': 'amharique',
+    'am': 'amharique',
+    'ang': 'anglo-saxon (ca.450-1100)',
+    'anp': 'angika',
+    'apa': 'apaches, langues',
+    'ara': 'arabe',
+    'ar': 'arabe',
+    'arc': "araméen d'empire (700-300 BCE)",
+    'arg': 'aragonais',
+    'an': 'aragonais',
+    'arm': 'arménien',
+    'hye': 'arménien',
+    'hy': 'arménien',
+    'arn': 'mapudungun; mapuche; mapuce',
+    'arp': 'arapaho',
+    'art': 'artificielles, langues',
+    'arw': 'arawak',
+    'asm': 'assamais',
+    'as': 'assamais',
+    'ast': 'asturien; bable; léonais; asturoléonais',
+    'ath': 'athapascanes, langues',
+    'aus': 'australiennes, langues',
+    'ava': 'avar',
+    'av': 'avar',
+    'ave': 'avestique',
+    'ae': 'avestique',
+    'awa': 'awadhi',
+    'aym': 'aymara',
+    'ay': 'aymara',
+    'aze': 'azéri',
+    'az': 'azéri',
+    'bad': 'banda, langues',
+    'bai': 'bamiléké, langues',
+    'bak': 'bachkir',
+    'ba': 'bachkir',
+    'bal': 'baloutchi',
+    'bam': 'bambara',
+    'bm': 'bambara',
+    'ban': 'balinais',
+    'baq': 'basque',
+    'eus': 'basque',
+    'eu': 'basque',
+    'bas': 'basa',
+    'bat': 'baltes, langues',
+    'bej': 'bedja',
+    'bel': 'biélorusse',
+    'be': 'biélorusse',
+    'bem': 'bemba',
+    'ben': 'bengali',
+    'bn': 'bengali',
+    'ber': 'berbères, langues',
+    'bho': 'bhojpuri',
+    'bih': 'langues biharis',
+    'bh': 'langues biharis',
+    'bik': 'bikol',
+    'bin': 'bini; edo',
+    'bis': 'bichlamar',
+    'bi': 'bichlamar',
+    'bla': 'blackfoot',
+    'bnt': 'bantou, langues',
+    'bos': 'bosniaque',
+    'bs': 'bosniaque',
+    'bra': 'braj',
+    'bre': 'breton',
+    'br': 'breton',
+    'btk': 'batak, langues',
+    'bua': 'bouriate',
+    'bug': 'bugi',
+    'bul': 'bulgare',
+    'bg': 'bulgare',
+    'bur': 'birman',
+    'mya': 'birman',
+    'my': 'birman',
+    'byn': 'blin; bilen',
+    'cad': 'caddo',
+    'cai': "amérindiennes de L'Amérique centrale, langues",
+    'car': 'karib; galibi; carib',
+    'cat': 'catalan; valencien',
+    'ca': 'catalan; valencien',
+    'cau': 'caucasiennes, langues',
+    'ceb': 'cebuano',
+    'cel': 'celtiques, langues; celtes, langues',
+    'cha': 'chamorro',
+    'ch': 'chamorro',
+    'chb': 'chibcha',
+    'che': 'tchétchène',
+    'ce': 'tchétchène',
+    'chg': 'djaghataï',
+    'chi': 'chinois',
+    'zho': 'chinois',
+    'zh': 'chinois',
+    'chk': 'chuuk',
+    'chm': 'mari',
+    'chn': 'chinook, jargon',
+    'cho': 'choctaw',
+    'chp': 'chipewyan',
+    'chr': 'cherokee',
+    'chu': "slavon d'église; vieux slave; slavon liturgique; vieux bulgare",
+    'cu': "slavon d'église; vieux slave; slavon liturgique; vieux bulgare",
+    'chv': 'tchouvache',
+    'cv': 'tchouvache',
+    'chy': 'cheyenne',
+    'cmc': 'chames, langues',
+    'cnr': 'monténégrin',
+    'cop': 'copte',
+    'cor': 'cornique',
+    'kw': 'cornique',
+    'cos': 'corse',
+    'co': 'corse',
+    'cpe': "créoles et pidgins basés sur l'anglais",
+    'cpf': 'créoles et pidgins basés sur le français',
+    'cpp': 'créoles et pidgins basés sur le portugais',
+    'cre': 'cree',
+    'cr': 'cree',
+    'crh': 'tatar de Crimé',
+    'crp': 'créoles et pidgins',
+    'csb': 'kachoube',
+    'cus': 'couchitiques, langues',
+    'cze': 'tchèque',
+    'ces': 'tchèque',
+    'cs': 'tchèque',
+    'dak': 'dakota',
+    'dan': 'danois',
+    'da': 'danois',
+    'dar': 'dargwa',
+    'day': 'dayak, langues',
+    'del': 'delaware',
+    'den': 'esclave (athapascan)',
+    'dgr': 'dogrib',
+    'din': 'dinka',
+    'div': 'maldivien',
+    'dv': 'maldivien',
+    'doi': 'dogri',
+    'dra': 'dravidiennes, langues',
+    'dsb': 'bas-sorabe',
+    'dua': 'douala',
+    'dum': 'néerlandais moyen (ca. 1050-1350)',
+    'dut': 'néerlandais; flamand',
+    'nld': 'néerlandais; flamand',
+    'nl': 'néerlandais; flamand',
+    'dyu': 'dioula',
+    'dzo': 'dzongkha',
+    'dz': 'dzongkha',
+    'efi': 'efik',
+    'egy': 'égyptien',
+    'eka': 'ekajuk',
+    'elx': 'élamite',
+    'eng': 'anglais',
+    'en': 'anglais',
+    'enm': 'anglais moyen (1100-1500)',
+    'epo': 'espéranto',
+    'eo': 'espéranto',
+    'est': 'estonien',
+    'et': 'estonien',
+    'ewe': 'éwé',
+    'ee': 'éwé',
+    'ewo': 'éwondo',
+    'fan': 'fang',
+    'fao': 'féroïen',
+    'fo': 'féroïen',
+    'fat': 'fanti',
+    'fij': 'fidjien',
+    'fj': 'fidjien',
+    'fil': 'filipino; pilipino',
+    'fin': 'finnois',
+    'fi': 'finnois',
+    'fiu': 'finno-ougriennes, langues',
+    'fon': 'fon',
+    'fre': 'français',
+    'fra': 'français',
+    'fr': 'français',
+    'frm': 'français moyen (1400-1600)',
+    'fro': 'français ancien (842-ca.1400)',
+    'frr': 'frison septentrional',
+    'frs': 'frison oriental',
+    'fry': 'frison occidental',
+    'fy': 'frison occidental',
+    'ful': 'peul',
+    'ff': 'peul',
+    'fur': 'frioulan',
+    'gaa': 'ga',
+    'gay': 'gayo',
+    'gba': 'gbaya',
+    'gem': 'germaniques, langues',
+    'geo': 'géorgien',
+    'kat': 'géorgien',
+    'ka': 'géorgien',
+    'ger': 'allemand',
+    'deu': 'allemand',
+    'de': 'allemand',
+    'gez': 'guèze',
+    'gil': 'kiribati',
+    'gla': 'gaélique; gaélique écossais',
+    'gd': 'gaélique; gaélique écossais',
+    'gle': 'irlandais',
+    'ga': 'irlandais',
+    'glg': 'galicien',
+    'gl': 'galicien',
+    'glv': 'manx; mannois',
+    'gv': 'manx; mannois',
+    'gmh': 'allemand, moyen haut (ca. 1050-1500)',
+    'goh': 'allemand, vieux haut (ca. 750-1050)',
+    'gon': 'gond',
+    'gor': 'gorontalo',
+    'got': 'gothique',
+    'grb': 'grebo',
+    'grc': "grec ancien (jusqu'à 1453)",
+    'gre': 'grec moderne (après 1453)',
+    'ell': 'grec moderne (après 1453)',
+    'el': 'grec moderne (après 1453)',
+    'grn': 'guarani',
+    'gn': 'guarani',
+    'gsw': 'suisse alémanique; alémanique; alsacien',
+    'guj': 'goudjrati',
+    'gu': 'goudjrati',
+    'gwi': "gwich'in",
+    'hai': 'haida',
+    'hat': 'haïtien; créole haïtien',
+    'ht': 'haïtien; créole haïtien',
+    'hau': 'haoussa',
+    'ha': 'haoussa',
+    'haw': 'hawaïen',
+    'heb': 'hébreu',
+    'he': 'hébreu',
+    'her': 'herero',
+    'hz': 'herero',
+    'hil': 'hiligaynon',
+    'him': 'langues himachalis; langues paharis occidentales',
+    'hin': 'hindi',
+    'hi': 'hindi',
+    'hit': 'hittite',
+    'hmn': 'hmong',
+    'hmo': 'hiri motu',
+    'ho': 'hiri motu',
+    'hrv': 'croate',
+    'hr': 'croate',
+    'hsb': 'haut-sorabe',
+    'hun': 'hongrois',
+    'hu': 'hongrois',
+    'hup': 'hupa',
+    'iba': 'iban',
+    'ibo': 'igbo',
+    'ig': 'igbo',
+    'ice': 'islandais',
+    'isl': 'islandais',
+    'is': 'islandais',
+    'ido': 'ido',
+    'io': 'ido',
+    'iii': 'yi de Sichuan',
+    'ii': 'yi de Sichuan',
+    'ijo': 'ijo, langues',
+    'iku': 'inuktitut',
+    'iu': 'inuktitut',
+    'ile': 'interlingue',
+    'ie': 'interlingue',
+    'ilo': 'ilocano',
+    'ina': 'interlingua (langue auxiliaire internationale)',
+    'ia': 'interlingua (langue auxiliaire internationale)',
+    'inc': 'indo-aryennes, langues',
+    'ind': 'indonésien',
+    'id': 'indonésien',
+    'ine': 'indo-européennes, langues',
+    'inh': 'ingouche',
+    'ipk': 'inupiaq',
+    'ik': 'inupiaq',
+    'ira': 'iraniennes, langues',
+    'iro': 'iroquoises, langues',
+    'ita': 'italien',
+    'it': 'italien',
+    'jav': 'javanais',
+    'jv': 'javanais',
+    'jbo': 'lojban',
+    'jpn': 'japonais',
+    'ja': 'japonais',
+    'jpr': 'judéo-persan',
+    'jrb': 'judéo-arabe',
+    'kaa': 'karakalpak',
+    'kab': 'kabyle',
+    'kac': 'kachin; jingpho',
+    'kal': 'groenlandais',
+    'kl': 'groenlandais',
+    'kam': 'kamba',
+    'kan': 'kannada',
+    'kn': 'kannada',
+    'kar': 'karen, langues',
+    'kas': 'kashmiri',
+    'ks': 'kashmiri',
+    'kau': 'kanouri',
+    'kr': 'kanouri',
+    'kaw': 'kawi',
+    'kaz': 'kazakh',
+    'kk': 'kazakh',
+    'kbd': 'kabardien',
+    'kha': 'khasi',
+    'khi': 'khoïsan, langues',
+    'khm': 'khmer central',
+    'km': 'khmer central',
+    'kho': 'khotanais; sakan',
+    'kik': 'kikuyu',
+    'ki': 'kikuyu',
+    'kin': 'rwanda',
+    'rw': 'rwanda',
+    'kir': 'kirghiz',
+    'ky': 'kirghiz',
+    'kmb': 'kimbundu',
+    'kok': 'konkani',
+    'kom': 'kom',
+    'kv': 'kom',
+    'kon': 'kongo',
+    'kg': 'kongo',
+    'kor': 'coréen',
+    'ko': 'coréen',
+    'kos': 'kosrae',
+    'kpe': 'kpellé',
+    'krc': 'karatchai balkar',
+    'krl': 'carélien',
+    'kro': 'krou, langues',
+    'kru': 'kurukh',
+    'kua': 'kuanyama; kwanyama',
+    'kj': 'kuanyama; kwanyama',
+    'kum': 'koumyk',
+    'kur': 'kurde',
+    'ku': 'kurde',
+    'kut': 'kutenai',
+    'lad': 'judéo-espagnol',
+    'lah': 'lahnda',
+    'lam': 'lamba',
+    'lao': 'lao',
+    'lo': 'lao',
+    'lat': 'latin',
+    'la': 'latin',
+    'lav': 'letton',
+    'lv': 'letton',
+    'lez': 'lezghien',
+    'lim': 'limbourgeois',
+    'li': 'limbourgeois',
+    'lin': 'lingala',
+    'ln': 'lingala',
+    'lit': 'lituanien',
+    'lt': 'lituanien',
+    'lol': 'mongo',
+    'loz': 'lozi',
+    'ltz': 'luxembourgeois',
+    'lb': 'luxembourgeois',
+    'lua': 'luba-lulua',
+    'lub': 'luba-katanga',
+    'lu': 'luba-katanga',
+    'lug': 'ganda',
+    'lg': 'ganda',
+    'lui': 'luiseno',
+    'lun': 'lunda',
+    'luo': 'luo (Kenya et Tanzanie)',
+    'lus': 'lushai',
+    'mac': 'macédonien',
+    'mkd': 'macédonien',
+    'mk': 'macédonien',
+    'mad': 'madourais',
+    'mag': 'magahi',
+    'mah': 'marshall',
+    'mh': 'marshall',
+    'mai': 'maithili',
+    'mak': 'makassar',
+    'mal': 'malayalam',
+    'ml': 'malayalam',
+    'man': 'mandingue',
+    'mao': 'maori',
+    'mri': 'maori',
+    'mi': 'maori',
+    'map': 'austronésiennes, langues',
+    'mar': 'marathe',
+    'mr': 'marathe',
+    'mas': 'massaï',
+    'may': 'malais',
+    'msa': 'malais',
+    'ms': 'malais',
+    'mdf': 'moksa',
+    'mdr': 'mandar',
+    'men': 'mendé',
+    'mga': 'irlandais moyen (900-1200)',
+    'mic': "mi'kmaq; micmac",
+    'min': 'minangkabau',
+    'mis': 'langues non codées',
+    'mkh': 'môn-khmer, langues',
+    'mlg': 'malgache',
+    'mg': 'malgache',
+    'mlt': 'maltais',
+    'mt': 'maltais',
+    'mnc': 'mandchou',
+    'mni': 'manipuri',
+    'mno': 'manobo, langues',
+    'moh': 'mohawk',
+    'mon': 'mongol',
+    'mn': 'mongol',
+    'mos': 'moré',
+    'mul': 'multilingue',
+    'mun': 'mounda, langues',
+    'mus': 'muskogee',
+    'mwl': 'mirandais',
+    'mwr': 'marvari',
+    'myn': 'maya, langues',
+    'myv': 'erza',
+    'nah': 'nahuatl, langues',
+    'nai': 'nord-amérindiennes, langues',
+    'nap': 'napolitain',
+    'nau': 'nauruan',
+    'na': 'nauruan',
+    'nav': 'navaho',
+    'nv': 'navaho',
+    'nbl': 'ndébélé du Sud',
+    'nr': 'ndébélé du Sud',
+    'nde': 'ndébélé du Nord',
+    'nd': 'ndébélé du Nord',
+    'ndo': 'ndonga',
+    'ng': 'ndonga',
+    'nds': 'bas allemand; bas saxon; allemand, bas; saxon, bas',
+    'nep': 'népalais',
+    'ne': 'népalais',
+    'new': 'nepal bhasa; newari',
+    'nia': 'nias',
+    'nic': 'nigéro-kordofaniennes, langues',
+    'niu': 'niué',
+    'nno': 'norvégien nynorsk; nynorsk, norvégien',
+    'nn': 'norvégien nynorsk; nynorsk, norvégien',
+    'nob': 'norvégien bokmål',
+    'nb': 'norvégien bokmål',
+    'nog': 'nogaï; nogay',
+    'non': 'norrois, vieux',
+    'nor': 'norvégien',
+    'no': 'norvégien',
+    'nqo': "n'ko",
+    'nso': 'pedi; sepedi; sotho du Nord',
+    'nub': 'nubiennes, langues',
+    'nwc': 'newari classique',
+    'nya': 'chichewa; chewa; nyanja',
+    'ny': 'chichewa; chewa; nyanja',
+    'nym': 'nyamwezi',
+    'nyn': 'nyankolé',
+    'nyo': 'nyoro',
+    'nzi': 'nzema',
+    'oci': 'occitan (après 1500)',
+    'oc': 'occitan (après 1500)',
+    'oji': 'ojibwa',
+    'oj': 'ojibwa',
+    'ori': 'oriya',
+    'or': 'oriya',
+    'orm': 'galla',
+    'om': 'galla',
+    'osa': 'osage',
+    'oss': 'ossète',
+    'os': 'ossète',
+    'ota': 'turc ottoman (1500-1928)',
+    'oto': 'otomi, langues',
+    'paa': 'papoues, langues',
+    'pag': 'pangasinan',
+    'pal': 'pahlavi',
+    'pam': 'pampangan',
+    'pan': 'pendjabi',
+    'pa': 'pendjabi',
+    'pap': 'papiamento',
+    'pau': 'palau',
+    'peo': 'perse, vieux (ca. 600-400 av. J.-C.)',
+    'per': 'persan',
+    'fas': 'persan',
+    'fa': 'persan',
+    'phi': 'philippines, langues',
+    'phn': 'phénicien',
+    'pli': 'pali',
+    'pi': 'pali',
+    'pol': 'polonais',
+    'pl': 'polonais',
+    'pon': 'pohnpei',
+    'por': 'portugais',
+    'pt': 'portugais',
+    'pra': 'prâkrit, langues',
+    'pro': "provençal ancien (jusqu'à 1500); occitan ancien (jusqu'à 1500)",
+    'pus': 'pachto',
+    'ps': 'pachto',
+    'qaa-qtz': "réservée à l'usage local",
+    'que': 'quechua',
+    'qu': 'quechua',
+    'raj': 'rajasthani',
+    'rap': 'rapanui',
+    'rar': 'rarotonga; maori des îles Cook',
+    'roa': 'romanes, langues',
+    'roh': 'romanche',
+    'rm': 'romanche',
+    'rom': 'tsigane',
+    'rum': 'roumain; moldave',
+    'ron': 'roumain; moldave',
+    'ro': 'roumain; moldave',
+    'run': 'rundi',
+    'rn': 'rundi',
+    'rup': 'aroumain; macédo-roumain',
+    'rus': 'russe',
+    'ru': 'russe',
+    'sad': 'sandawe',
+    'sag': 'sango',
+    'sg': 'sango',
+    'sah': 'iakoute',
+    'sai': 'sud-amérindiennes, langues',
+    'sal': 'salishennes, langues',
+    'sam': 'samaritain',
+    'san': 'sanskrit',
+    'sa': 'sanskrit',
+    'sas': 'sasak',
+    'sat': 'santal',
+    'scn': 'sicilien',
+    'sco': 'écossais',
+    'sel': 'selkoupe',
+    'sem': 'sémitiques, langues',
+    'sga': "irlandais ancien (jusqu'à 900)",
+    'sgn': 'langues des signes',
+    'shn': 'chan',
+    'sid': 'sidamo',
+    'sin': 'singhalais',
+    'si': 'singhalais',
+    'sio': 'sioux, langues',
+    'sit': 'sino-tibétaines, langues',
+    'sla': 'slaves, langues',
+    'slo': 'slovaque',
+    'slk': 'slovaque',
+    'sk': 'slovaque',
+    'slv': 'slovène',
+    'sl': 'slovène',
+    'sma': 'sami du Sud',
+    'sme': 'sami du Nord',
+    'se': 'sami du Nord',
+    'smi': 'sames, langues',
+    'smj': 'sami de Lule',
+    'smn': "sami d'Inari",
+    'smo': 'samoan',
+    'sm': 'samoan',
+    'sms': 'sami skolt',
+    'sna': 'shona',
+    'sn': 'shona',
+    'snd': 'sindhi',
+    'sd': 'sindhi',
+    'snk': 'soninké',
+    'sog': 'sogdien',
+    'som': 'somali',
+    'so': 'somali',
+    'son': 'songhai, langues',
+    'sot': 'sotho du Sud',
+    'st': 'sotho du Sud',
+    'spa': 'espagnol; castillan',
+    'es': 'espagnol; castillan',
+    'srd': 'sarde',
+    'sc': 'sarde',
+    'srn': 'sranan tongo',
+    'srp': 'serbe',
+    'sr': 'serbe',
+    'srr': 'sérère',
+    'ssa': 'nilo-sahariennes, langues',
+    'ssw': 'swati',
+    'ss': 'swati',
+    'suk': 'sukuma',
+    'sun': 'soundanais',
+    'su': 'soundanais',
+    'sus': 'soussou',
+    'sux': 'sumérien',
+    'swa': 'swahili',
+    'sw': 'swahili',
+    'swe': 'suédois',
+    'sv': 'suédois',
+    'syc': 'syriaque classique',
+    'syr': 'syriaque',
+    'tah': 'tahitien',
+    'ty': 'tahitien',
+    'tai': 'tai, langues',
+    'tam': 'tamoul',
+    'ta': 'tamoul',
+    'tat': 'tatar',
+    'tt': 'tatar',
+    'tel': 'télougou',
+    'te': 'télougou',
+    'tem': 'temne',
+    'ter': 'tereno',
+    'tet': 'tetum',
+    'tgk': 'tadjik',
+    'tg': 'tadjik',
+    'tgl': 'tagalog',
+    'tl': 'tagalog',
+    'tha': 'thaï',
+    'th': 'thaï',
+    'tib': 'tibétain',
+    'bod': 'tibétain',
+    'bo': 'tibétain',
+    'tig': 'tigré',
+    'tir': 'tigrigna',
+    'ti': 'tigrigna',
+    'tiv': 'tiv',
+    'tkl': 'tokelau',
+    'tlh': 'klingon',
+    'tli': 'tlingit',
+    'tmh': 'tamacheq',
+    'tog': 'tonga (Nyasa)',
+    'ton': 'tongan (Îles Tonga)',
+    'to': 'tongan (Îles Tonga)',
+    'tpi': 'tok pisin',
+    'tsi': 'tsimshian',
+    'tsn': 'tswana',
+    'tn': 'tswana',
+    'tso': 'tsonga',
+    'ts': 'tsonga',
+    'tuk': 'turkmène',
+    'tk': 'turkmène',
+    'tum': 'tumbuka',
+    'tup': 'tupi, langues',
+    'tur': 'turc',
+    'tr': 'turc',
+    'tut': 'altaïques, langues',
+    'tvl': 'tuvalu',
+    'twi': 'twi',
+    'tw': 'twi',
+    'tyv': 'touva',
+    'udm': 'oudmourte',
+    'uga': 'ougaritique',
+    'uig': 'ouïgour',
+    'ug': 'ouïgour',
+    'ukr': 'ukrainien',
+    'uk': 'ukrainien',
+    'umb': 'umbundu',
+    'und': 'indéterminée',
+    'urd': 'ourdou',
+    'ur': 'ourdou',
+    'uzb': 'ouszbek',
+    'uz': 'ouszbek',
+    'vai': 'vaï',
+    'ven': 'venda',
+    've': 'venda',
+    'vie': 'vietnamien',
+    'vi': 'vietnamien',
+    'vol': 'volapük',
+    'vo': 'volapük',
+    'vot': 'vote',
+    'wak': 'wakashanes, langues',
+    'wal': 'wolaitta; wolaytta',
+    'war': 'waray',
+    'was': 'washo',
+    'wel': 'gallois',
+    'cym': 'gallois',
+    'cy': 'gallois',
+    'wen': 'sorabes, langues',
+    'wln': 'wallon',
+    'wa': 'wallon',
+    'wol': 'wolof',
+    'wo': 'wolof',
+    'xal': 'kalmouk; oïrat',
+    'xho': 'xhosa',
+    'xh': 'xhosa',
+    'yao': 'yao',
+    'yap': 'yapois',
+    'yid': 'yiddish',
+    'yi': 'yiddish',
+    'yor': 'yoruba',
+    'yo': 'yoruba',
+    'ypk': 'yupik, langues',
+    'zap': 'zapotèque',
+    'zbl': 'symboles Bliss; Bliss',
+    'zen': 'zenaga',
+    'zgh': 'amazighe standard marocain',
+    'zha': 'zhuang; chuang',
+    'za': 'zhuang; chuang',
+    'znd': 'zandé, langues',
+    'zul': 'zoulou',
+    'zu': 'zoulou',
+    'zun': 'zuni',
+    'zxx': 'pas de contenu linguistique; non applicable',
+    'zza': 'zaza; dimili; dimli; kirdki; kirmanjki; zazaki',
+}